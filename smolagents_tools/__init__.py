@@ -5,6 +5,12 @@ This package provides a collection of tools adapted from OpenManus for use with
 All tools follow the smolagents Tool interface and can be used in CodeAct loops.
 """
 
+import functools
+import importlib
+import types
+from dataclasses import dataclass, fields
+from typing import Any, Mapping
+
 from .utils.base import AsyncSmolTool, SmolTool, SmolToolResult
 
 # Import all @tool decorated functions from tools module
@@ -17,6 +23,8 @@ from .tools import (
     file_reader_tool,
     file_writer_tool,
     planning_tool,
+    # Streaming variant of bash_tool (plain generator, not a @tool)
+    bash_tool_stream,
 )
 
 # Import optional @tool decorated functions (may not be available due to missing dependencies)
@@ -60,68 +68,66 @@ from .tools import (
     SimpleFileReaderTool,
     SimpleFileWriterTool,
     PlanningTool,
-    
-    # Optional tool classes (may be None if dependencies not available)
-    WebSearchTool,
-    DuckDuckGoSearchTool,
-    GoogleSearchTool,
-    BingSearchTool,
-    BrowserTool,
-    SimpleBrowserTool,
-    WebCrawlerTool,
-    SimpleWebScraperTool,
-    ChatCompletionTool,
-    SimplePromptTool,
-    VNCComputerUseTool,
-    SimpleVNCComputerUseTool,
-    MacOSUseTool,
-    SimpleMacOSTool,
 )
+from . import tools as _tools
+from .tools import _OPTIONAL_MODULES, _optional_available
+
+
+def __getattr__(name: str):
+    # Optional tool classes are imported on first access (None if dependencies are missing)
+    if name in _OPTIONAL_MODULES:
+        return getattr(_tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "0.1.0"
 
-# Tool registry for easy access (only include available tools)
+# Tool registry for easy access, as "module:Class" paths that get_tool imports on
+# first use (only include available tools)
 _ALL_TOOLS = {
     # Core execution tools (always available)
-    "bash_tool": BashTool,
-    "python_executor_tool": PythonExecutorTool,
-    "safe_python_executor_tool": SafePythonExecutorTool,
+    "bash_tool": "smolagents_tools.utils.bash:BashTool",
+    "python_executor_tool": "smolagents_tools.utils.python_executor:PythonExecutorTool",
+    "safe_python_executor_tool": "smolagents_tools.utils.python_executor:SafePythonExecutorTool",
     
     # File operations (always available)
-    "file_editor_tool": FileEditorTool,
-    "file_reader_tool": SimpleFileReaderTool,
-    "file_writer_tool": SimpleFileWriterTool,
+    "file_editor_tool": "smolagents_tools.utils.file_editor:FileEditorTool",
+    "file_reader_tool": "smolagents_tools.utils.file_editor:SimpleFileReaderTool",
+    "file_writer_tool": "smolagents_tools.utils.file_editor:SimpleFileWriterTool",
     
     # Planning (always available)
-    "planning_tool": PlanningTool,
+    "planning_tool": "smolagents_tools.utils.planning:PlanningTool",
     
     # Web tools (optional)
-    "web_search_tool": WebSearchTool,
-    "duckduckgo_search_tool": DuckDuckGoSearchTool,
-    "google_search_tool": GoogleSearchTool,
-    "bing_search_tool": BingSearchTool,
-    "web_crawler_tool": WebCrawlerTool,
-    "simple_web_scraper_tool": SimpleWebScraperTool,
+    "web_search_tool": "smolagents_tools.utils.web_search:WebSearchTool",
+    "duckduckgo_search_tool": "smolagents_tools.utils.web_search:DuckDuckGoSearchTool",
+    "google_search_tool": "smolagents_tools.utils.web_search:GoogleSearchTool",
+    "bing_search_tool": "smolagents_tools.utils.web_search:BingSearchTool",
+    "web_crawler_tool": "smolagents_tools.utils.web_crawler:WebCrawlerTool",
+    "simple_web_scraper_tool": "smolagents_tools.utils.web_crawler:SimpleWebScraperTool",
     
     # Browser automation (optional)
-    "browser_tool": BrowserTool,
-    "simple_browser_tool": SimpleBrowserTool,
+    "browser_tool": "smolagents_tools.utils.browser:BrowserTool",
+    "simple_browser_tool": "smolagents_tools.utils.browser:SimpleBrowserTool",
     
     # macOS automation (optional)
-    "macos_tool": MacOSUseTool,
-    "simple_macos_tool": SimpleMacOSTool,
+    "macos_tool": "smolagents_tools.utils.macos:MacOSUseTool",
+    "simple_macos_tool": "smolagents_tools.utils.macos:SimpleMacOSTool",
     
     # AI and planning (optional)
-    "chat_completion_tool": ChatCompletionTool,
-    "simple_prompt_tool": SimplePromptTool,
+    "chat_completion_tool": "smolagents_tools.utils.chat_completion:ChatCompletionTool",
+    "simple_prompt_tool": "smolagents_tools.utils.chat_completion:SimplePromptTool",
     
     # VNC automation (optional)
-    "vnc_computer_tool": VNCComputerUseTool,
-    "simple_vnc_computer_tool": SimpleVNCComputerUseTool,
+    "vnc_computer_tool": "smolagents_tools.utils.vnc:VNCComputerUseTool",
+    "simple_vnc_computer_tool": "smolagents_tools.utils.vnc:SimpleVNCComputerUseTool",
 }
 
-# Filter out None values (missing optional dependencies)
-AVAILABLE_TOOLS = {name: tool_class for name, tool_class in _ALL_TOOLS.items() if tool_class is not None}
+# Filter out tools whose optional dependencies are missing
+AVAILABLE_TOOLS = {
+    name: path for name, path in _ALL_TOOLS.items()
+    if _optional_available(path.rpartition(":")[2])
+}
 
 # Tool categories for organization (only include available tools)
 _ALL_CATEGORIES = {
@@ -143,9 +149,10 @@ for category, tools in _ALL_CATEGORIES.items():
         TOOL_CATEGORIES[category] = available_tools
 
 
+@functools.lru_cache(maxsize=None)
 def get_tool(tool_name: str):
     """
-    Get a tool class by name.
+    Get a tool class by name, importing its module on first use.
     
     Args:
         tool_name (str): Name of the tool to get
@@ -153,7 +160,14 @@ def get_tool(tool_name: str):
     Returns:
         Tool class or None if not found
     """
-    return AVAILABLE_TOOLS.get(tool_name)
+    path = AVAILABLE_TOOLS.get(tool_name)
+    if path is None:
+        return None
+    module_name, _, class_name = path.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except ImportError:
+        return None
 
 
 def create_tool(tool_name: str):
@@ -172,30 +186,66 @@ def create_tool(tool_name: str):
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def list_tools(category: str = None):
     """
     List available tools, optionally filtered by category.
     
+    The registry is fixed at import, so results are memoized; call
+    ``list_tools.cache_clear()`` after changing it.
+    
     Args:
         category (str): Optional category to filter by
         
     Returns:
-        List of tool names
+        Tuple of tool names
     """
     if category:
-        return TOOL_CATEGORIES.get(category, [])
-    return list(AVAILABLE_TOOLS.keys())
+        return tuple(TOOL_CATEGORIES.get(category, ()))
+    return tuple(AVAILABLE_TOOLS)
+
+
+@dataclass(slots=True, frozen=True)
+class ToolInfo:
+    """Information about a registered tool, as returned by get_tool_info"""
+    name: str
+    description: str
+    inputs: Mapping[str, Any]
+    output_type: str
+    class_name: str
+    module: str
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access, as when get_tool_info returned a dict; "class" is class_name"""
+        name = "class_name" if key == "class" else key
+        if name not in _TOOL_INFO_FIELDS:
+            raise KeyError(key)
+        return getattr(self, name)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get with a default, like the old dict"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 
+_TOOL_INFO_FIELDS = frozenset(field.name for field in fields(ToolInfo))
+
+
+@functools.lru_cache(maxsize=None)
 def get_tool_info(tool_name: str):
     """
     Get information about a tool.
     
+    Built once per name, since it needs a throwaway tool instance; the
+    returned ToolInfo is frozen and shared between callers.
+    
     Args:
         tool_name (str): Name of the tool
         
     Returns:
-        Dict with tool information
+        ToolInfo or None if not found
     """
     tool_class = get_tool(tool_name)
     if not tool_class:
@@ -204,14 +254,17 @@ def get_tool_info(tool_name: str):
     # Create temporary instance to get info
     tool = tool_class()
     
-    return {
-        "name": tool.name,
-        "description": tool.description,
-        "inputs": tool.inputs,
-        "output_type": tool.output_type,
-        "class": tool_class.__name__,
-        "module": tool_class.__module__
-    }
+    return ToolInfo(
+        name=tool.name,
+        description=tool.description,
+        # Read-only copies: the cached ToolInfo is shared, the tool's own dicts are not
+        inputs=types.MappingProxyType({
+            name: types.MappingProxyType(dict(spec)) for name, spec in tool.inputs.items()
+        }),
+        output_type=tool.output_type,
+        class_name=tool_class.__name__,
+        module=tool_class.__module__,
+    )
 
 
 def create_tool_suite(tool_names: list = None):
@@ -336,6 +389,7 @@ _BASE_EXPORTS = [
     "AsyncSmolTool",
     "SmolTool",
     "SmolToolResult",
+    "ToolInfo",
     
     # Utility functions
     "get_tool",
@@ -347,6 +401,7 @@ _BASE_EXPORTS = [
     "create_web_toolset",
     "create_development_toolset",
     "create_ai_toolset",
+    "bash_tool_stream",
     
     # Constants
     "AVAILABLE_TOOLS",
@@ -366,7 +421,9 @@ for func_name in _OPTIONAL_TOOL_FUNCTIONS:
 
 available_tool_classes = []
 for class_name in _TOOL_CLASSES:
-    if globals().get(class_name) is not None:
+    if globals().get(class_name) is not None or (
+        class_name in _OPTIONAL_MODULES and _optional_available(class_name)
+    ):
         available_tool_classes.append(class_name)
 
 __all__ = _BASE_EXPORTS + available_tool_functions + available_optional_tool_functions + available_tool_classes
\ No newline at end of file
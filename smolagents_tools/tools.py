@@ -2,48 +2,143 @@
 Centralized tools module with @tool decorators for smolagents
 """
 
+import asyncio
+import atexit
+import functools
+import importlib
+import importlib.util
+from typing import Iterator
+
 try:
     from smolagents import tool
 except ImportError:
     def tool(func):
         return func
 
+from .utils._runtime import _get_bg_loop, _iter_sync_on_bg_loop, _run_sync
+
 # Import all tool classes from utils
 from .utils.bash import BashTool as _BashTool
 from .utils.python_executor import PythonExecutorTool as _PythonExecutorTool, SafePythonExecutorTool as _SafePythonExecutorTool
 from .utils.file_editor import FileEditorTool as _FileEditorTool, SimpleFileReaderTool as _SimpleFileReaderTool, SimpleFileWriterTool as _SimpleFileWriterTool
 from .utils.planning import PlanningTool as _PlanningTool
 
-# Optional tools (import with error handling)
-try:
-    from .utils.web_search import WebSearchTool as _WebSearchTool, DuckDuckGoSearchTool as _DuckDuckGoSearchTool, GoogleSearchTool as _GoogleSearchTool, BingSearchTool as _BingSearchTool
-except ImportError:
-    _WebSearchTool = _DuckDuckGoSearchTool = _GoogleSearchTool = _BingSearchTool = None
+# Optional tool classes: (module, class name). They are imported on first use, so
+# importing this module does not pull in every optional subsystem.
+OPTIONAL_TOOL_CLASSES = [
+    (".utils.web_search", "WebSearchTool"),
+    (".utils.web_search", "DuckDuckGoSearchTool"),
+    (".utils.web_search", "GoogleSearchTool"),
+    (".utils.web_search", "BingSearchTool"),
+    (".utils.browser", "BrowserTool"),
+    (".utils.browser", "SimpleBrowserTool"),
+    (".utils.web_crawler", "WebCrawlerTool"),
+    (".utils.web_crawler", "SimpleWebScraperTool"),
+    (".utils.chat_completion", "ChatCompletionTool"),
+    (".utils.chat_completion", "SimplePromptTool"),
+    (".utils.vnc", "VNCComputerUseTool"),
+    (".utils.vnc", "SimpleVNCComputerUseTool"),
+    (".utils.macos", "MacOSUseTool"),
+    (".utils.macos", "SimpleMacOSTool"),
+]
 
-try:
-    from .utils.browser import BrowserTool as _BrowserTool, SimpleBrowserTool as _SimpleBrowserTool
-except ImportError:
-    _BrowserTool = _SimpleBrowserTool = None
+_OPTIONAL_MODULES = {class_name: module_name for module_name, class_name in OPTIONAL_TOOL_CLASSES}
 
-try:
-    from .utils.web_crawler import WebCrawlerTool as _WebCrawlerTool, SimpleWebScraperTool as _SimpleWebScraperTool
-except ImportError:
-    _WebCrawlerTool = _SimpleWebScraperTool = None
+# Packages an optional module imports unconditionally; the others guard their
+# own dependencies and always import
+_MODULE_REQUIRES = {
+    ".utils.browser": "playwright",
+    ".utils.web_crawler": "crawl4ai",
+}
 
-try:
-    from .utils.chat_completion import ChatCompletionTool as _ChatCompletionTool, SimplePromptTool as _SimplePromptTool
-except ImportError:
-    _ChatCompletionTool = _SimplePromptTool = None
 
-try:
-    from .utils.vnc import VNCComputerUseTool as _VNCComputerUseTool, SimpleVNCComputerUseTool as _SimpleVNCComputerUseTool
-except ImportError:
-    _VNCComputerUseTool = _SimpleVNCComputerUseTool = None
+def _try_import(module_name: str, class_name: str):
+    """Import an optional tool class, returning None if its dependencies are missing"""
+    try:
+        return getattr(importlib.import_module(module_name, __package__), class_name)
+    except ImportError:
+        return None
 
-try:
-    from .utils.macos import MacOSUseTool as _MacOSUseTool, SimpleMacOSTool as _SimpleMacOSTool
-except ImportError:
-    _MacOSUseTool = _SimpleMacOSTool = None
+
+def _optional_available(class_name: str) -> bool:
+    """Whether a tool class can be imported, checked without importing its module"""
+    module_name = _OPTIONAL_MODULES.get(class_name)
+    if module_name is None:
+        # Core tool classes are always available
+        return True
+    requires = _MODULE_REQUIRES.get(module_name)
+    return requires is None or importlib.util.find_spec(requires) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_optional(class_name: str):
+    """Import an optional tool class on first use; None if it is unavailable"""
+    return _try_import(_OPTIONAL_MODULES[class_name], class_name)
+
+
+def __getattr__(name: str):
+    # Resolves both the public name and the `_<ClassName>` alias of an optional class
+    class_name = name[1:] if name.startswith("_") else name
+    if class_name in _OPTIONAL_MODULES:
+        return _load_optional(class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _format_result(result) -> str:
+    """Render a SmolToolResult as the string returned by the @tool wrappers"""
+    # Return both stdout and stderr when available
+    output_parts = []
+    if result.output:
+        output_parts.append(result.output)
+    if result.error:
+        output_parts.append(f"STDERR: {result.error}")
+    
+    if result.success:
+        return "\n".join(output_parts) if output_parts else "Command completed successfully"
+    else:
+        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+
+
+def _call_tool(tool_class, **kwargs) -> str:
+    """Run a tool class's async execute synchronously and format its result"""
+    tool_instance = tool_class()
+    if hasattr(tool_instance, "execute_sync"):
+        # Blocking-only tools run directly in the calling thread
+        return _format_result(tool_instance.execute_sync(**kwargs))
+    return _format_result(_run_sync(tool_instance.execute(**kwargs)))
+
+
+_bash_instance = None
+
+
+def _get_bash_instance():
+    """Return the BashTool shared by bash_tool calls, creating it on first use"""
+    global _bash_instance
+    if _bash_instance is None:
+        _bash_instance = _BashTool()
+    return _bash_instance
+
+
+_browser_instance = None
+
+
+def _get_browser_instance():
+    """Return the BrowserTool shared by browser_tool calls, creating it on first use"""
+    global _browser_instance
+    if _browser_instance is None:
+        _browser_instance = _load_optional("BrowserTool")()
+    return _browser_instance
+
+
+@atexit.register
+def _close_browser_instance() -> None:
+    """Close the browser_tool browser at interpreter exit, while the background loop still runs"""
+    if _browser_instance is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_browser_instance._close_browser(), _get_bg_loop()).result(timeout=5)
+    except Exception:
+        pass
 
 # Create wrapper functions with @tool decorator for core tools
 
@@ -60,25 +155,25 @@ def bash_tool(command: str, restart: bool = False, timeout: int = 120) -> str:
     Returns:
         Command output or error message
     """
-    tool_instance = _BashTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(command=command, restart=restart, timeout=timeout))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(command=command, restart=restart, timeout=timeout))
+    # One bash process is kept alive on the shared background loop across calls
+    result = _run_sync(_get_bash_instance().execute(command=command, restart=restart, timeout=timeout))
+    return _format_result(result)
+
+def bash_tool_stream(command: str, timeout: int = 120) -> Iterator[str]:
+    """
+    Execute a bash command, yielding output chunks as they are produced.
     
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
+    Shares the bash session used by bash_tool. Useful for long-running or verbose
+    commands where partial output should be surfaced before the command finishes.
     
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    Args:
+        command: The bash command to execute
+        timeout: Timeout in seconds for command execution (default: 120)
+    
+    Returns:
+        Iterator of output chunks; stderr, if any, arrives as a final "STDERR: ..." chunk
+    """
+    return _iter_sync_on_bg_loop(_get_bash_instance().execute_stream(command=command, timeout=timeout))
 
 @tool
 def python_executor_tool(code: str, timeout: int = 30) -> str:
@@ -92,25 +187,7 @@ def python_executor_tool(code: str, timeout: int = 30) -> str:
     Returns:
         Execution output or error message
     """
-    tool_instance = _PythonExecutorTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(code=code, timeout=timeout))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(code=code, timeout=timeout))
-    
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
-    
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    return _call_tool(_PythonExecutorTool, code=code, timeout=timeout)
 
 @tool
 def safe_python_executor_tool(code: str, timeout: int = 30) -> str:
@@ -124,25 +201,7 @@ def safe_python_executor_tool(code: str, timeout: int = 30) -> str:
     Returns:
         Execution output or error message
     """
-    tool_instance = _SafePythonExecutorTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(code=code, timeout=timeout))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(code=code, timeout=timeout))
-    
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
-    
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    return _call_tool(_SafePythonExecutorTool, code=code, timeout=timeout)
 
 @tool
 def file_editor_tool(command: str, path: str, file_text: str = None, old_str: str = None, new_str: str = None, view_range: str = None, timeout: int = 30) -> str:
@@ -161,31 +220,11 @@ def file_editor_tool(command: str, path: str, file_text: str = None, old_str: st
     Returns:
         Operation result or error message
     """
-    tool_instance = _FileEditorTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(
-            command=command, path=path, file_text=file_text,
-            old_str=old_str, new_str=new_str, view_range=view_range, timeout=timeout
-        ))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(
-            command=command, path=path, file_text=file_text,
-            old_str=old_str, new_str=new_str, view_range=view_range, timeout=timeout
-        ))
-    
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
-    
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    return _call_tool(
+        _FileEditorTool,
+        command=command, path=path, file_text=file_text,
+        old_str=old_str, new_str=new_str, view_range=view_range, timeout=timeout
+    )
 
 @tool
 def file_reader_tool(path: str, timeout: int = 30) -> str:
@@ -199,25 +238,7 @@ def file_reader_tool(path: str, timeout: int = 30) -> str:
     Returns:
         File contents or error message
     """
-    tool_instance = _SimpleFileReaderTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(path=path, timeout=timeout))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(path=path, timeout=timeout))
-    
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
-    
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    return _call_tool(_SimpleFileReaderTool, path=path, timeout=timeout)
 
 @tool
 def file_writer_tool(path: str, content: str, timeout: int = 30) -> str:
@@ -232,25 +253,7 @@ def file_writer_tool(path: str, content: str, timeout: int = 30) -> str:
     Returns:
         Success message or error message
     """
-    tool_instance = _SimpleFileWriterTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(path=path, content=content, timeout=timeout))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(path=path, content=content, timeout=timeout))
-    
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
-    
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
-    else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+    return _call_tool(_SimpleFileWriterTool, path=path, content=content, timeout=timeout)
 
 @tool
 def planning_tool(action: str, task_description: str = None, plan_id: str = None, task_id: str = None,
@@ -260,7 +263,7 @@ def planning_tool(action: str, task_description: str = None, plan_id: str = None
     Create and manage task plans and workflows.
     
     Args:
-        action: Action to perform (create_plan, add_task, update_task, complete_task, get_plan, analyze_task)
+        action: Action to perform (create_plan, add_task, update_task, complete_task, get_plan, get_ready_tasks, analyze_task)
         task_description: Description of the main task or goal
         plan_id: ID of the plan to work with
         task_id: ID of specific task within plan
@@ -275,319 +278,194 @@ def planning_tool(action: str, task_description: str = None, plan_id: str = None
     Returns:
         Planning operation result or error message
     """
-    tool_instance = _PlanningTool()
-    import asyncio
-    try:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(tool_instance.execute(
-            action=action, task_description=task_description, plan_id=plan_id, task_id=task_id,
-            subtask_title=subtask_title, subtask_description=subtask_description, priority=priority,
-            estimated_time=estimated_time, dependencies=dependencies, update_content=update_content, timeout=timeout
-        ))
-    except RuntimeError:
-        result = asyncio.run(tool_instance.execute(
-            action=action, task_description=task_description, plan_id=plan_id, task_id=task_id,
-            subtask_title=subtask_title, subtask_description=subtask_description, priority=priority,
-            estimated_time=estimated_time, dependencies=dependencies, update_content=update_content, timeout=timeout
-        ))
+    return _call_tool(
+        _PlanningTool,
+        action=action, task_description=task_description, plan_id=plan_id, task_id=task_id,
+        subtask_title=subtask_title, subtask_description=subtask_description, priority=priority,
+        estimated_time=estimated_time, dependencies=dependencies, update_content=update_content, timeout=timeout
+    )
+
+# Optional tool wrappers. These are plain functions until registered below, which
+# decorates the ones whose tool class is available and drops the rest.
+
+def web_search_tool(query: str, engine: str = "duckduckgo", max_results: int = 10, region: str = "us-en", time_range: str = None, timeout: int = 30) -> str:
+    """
+    Search the web using various search engines.
     
-    # Return both stdout and stderr when available
-    output_parts = []
-    if result.output:
-        output_parts.append(result.output)
-    if result.error:
-        output_parts.append(f"STDERR: {result.error}")
+    Args:
+        query: The search query
+        engine: Search engine to use (duckduckgo, google, bing)
+        max_results: Maximum number of results to return
+        region: Region for search results (e.g., 'us-en', 'uk-en')
+        time_range: Time range for results (d, w, m, y)
+        timeout: Timeout in seconds for search operations (default: 30)
     
-    if result.success:
-        return "\n".join(output_parts) if output_parts else "Command completed successfully"
+    Returns:
+        Search results or error message
+    """
+    return _call_tool(
+        _load_optional("WebSearchTool"),
+        query=query, engine=engine, max_results=max_results,
+        region=region, time_range=time_range, timeout=timeout
+    )
+
+def browser_tool(action: str, url: str = None, selector: str = None, text: str = None,
+                 wait_time: int = 1000, scroll_direction: str = "down", headless: bool = True, timeout: int = 60,
+                 actions: list = None, wait_for_selector: str = None, lightweight: bool = False) -> str:
+    """
+    Automate browser interactions using Playwright.
+    
+    Args:
+        action: Action to perform (navigate, screenshot, click, fill, extract_text, scroll, wait, close, batch)
+        url: URL to navigate to (required for 'navigate' action)
+        selector: CSS selector for element (required for click, fill, extract_text actions)
+        text: Text to fill in form field (required for 'fill' action)
+        wait_time: Time to wait in milliseconds (for 'wait' action)
+        scroll_direction: Direction to scroll (up, down, left, right)
+        headless: Run browser in headless mode
+        timeout: Timeout in seconds for browser operations (default: 60)
+        actions: For action 'batch', a list of action dicts (each with an "action" key and the arguments above) run in order in one call
+        wait_for_selector: CSS selector to wait for after navigating
+        lightweight: Block images, fonts, media and stylesheets; leave False when the page will be screenshotted
+    
+    Returns:
+        Browser operation result or error message
+    """
+    # One browser and its page pool are kept alive on the shared background loop across calls
+    result = _run_sync(_get_browser_instance().execute(
+        action=action, url=url, selector=selector, text=text,
+        wait_time=wait_time, scroll_direction=scroll_direction, headless=headless, timeout=timeout,
+        actions=actions, wait_for_selector=wait_for_selector, lightweight=lightweight
+    ))
+    return _format_result(result)
+
+def web_crawler_tool(url: str, extraction_strategy: str = "basic", css_selector: str = None,
+                word_count_threshold: int = 10, only_text: bool = True,
+                include_links: bool = False, include_images: bool = False, timeout: int = 60) -> str:
+    """
+    Crawl web pages and extract structured content.
+    
+    Args:
+        url: URL to crawl
+        extraction_strategy: Strategy to use (basic, llm, css, xpath)
+        css_selector: CSS selector for targeted extraction (when using css strategy)
+        word_count_threshold: Minimum word count for content blocks
+        only_text: Extract only text content
+        include_links: Include links in extraction
+        include_images: Include images in extraction
+        timeout: Timeout in seconds for crawling operations (default: 60)
+    
+    Returns:
+        Crawled content or error message
+    """
+    return _call_tool(
+        _load_optional("WebCrawlerTool"),
+        url=url, extraction_strategy=extraction_strategy, css_selector=css_selector,
+        word_count_threshold=word_count_threshold, only_text=only_text,
+        include_links=include_links, include_images=include_images, timeout=timeout
+    )
+
+def chat_completion_tool(messages: str, provider: str = "openai", model: str = "gpt-3.5-turbo",
+                   temperature: float = 0.7, max_tokens: int = 1000, system_prompt: str = None,
+                   api_key: str = None, region: str = "us-east-1", timeout: int = 120) -> str:
+    """
+    Generate chat completions using various LLM providers.
+    
+    Args:
+        messages: JSON string of messages array or single message string
+        provider: LLM provider (openai, anthropic, bedrock, local)
+        model: Model name
+        temperature: Response temperature (0.0 to 2.0)
+        max_tokens: Maximum tokens in response
+        system_prompt: System prompt to set context
+        api_key: API key for the provider
+        region: AWS region for Bedrock
+        timeout: Timeout in seconds for completion requests (default: 120)
+    
+    Returns:
+        Generated completion or error message
+    """
+    return _call_tool(
+        _load_optional("ChatCompletionTool"),
+        messages=messages, provider=provider, model=model, temperature=temperature,
+        max_tokens=max_tokens, system_prompt=system_prompt, api_key=api_key, region=region, timeout=timeout
+    )
+
+def vnc_tool(action: str, host: str = None, port: int = 5900, password: str = None,
+             x: int = None, y: int = None, button: int = 1, key: str = None,
+             text: str = None, filename: str = None, timeout: float = 15) -> str:
+    """
+    Automate VNC sessions for remote computer control.
+    
+    Args:
+        action: Action to perform (connect, disconnect, mouse_move, mouse_click, key_press, type_text, capture_screen)
+        host: VNC server host (required for 'connect' action)
+        port: VNC server port (default: 5900)
+        password: VNC server password
+        x: X coordinate for mouse actions
+        y: Y coordinate for mouse actions
+        button: Mouse button (1=left, 2=middle, 3=right)
+        key: Key to press (supports combinations like 'lctrl-c')
+        text: Text to type
+        filename: Filename for screen capture
+        timeout: Timeout for the VNC operation in seconds (default: 15)
+    
+    Returns:
+        VNC operation result or error message
+    """
+    return _call_tool(
+        _load_optional("VNCComputerUseTool"),
+        action=action, host=host, port=port, password=password,
+        x=x, y=y, button=button, key=key, text=text, filename=filename, timeout=timeout
+    )
+
+def macos_tool(action: str, app_name: str = None, element_index: int = None, text: str = None,
+               submit: bool = False, click_action: str = "AXPress", scroll_direction: str = "down",
+               script: str = None, timeout: int = 30, scripts: list = None, max_elements: int = None,
+               node_filter: str = None) -> str:
+    """
+    Automate macOS applications and system interactions.
+    
+    Args:
+        action: Action to perform (open_app, get_ui_tree, click_element, input_text, right_click, scroll, run_applescript, run_applescript_batch, screenshot, close)
+        app_name: Name of the app to open
+        element_index: Index of UI element to interact with
+        text: Text to input
+        submit: Whether to submit after text input
+        click_action: Type of click action (AXPress, AXClick, AXOpen, AXConfirm, AXShowMenu)
+        scroll_direction: Direction to scroll (up, down, left, right)
+        script: AppleScript code to execute
+        timeout: Timeout in seconds for macOS operations (default: 30)
+        scripts: AppleScript snippets to run in order in one call (for run_applescript_batch)
+        max_elements: Maximum number of UI elements to return from get_ui_tree
+        node_filter: Only return UI elements whose line contains this text (case-insensitive)
+    
+    Returns:
+        macOS operation result or error message
+    """
+    return _call_tool(
+        _load_optional("MacOSUseTool"),
+        action=action, app_name=app_name, element_index=element_index, text=text,
+        submit=submit, click_action=click_action, scroll_direction=scroll_direction, script=script, timeout=timeout,
+        scripts=scripts, max_elements=max_elements, node_filter=node_filter
+    )
+
+
+OPTIONAL_TOOLS = [
+    ("WebSearchTool", web_search_tool),
+    ("BrowserTool", browser_tool),
+    ("WebCrawlerTool", web_crawler_tool),
+    ("ChatCompletionTool", chat_completion_tool),
+    ("VNCComputerUseTool", vnc_tool),
+    ("MacOSUseTool", macos_tool),
+]
+
+for _class_name, _wrapper in OPTIONAL_TOOLS:
+    if _optional_available(_class_name):
+        globals()[_wrapper.__name__] = tool(_wrapper)
     else:
-        return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
+        del globals()[_wrapper.__name__]
 
-# Optional tools with @tool decorators (only if available)
-
-if _WebSearchTool:
-    @tool
-    def web_search_tool(query: str, engine: str = "duckduckgo", max_results: int = 10, region: str = "us-en", time_range: str = None, timeout: int = 30) -> str:
-        """
-        Search the web using various search engines.
-        
-        Args:
-            query: The search query
-            engine: Search engine to use (duckduckgo, google, bing)
-            max_results: Maximum number of results to return
-            region: Region for search results (e.g., 'us-en', 'uk-en')
-            time_range: Time range for results (d, w, m, y)
-            timeout: Timeout in seconds for search operations (default: 30)
-        
-        Returns:
-            Search results or error message
-        """
-        tool_instance = _WebSearchTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                query=query, engine=engine, max_results=max_results,
-                region=region, time_range=time_range, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                query=query, engine=engine, max_results=max_results,
-                region=region, time_range=time_range, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
-
-if _BrowserTool:
-    @tool
-    def browser_tool(action: str, url: str = None, selector: str = None, text: str = None,
-                     wait_time: int = 1000, scroll_direction: str = "down", headless: bool = True, timeout: int = 60) -> str:
-        """
-        Automate browser interactions using Playwright.
-        
-        Args:
-            action: Action to perform (navigate, screenshot, click, fill, extract_text, scroll, wait, close)
-            url: URL to navigate to (required for 'navigate' action)
-            selector: CSS selector for element (required for click, fill, extract_text actions)
-            text: Text to fill in form field (required for 'fill' action)
-            wait_time: Time to wait in milliseconds (for 'wait' action)
-            scroll_direction: Direction to scroll (up, down, left, right)
-            headless: Run browser in headless mode
-            timeout: Timeout in seconds for browser operations (default: 60)
-        
-        Returns:
-            Browser operation result or error message
-        """
-        tool_instance = _BrowserTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                action=action, url=url, selector=selector, text=text,
-                wait_time=wait_time, scroll_direction=scroll_direction, headless=headless, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                action=action, url=url, selector=selector, text=text,
-                wait_time=wait_time, scroll_direction=scroll_direction, headless=headless, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
-
-if _WebCrawlerTool:
-    @tool
-    def web_crawler_tool(url: str, extraction_strategy: str = "basic", css_selector: str = None,
-                    word_count_threshold: int = 10, only_text: bool = True,
-                    include_links: bool = False, include_images: bool = False, timeout: int = 60) -> str:
-        """
-        Crawl web pages and extract structured content.
-        
-        Args:
-            url: URL to crawl
-            extraction_strategy: Strategy to use (basic, llm, css, xpath)
-            css_selector: CSS selector for targeted extraction (when using css strategy)
-            word_count_threshold: Minimum word count for content blocks
-            only_text: Extract only text content
-            include_links: Include links in extraction
-            include_images: Include images in extraction
-            timeout: Timeout in seconds for crawling operations (default: 60)
-        
-        Returns:
-            Crawled content or error message
-        """
-        tool_instance = _WebCrawlerTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                url=url, extraction_strategy=extraction_strategy, css_selector=css_selector,
-                word_count_threshold=word_count_threshold, only_text=only_text,
-                include_links=include_links, include_images=include_images, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                url=url, extraction_strategy=extraction_strategy, css_selector=css_selector,
-                word_count_threshold=word_count_threshold, only_text=only_text,
-                include_links=include_links, include_images=include_images, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
-
-if _ChatCompletionTool:
-    @tool
-    def chat_completion_tool(messages: str, provider: str = "openai", model: str = "gpt-3.5-turbo",
-                       temperature: float = 0.7, max_tokens: int = 1000, system_prompt: str = None,
-                       api_key: str = None, region: str = "us-east-1", timeout: int = 120) -> str:
-        """
-        Generate chat completions using various LLM providers.
-        
-        Args:
-            messages: JSON string of messages array or single message string
-            provider: LLM provider (openai, anthropic, bedrock, local)
-            model: Model name
-            temperature: Response temperature (0.0 to 2.0)
-            max_tokens: Maximum tokens in response
-            system_prompt: System prompt to set context
-            api_key: API key for the provider
-            region: AWS region for Bedrock
-            timeout: Timeout in seconds for completion requests (default: 120)
-        
-        Returns:
-            Generated completion or error message
-        """
-        tool_instance = _ChatCompletionTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                messages=messages, provider=provider, model=model, temperature=temperature,
-                max_tokens=max_tokens, system_prompt=system_prompt, api_key=api_key, region=region, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                messages=messages, provider=provider, model=model, temperature=temperature,
-                max_tokens=max_tokens, system_prompt=system_prompt, api_key=api_key, region=region, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
-
-if _VNCComputerUseTool:
-    @tool
-    def vnc_tool(action: str, host: str = None, port: int = 5900, password: str = None,
-                 x: int = None, y: int = None, button: int = 1, key: str = None,
-                 text: str = None, filename: str = None, timeout: float = 15) -> str:
-        """
-        Automate VNC sessions for remote computer control.
-        
-        Args:
-            action: Action to perform (connect, disconnect, mouse_move, mouse_click, key_press, type_text, capture_screen)
-            host: VNC server host (required for 'connect' action)
-            port: VNC server port (default: 5900)
-            password: VNC server password
-            x: X coordinate for mouse actions
-            y: Y coordinate for mouse actions
-            button: Mouse button (1=left, 2=middle, 3=right)
-            key: Key to press (supports combinations like 'lctrl-c')
-            text: Text to type
-            filename: Filename for screen capture
-            timeout: Timeout for the VNC operation in seconds (default: 15)
-        
-        Returns:
-            VNC operation result or error message
-        """
-        tool_instance = _VNCComputerUseTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                action=action, host=host, port=port, password=password,
-                x=x, y=y, button=button, key=key, text=text, filename=filename, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                action=action, host=host, port=port, password=password,
-                x=x, y=y, button=button, key=key, text=text, filename=filename, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
-
-if _MacOSUseTool:
-    @tool
-    def macos_tool(action: str, app_name: str = None, element_index: int = None, text: str = None,
-                   submit: bool = False, click_action: str = "AXPress", scroll_direction: str = "down",
-                   script: str = None, timeout: int = 30) -> str:
-        """
-        Automate macOS applications and system interactions.
-        
-        Args:
-            action: Action to perform (open_app, get_ui_tree, click_element, input_text, right_click, scroll, run_applescript, screenshot, close)
-            app_name: Name of the app to open
-            element_index: Index of UI element to interact with
-            text: Text to input
-            submit: Whether to submit after text input
-            click_action: Type of click action (AXPress, AXClick, AXOpen, AXConfirm, AXShowMenu)
-            scroll_direction: Direction to scroll (up, down, left, right)
-            script: AppleScript code to execute
-            timeout: Timeout in seconds for macOS operations (default: 30)
-        
-        Returns:
-            macOS operation result or error message
-        """
-        tool_instance = _MacOSUseTool()
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(tool_instance.execute(
-                action=action, app_name=app_name, element_index=element_index, text=text,
-                submit=submit, click_action=click_action, scroll_direction=scroll_direction, script=script, timeout=timeout
-            ))
-        except RuntimeError:
-            result = asyncio.run(tool_instance.execute(
-                action=action, app_name=app_name, element_index=element_index, text=text,
-                submit=submit, click_action=click_action, scroll_direction=scroll_direction, script=script, timeout=timeout
-            ))
-        
-        # Return both stdout and stderr when available
-        output_parts = []
-        if result.output:
-            output_parts.append(result.output)
-        if result.error:
-            output_parts.append(f"STDERR: {result.error}")
-        
-        if result.success:
-            return "\n".join(output_parts) if output_parts else "Command completed successfully"
-        else:
-            return f"Error: {result.error}" + (f"\nSTDOUT: {result.output}" if result.output else "")
 
 # Export the original tool classes for backward compatibility (without @tool decorator)
 # These can be used directly as smolagents Tool classes
@@ -599,22 +477,4 @@ SimpleFileReaderTool = _SimpleFileReaderTool
 SimpleFileWriterTool = _SimpleFileWriterTool
 PlanningTool = _PlanningTool
 
-WebSearchTool = _WebSearchTool
-DuckDuckGoSearchTool = _DuckDuckGoSearchTool
-GoogleSearchTool = _GoogleSearchTool
-BingSearchTool = _BingSearchTool
-
-BrowserTool = _BrowserTool
-SimpleBrowserTool = _SimpleBrowserTool
-
-WebCrawlerTool = _WebCrawlerTool
-SimpleWebScraperTool = _SimpleWebScraperTool
-
-ChatCompletionTool = _ChatCompletionTool
-SimplePromptTool = _SimplePromptTool
-
-VNCComputerUseTool = _VNCComputerUseTool
-SimpleVNCComputerUseTool = _SimpleVNCComputerUseTool
-
-MacOSUseTool = _MacOSUseTool
-SimpleMacOSTool = _SimpleMacOSTool
\ No newline at end of file
+# Optional tool classes (WebSearchTool, BrowserTool, ...) are served by __getattr__
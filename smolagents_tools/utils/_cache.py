@@ -0,0 +1,105 @@
+"""
+Small in-process LRU cache with per-entry expiry, shared by the web tools
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_MISSING = object()
+
+
+def _cache_key(**params: Any) -> str:
+    """Digest of the canonical JSON form of the given parameters"""
+    if orjson is not None:
+        encoded = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(params, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class _TTLCache:
+    """LRU mapping whose entries also expire a fixed number of seconds after they were stored"""
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, dropping it if it has expired"""
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value for ttl seconds, evicting the least recently used entry when full"""
+        if not ttl or ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+async def _single_flight(inflight: Dict[Hashable, asyncio.Future], key: Hashable,
+                         fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Await fetch() once for all concurrent callers passing the same key.
+    
+    The first caller runs fetch and publishes its outcome on a future in
+    inflight; callers arriving before it finishes await that future instead.
+    If the first caller is cancelled, its waiters were not: they start over,
+    and one of them runs fetch for the rest. The lookup and insert happen
+    without an await in between, so no lock is needed on a single event loop.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        pending = inflight.get(key)
+        if pending is None or pending.get_loop() is not loop:
+            break
+        try:
+            # Shielded so a cancelled waiter does not cancel the shared result
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                # This waiter was cancelled, not the caller running fetch
+                raise
+    
+    future = loop.create_future()
+    inflight[key] = future
+    try:
+        result = await fetch()
+    except asyncio.CancelledError:
+        # Unpublish first, so the woken waiters find no stale entry and retry
+        if inflight.get(key) is future:
+            del inflight[key]
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark the exception retrieved so a future nobody waited on is not logged
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if inflight.get(key) is future:
+            del inflight[key]
@@ -0,0 +1,65 @@
+"""
+Helpers for driving async tool coroutines from synchronous code
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional
+
+# uvloop is optional: a faster drop-in loop for the I/O-heavy web tools. Only the
+# package's own background loop uses it; the global event loop policy is left alone.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_lock = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting its thread on first use"""
+    global _bg_loop
+    if _bg_loop is None:
+        with _bg_lock:
+            if _bg_loop is None:
+                loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="smolagents-tools-loop", daemon=True)
+                thread.start()
+                _bg_loop = loop
+    return _bg_loop
+
+
+def _run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Coroutines always run on one long-lived background loop rather than a fresh
+    ``asyncio.run`` loop per call. Resources that are bound to a loop (subprocess
+    pipes, the shared Playwright browser) can then be reused across calls, and
+    calling from inside a running loop cannot deadlock it.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is not None and running is _bg_loop:
+        # Re-entrant call from the background loop itself: blocking here would
+        # deadlock, so fall back to a throwaway loop in a worker thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    return asyncio.run_coroutine_threadsafe(coro, _get_bg_loop()).result()
+
+
+def _iter_sync_on_bg_loop(agen: AsyncIterator) -> Iterator:
+    """Drive an async generator on the shared background loop, yielding its items synchronously"""
+    try:
+        while True:
+            try:
+                item = _run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        _run_sync(agen.aclose())
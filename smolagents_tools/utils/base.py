@@ -3,9 +3,9 @@ Base classes for smolagents tools adapted from OpenManus
 """
 
 import asyncio
-import concurrent.futures
 from typing import Any, Dict, Optional, Union
 from smolagents import Tool
+from ._runtime import _run_sync
 
 
 class SmolToolResult:
@@ -113,20 +113,13 @@ class SmolTool(Tool):
     if not any(kwargs.values()):
         return "Tool initialized"
     
-    # Directly call self.execute, handling async execution
-    import asyncio
-    import concurrent.futures
+    # Directly call self.execute, handling async execution; tools whose work is
+    # purely blocking provide execute_sync and skip the event loop altogether
     try:
-        loop = asyncio.get_running_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, self.execute(**kwargs))
-            result = future.result()
-            if isinstance(result, SmolToolResult):
-                return result.output if result.success else f"Error: {{result.error}}"
-            else:
-                return str(result)
-    except RuntimeError:
-        result = asyncio.run(self.execute(**kwargs))
+        if hasattr(self, 'execute_sync'):
+            result = self.execute_sync(**kwargs)
+        else:
+            result = _run_sync(self.execute(**kwargs))
         if isinstance(result, SmolToolResult):
             return result.output if result.success else f"Error: {{result.error}}"
         else:
@@ -136,8 +129,8 @@ class SmolTool(Tool):
 """
         
         # Execute the method code to create the method
-        # Include SmolToolResult in the namespace so it's available in the forward method
-        namespace = {'SmolToolResult': SmolToolResult}
+        # Include SmolToolResult and _run_sync in the namespace so they're available in the forward method
+        namespace = {'SmolToolResult': SmolToolResult, '_run_sync': _run_sync}
         exec(method_code, namespace)
         
         # Bind the method to the instance
@@ -149,24 +142,14 @@ class SmolTool(Tool):
         Internal method to execute with kwargs - synchronous wrapper around async execute
         """
         try:
-            # Check if we're already in an event loop
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an event loop, use thread pool to run async code
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self._run_async_in_thread, **kwargs)
-                    result = future.result()
-                    if isinstance(result, SmolToolResult):
-                        return result.output if result.success else f"Error: {result.error}"
-                    else:
-                        return str(result)
-            except RuntimeError:
-                # No event loop running, create a new one
-                result = asyncio.run(self.execute(**kwargs))
-                if isinstance(result, SmolToolResult):
-                    return result.output if result.success else f"Error: {result.error}"
-                else:
-                    return str(result)
+            if hasattr(self, 'execute_sync'):
+                result = self.execute_sync(**kwargs)
+            else:
+                result = _run_sync(self.execute(**kwargs))
+            if isinstance(result, SmolToolResult):
+                return result.output if result.success else f"Error: {result.error}"
+            else:
+                return str(result)
         except Exception as e:
             return f"Error executing tool: {str(e)}"
     
@@ -208,17 +191,5 @@ def sync_to_async(func):
 def async_to_sync(async_func):
     """Convert async function to sync by running in event loop"""
     def wrapper(*args, **kwargs):
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an event loop, we need to use a different approach
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, async_func(*args, **kwargs))
-                    return future.result()
-            else:
-                return loop.run_until_complete(async_func(*args, **kwargs))
-        except RuntimeError:
-            # No event loop running, create a new one
-            return asyncio.run(async_func(*args, **kwargs))
+        return _run_sync(async_func(*args, **kwargs))
     return wrapper
\ No newline at end of file
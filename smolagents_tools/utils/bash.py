@@ -3,8 +3,10 @@ Bash command execution tool adapted for smolagents
 """
 
 import asyncio
+import codecs
 import os
-from typing import Optional
+import signal
+from typing import AsyncIterator, Optional
 from .base import AsyncSmolTool, SmolToolResult
 
 
@@ -15,10 +17,19 @@ class BashSession:
         self._started = False
         self._process = None
         self._timed_out = False
+        self._timed_out_after: Optional[float] = None
         self.command = "/bin/bash"
         self._output_delay = 0.2  # seconds
         self._timeout = timeout  # seconds
         self._sentinel = "<<exit>>"
+        # Precomputed once: the frame appended to every command and the line searched for
+        self._suffix = f"; echo '{self._sentinel}'; echo '{self._sentinel}' >&2\n".encode()
+        self._sentinel_bytes = f"{self._sentinel}\n".encode()
+        self._read_size = 65536
+        self._stream_chunk_size = 4096
+        self.last_error = ""
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
     
     async def start(self):
         if self._started:
@@ -41,7 +52,11 @@ class BashSession:
             return
         if self._process.returncode is not None:
             return
-        self._process.terminate()
+        # The shell leads its own process group, so a command still running goes too
+        try:
+            os.killpg(self._process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
     
     async def run(self, command: str):
         """Execute a command in the bash shell."""
@@ -55,30 +70,31 @@ class BashSession:
             )
         if self._timed_out:
             raise Exception(
-                f"timed out: bash has not returned in {self._timeout} seconds and must be restarted"
+                f"timed out: bash has not returned in {self._timed_out_after} seconds and must be restarted"
             )
         
-        # Send command to the process
-        self._process.stdin.write(
-            command.encode() + f"; echo '{self._sentinel}'\n".encode()
-        )
+        # Send command to the process; the sentinel is echoed on both streams
+        # so stdout and stderr can each be read up to a known boundary
+        self._process.stdin.write(command.encode())
+        self._process.stdin.write(self._suffix)
         await self._process.stdin.drain()
         
         # Read output from the process, until the sentinel is found
         try:
-            async def read_until_sentinel():
-                while True:
-                    await asyncio.sleep(self._output_delay)
-                    output = self._process.stdout._buffer.decode()
-                    if self._sentinel in output:
-                        return output[:output.index(self._sentinel)]
-            
-            output = await asyncio.wait_for(read_until_sentinel(), timeout=self._timeout)
+            output, error = await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_until_sentinel(self._process.stdout, self._stdout_buf),
+                    self._read_until_sentinel(self._process.stderr, self._stderr_buf),
+                    return_exceptions=True,
+                ),
+                timeout=self._timeout,
+            )
         except asyncio.TimeoutError:
             self._timed_out = True
+            self._timed_out_after = self._timeout
             # Capture any output that was available before timeout
-            output = self._process.stdout._buffer.decode()
-            error = self._process.stderr._buffer.decode()
+            output = self._stdout_buf.decode(errors="replace")
+            error = self._stderr_buf.decode(errors="replace")
             
             # Clean up output
             if output.endswith("\n"):
@@ -87,8 +103,8 @@ class BashSession:
                 error = error[:-1]
             
             # Clear the buffers
-            self._process.stdout._buffer.clear()
-            self._process.stderr._buffer.clear()
+            self._stdout_buf.clear()
+            self._stderr_buf.clear()
             
             # Return partial results with timeout error
             timeout_msg = f"Command timed out after {self._timeout} seconds"
@@ -103,18 +119,119 @@ class BashSession:
                 success=False
             )
         
+        if isinstance(output, EOFError) or isinstance(error, EOFError):
+            # The command ended the shell (e.g. `exit`); report it with whatever it printed
+            returncode = await self._process.wait()
+            output = self._stdout_buf.decode(errors="replace").rstrip("\n")
+            error = self._stderr_buf.decode(errors="replace").rstrip("\n")
+            self._stdout_buf.clear()
+            self._stderr_buf.clear()
+            exit_msg = f"bash has exited with returncode {returncode}"
+            return SmolToolResult(
+                output=output,
+                error=f"{exit_msg}\nOriginal stderr: {error}" if error else exit_msg,
+                system="tool must be restarted",
+                success=False
+            )
+        
         if output.endswith("\n"):
             output = output[:-1]
-        
-        error = self._process.stderr._buffer.decode()
         if error.endswith("\n"):
             error = error[:-1]
         
-        # Clear the buffers
-        self._process.stdout._buffer.clear()
-        self._process.stderr._buffer.clear()
-        
         return SmolToolResult(output=output, error=error if error else None)
+    
+    async def run_stream(self, command: str) -> AsyncIterator[str]:
+        """
+        Execute a command in the bash shell, yielding stdout chunks as they arrive.
+        
+        Stderr is collected until the command finishes and left in ``last_error``.
+        """
+        if not self._started:
+            raise Exception("Session has not started.")
+        if self._process.returncode is not None:
+            raise Exception(f"bash has exited with returncode {self._process.returncode}")
+        if self._timed_out:
+            raise Exception(
+                f"timed out: bash has not returned in {self._timed_out_after} seconds and must be restarted"
+            )
+        
+        self.last_error = ""
+        self._process.stdin.write(command.encode())
+        self._process.stdin.write(self._suffix)
+        await self._process.stdin.drain()
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        sentinel = self._sentinel_bytes
+        buf = self._stdout_buf
+        while True:
+            idx = buf.find(sentinel)
+            if idx >= 0:
+                text = decoder.decode(bytes(buf[:idx]), final=True)
+                del buf[:idx + len(sentinel)]
+                if text:
+                    yield text
+                break
+            # Hold back only a tail that could be the start of a sentinel split across reads
+            hold = next((k for k in range(min(len(buf), len(sentinel) - 1), 0, -1)
+                         if buf.endswith(sentinel[:k])), 0)
+            safe = len(buf) - hold
+            if safe > 0:
+                text = decoder.decode(bytes(buf[:safe]))
+                del buf[:safe]
+                if text:
+                    yield text
+            try:
+                chunk = await asyncio.wait_for(
+                    self._process.stdout.read(self._stream_chunk_size),
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+            except asyncio.TimeoutError:
+                self._timed_out = True
+                self._timed_out_after = self._timeout
+                raise Exception(f"Command timed out after {self._timeout} seconds")
+            if not chunk:
+                text = decoder.decode(bytes(buf), final=True)
+                buf.clear()
+                if text:
+                    yield text
+                raise Exception(f"bash has exited with returncode {await self._process.wait()}")
+            buf += chunk
+        
+        try:
+            error = await asyncio.wait_for(
+                self._read_until_sentinel(self._process.stderr, self._stderr_buf),
+                timeout=max(0.0, deadline - loop.time()),
+            )
+        except asyncio.TimeoutError:
+            self._timed_out = True
+            self._timed_out_after = self._timeout
+            raise Exception(f"Command timed out after {self._timeout} seconds")
+        self.last_error = error[:-1] if error.endswith("\n") else error
+    
+    async def _read_until_sentinel(self, stream: asyncio.StreamReader, buf: bytearray) -> str:
+        """
+        Accumulate raw bytes from stream into buf until the sentinel line arrives.
+        
+        Only newly read bytes are searched and the result is decoded exactly once,
+        so large outputs are not re-decoded on every poll.
+        """
+        sentinel = self._sentinel_bytes
+        start = 0
+        while True:
+            idx = buf.find(sentinel, start)
+            if idx >= 0:
+                data = bytes(buf[:idx])
+                del buf[:idx + len(sentinel)]
+                return data.decode(errors="replace")
+            start = max(0, len(buf) - len(sentinel) + 1)
+            chunk = await stream.read(self._read_size)
+            if not chunk:
+                # The shell exited before echoing the sentinel; what it printed stays in buf
+                raise EOFError("bash exited before the command finished")
+            buf += chunk
 
 
 class BashTool(AsyncSmolTool):
@@ -138,34 +255,87 @@ class BashTool(AsyncSmolTool):
         }
         self.output_type = "string"
         self._session: Optional[BashSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # bash stdin is not safe for interleaved writes, so concurrent callers queue here
+        self._lock = asyncio.Lock()
         super().__init__()
     
+    async def _ready_session(self, timeout: int) -> None:
+        """Make sure a usable session exists, replacing one whose shell exited or timed out"""
+        session = self._session
+        if session is not None and (session._timed_out or session._process.returncode is not None):
+            session.stop()
+            session = self._session = None
+        if session is None:
+            self._session = BashSession(timeout=float(timeout))
+            await self._session.start()
+        else:
+            # Update timeout for existing session
+            session._timeout = float(timeout)
+    
     async def execute(self, command: str = None, restart: bool = False, timeout: int = 120, **kwargs) -> SmolToolResult:
         """Execute a bash command"""
         try:
-            if restart:
+            loop = asyncio.get_running_loop()
+            if self._session_loop is not loop:
+                # Subprocess pipes are bound to the loop that created them
                 if self._session:
                     self._session.stop()
-                self._session = BashSession(timeout=float(timeout))
-                await self._session.start()
-                return SmolToolResult(system="tool has been restarted.", output="Bash session restarted")
+                self._session = None
+                self._session_loop = loop
+                self._lock = asyncio.Lock()
             
-            if self._session is None:
-                self._session = BashSession(timeout=float(timeout))
-                await self._session.start()
-            else:
-                # Update timeout for existing session
-                self._session._timeout = float(timeout)
-            
-            if command is not None:
-                result = await self._session.run(command)
-                return result
-            
-            return SmolToolResult(error="no command provided.", success=False)
+            async with self._lock:
+                if restart:
+                    if self._session:
+                        self._session.stop()
+                    self._session = BashSession(timeout=float(timeout))
+                    await self._session.start()
+                    return SmolToolResult(system="tool has been restarted.", output="Bash session restarted")
+                
+                await self._ready_session(timeout)
+                
+                if command is not None:
+                    result = await self._session.run(command)
+                    return result
+                
+                return SmolToolResult(error="no command provided.", success=False)
             
         except Exception as e:
             return SmolToolResult(error=f"Bash execution failed: {str(e)}", success=False)
     
+    async def execute_stream(self, command: str, timeout: int = 120) -> AsyncIterator[str]:
+        """
+        Execute a bash command, yielding output chunks as soon as they are produced.
+        
+        Stderr, if any, is yielded as a final ``STDERR: ...`` chunk. If the consumer
+        stops early the session is discarded, since unread output would otherwise
+        leak into the next command.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            if self._session:
+                self._session.stop()
+            self._session = None
+            self._session_loop = loop
+            self._lock = asyncio.Lock()
+        
+        async with self._lock:
+            await self._ready_session(timeout)
+            
+            finished = False
+            try:
+                async for chunk in self._session.run_stream(command):
+                    yield chunk
+                finished = True
+            finally:
+                if not finished:
+                    self._session.stop()
+                    self._session = None
+            
+            if self._session.last_error:
+                yield f"STDERR: {self._session.last_error}"
+    
     def __del__(self):
         """Cleanup when tool is destroyed"""
         if self._session:
@@ -1,28 +1,163 @@
 """
 Browser automation tool adapted for smolagents
+
+Set ``PLAYWRIGHT_CDP`` to the endpoint of a long-lived Chromium (e.g. one started
+with ``chromium --remote-debugging-port=9222``, or a browserless instance) to have
+every tool connect to it over CDP instead of launching its own browser process.
 """
 
 import asyncio
+import atexit
 import base64
-from typing import Optional, Dict, Any, List
+import contextlib
+import os
+from typing import Optional, Dict, Any, List, Set
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 from .base import AsyncSmolTool, SmolToolResult
 
+try:
+    import pybase64
+    
+    def _b64encode(data: bytes) -> str:
+        return pybase64.b64encode_as_string(data)
+except ImportError:
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
+# Process-wide Playwright driver and headless Chromium shared by SimpleBrowserTool
+# calls; each call gets its own context. Both are bound to the loop that started them.
+_shared: Dict[str, Any] = {"pw": None, "browser": None, "loop": None, "lock": None}
+
+# Truncates the page text inside the browser so only the first n characters cross the
+# CDP connection; one extra character is fetched to tell whether anything was cut
+_BODY_TEXT_JS = "(n) => (document.body ? document.body.innerText : '').slice(0, n + 1)"
+
+# Adds <link rel="prefetch"> hints for the first k distinct same-origin links so
+# Chromium fetches them into its HTTP cache in the background; returns how many
+_PREFETCH_LINKS_JS = """(k) => {
+    const seen = new Set();
+    for (const a of document.querySelectorAll('a[href]')) {
+        if (seen.size >= k) break;
+        if (a.origin !== location.origin || a.href === location.href || seen.has(a.href)) continue;
+        seen.add(a.href);
+        const link = document.createElement('link');
+        link.rel = 'prefetch';
+        link.href = a.href;
+        document.head.appendChild(link);
+    }
+    return seen.size;
+}"""
+
+# Subresources aborted in lightweight mode; text extraction does not need them
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_heavy_resources(route) -> None:
+    """Route handler that aborts images, fonts, media and stylesheets"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Request headers never recorded for a replay: credentials stay with the browser
+# session that sent them
+_UNREPLAYED_HEADERS = frozenset({"cookie", "authorization", "proxy-authorization"})
+
+
+def _skill_key(url: str) -> str:
+    """Normalize a URL for the skill cache"""
+    return url.split("#", 1)[0]
+
+
+# Hosts already resolved by _preconnect in this process
+_resolved_hosts: Set[str] = set()
+
+
+async def _preconnect(url: str) -> None:
+    """
+    Resolve the URL's host ahead of navigation.
+    
+    Run alongside browser start-up so the lookup overlaps the launch instead of
+    adding to the first navigation; failures are left for the navigation to report.
+    """
+    try:
+        parsed = urlparse(url)
+        host = parsed.hostname
+        if not host or host in _resolved_hosts:
+            return
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        await asyncio.get_running_loop().getaddrinfo(host, port)
+        _resolved_hosts.add(host)
+    except Exception:
+        pass
+
+
+async def _launch_browser(playwright, headless: bool = True) -> Browser:
+    """Connect to the ``PLAYWRIGHT_CDP`` browser if configured, otherwise launch Chromium"""
+    endpoint = os.environ.get("PLAYWRIGHT_CDP")
+    if endpoint:
+        return await playwright.chromium.connect_over_cdp(endpoint)
+    return await playwright.chromium.launch(headless=headless)
+
+
+async def _get_shared_browser() -> Browser:
+    """Return the shared headless browser, launching it on first use"""
+    loop = asyncio.get_running_loop()
+    if _shared["loop"] is not loop:
+        # Objects from another loop cannot be used here; start over for this loop
+        _shared.update(pw=None, browser=None, loop=loop, lock=asyncio.Lock())
+    async with _shared["lock"]:
+        browser = _shared["browser"]
+        if browser is None or not browser.is_connected():
+            if _shared["pw"] is None:
+                _shared["pw"] = await async_playwright().start()
+            _shared["browser"] = await _launch_browser(_shared["pw"])
+        return _shared["browser"]
+
+
+async def _close_shared_browser() -> None:
+    """Close the shared browser and stop its Playwright driver"""
+    browser, pw = _shared["browser"], _shared["pw"]
+    _shared.update(browser=None, pw=None)
+    if browser is not None:
+        await browser.close()
+    if pw is not None:
+        await pw.stop()
+
+
+@atexit.register
+def _shutdown_shared_browser() -> None:
+    """Close the shared browser at interpreter exit if its loop is still running"""
+    loop = _shared["loop"]
+    if _shared["pw"] is None or loop is None or not loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_browser(), loop).result(timeout=5)
+    except Exception:
+        pass
+
 
 class BrowserTool(AsyncSmolTool):
     """
     A tool for browser automation using Playwright
     Adapted from OpenManus BrowserUseTool
+    
+    With ``persistent=True`` the browser runs on a persistent profile directory
+    (``profile_dir``, else ``PW_PROFILE``, else /tmp/pw-profile) so cookies and local
+    storage survive across calls and process restarts. Give each agent its own
+    directory; Chromium locks a profile to one process.
     """
     
-    def __init__(self):
+    def __init__(self, pool_size: int = 1, persistent: bool = False, profile_dir: Optional[str] = None):
         self.name = "browser"
         self.description = """A tool for browser automation. Can navigate to URLs, take screenshots, click elements, fill forms, and extract content."""
         
         self.inputs = {
             "action": {
                 "type": "string",
-                "description": "Action to perform: navigate, screenshot, click, fill, extract_text, scroll, wait, close",
+                "description": "Action to perform: navigate, screenshot, click, fill, extract_text, scroll, wait, close, or batch (runs 'actions')",
                 "required": True
             },
             "url": {
@@ -57,32 +192,140 @@ class BrowserTool(AsyncSmolTool):
                 "description": "Run browser in headless mode",
                 "default": True,
                 "required": False
+            },
+            "full_page": {
+                "type": "boolean",
+                "description": "Capture the whole scrollable page instead of the viewport (for 'screenshot' action)",
+                "default": False,
+                "required": False
+            },
+            "encode_base64": {
+                "type": "boolean",
+                "description": "Also return the screenshot base64-encoded (for 'screenshot' action)",
+                "default": False,
+                "required": False
+            },
+            "wait_until": {
+                "type": "string",
+                "description": "Load state to wait for when navigating: domcontentloaded, load, networkidle",
+                "default": "domcontentloaded",
+                "required": False
+            },
+            "wait_for_selector": {
+                "type": "string",
+                "description": "CSS selector to wait for after navigating (for 'navigate' action)",
+                "required": False
+            },
+            "lightweight": {
+                "type": "boolean",
+                "description": "Block images, fonts, media and stylesheets to load pages faster; leave off when the page will be screenshotted",
+                "default": False,
+                "required": False
+            },
+            "prefetch_links": {
+                "type": "boolean",
+                "description": "After navigating, prefetch the first few same-origin links so following one is faster (needs lightweight=false)",
+                "default": False,
+                "required": False
+            },
+            "actions": {
+                "type": "array",
+                "description": "Actions to run in order in one call, e.g. [{\"action\": \"fill\", \"selector\": \"#q\", \"text\": \"hi\"}, {\"action\": \"click\", \"selector\": \"#go\"}]; stops at the first failure",
+                "required": False
             }
         }
         self.output_type = "string"
         
         self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
-        self._page: Optional[Page] = None
         self._playwright = None
+        # One page per context; concurrent calls each take a page from the pool.
+        # LIFO so that sequential calls keep landing on the page they last used.
+        self._pool_size = max(1, pool_size)
+        self._profile_dir = (
+            (profile_dir or os.environ.get("PW_PROFILE", "/tmp/pw-profile")) if persistent else None
+        )
+        self._contexts: List[BrowserContext] = []
+        self._pool: Optional[asyncio.LifoQueue] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        # Pages that currently block heavy subresources; set per call, since a
+        # page is only used by the call that checked it out
+        self._lightweight_pages: Set[Page] = set()
+        # Page actions by name; "close" is handled before a page is checked out
+        self._actions = {
+            "navigate": self._do_navigate,
+            "screenshot": self._do_screenshot,
+            "click": self._do_click,
+            "fill": self._do_fill,
+            "extract_text": self._do_extract_text,
+            "scroll": self._do_scroll,
+            "wait": self._do_wait,
+        }
+        # Navigations whose document came back as JSON, keyed by URL without fragment.
+        # A repeat visit replays the recorded request over plain HTTP instead of
+        # driving the browser. Kept per tool, so no other tool replays its requests.
+        self._skills: Dict[str, Dict[str, Any]] = {}
+        # Pages whose last navigation was served from _skills; such a page has not
+        # been loaded, so actions that need it load it first
+        self._replayed: Dict[Page, Dict[str, str]] = {}
         super().__init__()
     
     async def _ensure_browser(self, headless: bool = True) -> None:
-        """Ensure browser is running"""
-        if self._browser is None:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(headless=headless)
-            self._context = await self._browser.new_context()
-            self._page = await self._context.new_page()
+        """Ensure browser is running and the page pool is filled"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._pool is None:
+                # A launch that failed leaves the driver running for the next attempt
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                pool = asyncio.LifoQueue()
+                if self._profile_dir:
+                    # A persistent profile is a single context with no Browser object;
+                    # pooled pages share it, and with it the profile's cookies
+                    context = await self._playwright.chromium.launch_persistent_context(
+                        user_data_dir=self._profile_dir, headless=headless
+                    )
+                    self._contexts.append(context)
+                    pages = list(context.pages)
+                    while len(pages) < self._pool_size:
+                        pages.append(await context.new_page())
+                    for page in pages[:self._pool_size]:
+                        pool.put_nowait(page)
+                else:
+                    self._browser = await _launch_browser(self._playwright, headless)
+                    for _ in range(self._pool_size):
+                        context = await self._browser.new_context()
+                        self._contexts.append(context)
+                        pool.put_nowait(await context.new_page())
+                self._pool = pool
+    
+    async def _set_lightweight(self, page: Page, lightweight: bool) -> None:
+        """
+        Block or allow heavy subresources on a checked-out page for this call.
+        
+        The route is per page rather than per context, so concurrent calls (and
+        pages sharing a persistent context) never change each other's setting;
+        removing it also lets the page use the HTTP cache again.
+        """
+        if lightweight == (page in self._lightweight_pages):
+            return
+        if lightweight:
+            await page.route("**/*", _block_heavy_resources)
+            self._lightweight_pages.add(page)
+        else:
+            await page.unroute("**/*", _block_heavy_resources)
+            self._lightweight_pages.discard(page)
     
     async def _close_browser(self) -> None:
         """Close browser and cleanup"""
-        if self._page:
-            await self._page.close()
-            self._page = None
-        if self._context:
-            await self._context.close()
-            self._context = None
+        self._replayed.clear()
+        self._lightweight_pages.clear()
+        # Pages still checked out are returned to the discarded queue
+        self._pool = None
+        # Closing a persistent context also shuts down its browser
+        contexts, self._contexts = self._contexts, []
+        for context in contexts:
+            await context.close()
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -90,13 +333,73 @@ class BrowserTool(AsyncSmolTool):
             await self._playwright.stop()
             self._playwright = None
     
-    async def _navigate(self, url: str) -> SmolToolResult:
-        """Navigate to URL"""
+    async def _replay_skill(self, page: Page, url: str) -> Optional[SmolToolResult]:
+        """Serve a navigation of page from the skill cache, or return None on a miss"""
+        key = _skill_key(url)
+        skill = self._skills.get(key)
+        if skill is None:
+            return None
         try:
-            await self._page.goto(url, wait_until="networkidle")
-            title = await self._page.title()
+            import aiohttp
+            
+            async with aiohttp.ClientSession() as session:
+                async with session.get(skill["url"], headers=skill["headers"]) as response:
+                    if response.status == 200 and "application/json" in response.headers.get("content-type", ""):
+                        text = await response.text()
+                        self._replayed[page] = {"url": url, "text": text}
+                        return SmolToolResult(
+                            output=f"Successfully navigated to {url}. JSON response ({len(text)} characters) fetched without loading the page",
+                            success=True
+                        )
+        except Exception:
+            pass
+        # Stale or unreachable; forget it and let the browser handle the URL
+        self._skills.pop(key, None)
+        return None
+    
+    async def _load_replayed_page(self, page: Page) -> None:
+        """Load the page behind a replayed navigation into the browser"""
+        url = self._replayed.pop(page)["url"]
+        await page.goto(url, wait_until="domcontentloaded")
+    
+    async def _navigate(self, page: Page, url: str, wait_until: str = "domcontentloaded",
+                        wait_for: str = None, prefetch_links: bool = False) -> SmolToolResult:
+        """
+        Navigate to URL.
+        
+        Waits for DOMContentLoaded by default rather than network idle, which third-party
+        trackers can delay by seconds; pass ``wait_for`` to wait for a specific element.
+        With ``prefetch_links`` the first few same-origin links are prefetched so that
+        following one is served from the browser cache.
+        """
+        try:
+            self._replayed.pop(page, None)
+            response = await page.goto(url, wait_until=wait_until)
+            if wait_for:
+                await page.wait_for_selector(wait_for, timeout=5000)
+            if response is not None and response.ok:
+                content_type = await response.header_value("content-type") or ""
+                if "application/json" in content_type:
+                    headers = await response.request.all_headers()
+                    self._skills[_skill_key(url)] = {
+                        "url": response.url,
+                        "headers": {
+                            k: v for k, v in headers.items()
+                            if not k.startswith(":") and k.lower() not in _UNREPLAYED_HEADERS
+                        },
+                    }
+            note = ""
+            if prefetch_links:
+                if page in self._lightweight_pages:
+                    # Request interception bypasses the HTTP cache, so prefetched
+                    # documents would never be served from it
+                    note = " (prefetch_links skipped: not available with lightweight=true)"
+                else:
+                    prefetched = await page.evaluate(_PREFETCH_LINKS_JS, 5)
+                    note = f" (prefetching {prefetched} same-origin links)"
+            title = await page.title()
             return SmolToolResult(
-                output=f"Successfully navigated to {url}. Page title: {title}",
+                output=f"Successfully navigated to {url}. Page title: {title}{note}",
                 success=True
             )
         except Exception as e:
@@ -105,16 +408,21 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _screenshot(self) -> SmolToolResult:
-        """Take screenshot"""
+    async def _screenshot(self, page: Page, full_page: bool = False, encode_base64: bool = False) -> SmolToolResult:
+        """Take a JPEG screenshot; raw bytes are returned, base64 only on request"""
         try:
-            screenshot_bytes = await self._page.screenshot(full_page=True)
-            screenshot_b64 = base64.b64encode(screenshot_bytes).decode()
+            screenshot_bytes = await page.screenshot(full_page=full_page, type="jpeg", quality=70)
+            artifacts = {"screenshot_bytes": screenshot_bytes}
+            output = f"Screenshot taken successfully ({len(screenshot_bytes)} bytes, JPEG)"
+            if encode_base64:
+                screenshot_b64 = _b64encode(screenshot_bytes)
+                artifacts["screenshot"] = screenshot_b64
+                output = f"Screenshot taken successfully. Base64 data: {screenshot_b64[:100]}..."
             
             return SmolToolResult(
-                output=f"Screenshot taken successfully. Base64 data: {screenshot_b64[:100]}...",
+                output=output,
                 success=True,
-                artifacts={"screenshot": screenshot_b64}
+                artifacts=artifacts
             )
         except Exception as e:
             return SmolToolResult(
@@ -122,10 +430,10 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _click(self, selector: str) -> SmolToolResult:
+    async def _click(self, page: Page, selector: str) -> SmolToolResult:
         """Click element"""
         try:
-            await self._page.click(selector)
+            await page.click(selector)
             return SmolToolResult(
                 output=f"Successfully clicked element: {selector}",
                 success=True
@@ -136,10 +444,10 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _fill(self, selector: str, text: str) -> SmolToolResult:
+    async def _fill(self, page: Page, selector: str, text: str) -> SmolToolResult:
         """Fill form field"""
         try:
-            await self._page.fill(selector, text)
+            await page.fill(selector, text)
             return SmolToolResult(
                 output=f"Successfully filled {selector} with text",
                 success=True
@@ -150,17 +458,24 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _extract_text(self, selector: str = None) -> SmolToolResult:
+    async def _extract_text(self, page: Page, selector: str = None) -> SmolToolResult:
         """Extract text from element or page"""
         try:
+            replayed = self._replayed.get(page)
+            if replayed is not None and not selector:
+                text = replayed["text"]
+                return SmolToolResult(
+                    output=f"Page text: {text[:1000]}{'...' if len(text) > 1000 else ''}",
+                    success=True
+                )
             if selector:
-                text = await self._page.text_content(selector)
+                text = await page.text_content(selector)
                 return SmolToolResult(
                     output=f"Text from {selector}: {text}",
                     success=True
                 )
             else:
-                text = await self._page.text_content("body")
+                text = await page.evaluate(_BODY_TEXT_JS, 1000)
                 return SmolToolResult(
                     output=f"Page text: {text[:1000]}{'...' if len(text) > 1000 else ''}",
                     success=True
@@ -171,17 +486,17 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _scroll(self, direction: str = "down") -> SmolToolResult:
+    async def _scroll(self, page: Page, direction: str = "down") -> SmolToolResult:
         """Scroll page"""
         try:
             if direction == "down":
-                await self._page.keyboard.press("PageDown")
+                await page.keyboard.press("PageDown")
             elif direction == "up":
-                await self._page.keyboard.press("PageUp")
+                await page.keyboard.press("PageUp")
             elif direction == "left":
-                await self._page.keyboard.press("ArrowLeft")
+                await page.keyboard.press("ArrowLeft")
             elif direction == "right":
-                await self._page.keyboard.press("ArrowRight")
+                await page.keyboard.press("ArrowRight")
             else:
                 return SmolToolResult(
                     error=f"Invalid scroll direction: {direction}",
@@ -212,15 +527,160 @@ class BrowserTool(AsyncSmolTool):
                 success=False
             )
     
+    @contextlib.asynccontextmanager
+    async def _checkout_page(self):
+        """Take a page from the pool for the duration of an operation"""
+        pool = self._pool
+        page = await pool.get()
+        try:
+            yield page
+        finally:
+            pool.put_nowait(page)
+    
+    async def _dispatch(self, action: str, url: str = None, selector: str = None,
+                        headless: bool = True, lightweight: bool = False,
+                        **kwargs) -> SmolToolResult:
+        """Run a single browser action on a pooled page"""
+        if action == "close":
+            await self._close_browser()
+            return SmolToolResult(
+                output="Browser closed successfully",
+                success=True
+            )
+        
+        # Ensure browser is running for all other actions
+        if action == "navigate" and url and self._pool is None:
+            # Cold start: resolve the target host while the browser launches
+            await asyncio.gather(self._ensure_browser(headless), _preconnect(url))
+        else:
+            await self._ensure_browser(headless)
+        
+        async with self._checkout_page() as page:
+            await self._set_lightweight(page, lightweight)
+            return await self._perform(page, action, url=url, selector=selector, **kwargs)
+    
+    async def _perform(self, page: Page, action: str, selector: str = None,
+                       **kwargs) -> SmolToolResult:
+        """Run one action against the given page"""
+        handler = self._actions.get(action)
+        if handler is None:
+            return SmolToolResult(
+                error=f"Unknown action: {action}",
+                success=False
+            )
+        
+        if page in self._replayed and action not in ("navigate", "wait") and (
+            action != "extract_text" or selector
+        ):
+            await self._load_replayed_page(page)
+        
+        return await handler(page, selector=selector, **kwargs)
+    
+    async def _do_navigate(self, page: Page, url: str = None,
+                           wait_until: str = "domcontentloaded", wait_for_selector: str = None,
+                           prefetch_links: bool = False, **kwargs) -> SmolToolResult:
+        """Handle the navigate action"""
+        if not url:
+            return SmolToolResult(
+                error="URL is required for navigate action",
+                success=False
+            )
+        replayed = await self._replay_skill(page, url)
+        if replayed is not None:
+            return replayed
+        return await self._navigate(
+            page, url, wait_until=wait_until, wait_for=wait_for_selector,
+            prefetch_links=prefetch_links
+        )
+    
+    async def _do_screenshot(self, page: Page, full_page: bool = False,
+                             encode_base64: bool = False, **kwargs) -> SmolToolResult:
+        """Handle the screenshot action"""
+        return await self._screenshot(page, full_page, encode_base64)
+    
+    async def _do_click(self, page: Page, selector: str = None, **kwargs) -> SmolToolResult:
+        """Handle the click action"""
+        if not selector:
+            return SmolToolResult(
+                error="Selector is required for click action",
+                success=False
+            )
+        return await self._click(page, selector)
+    
+    async def _do_fill(self, page: Page, selector: str = None, text: str = None,
+                       **kwargs) -> SmolToolResult:
+        """Handle the fill action"""
+        if not selector or not text:
+            return SmolToolResult(
+                error="Selector and text are required for fill action",
+                success=False
+            )
+        return await self._fill(page, selector, text)
+    
+    async def _do_extract_text(self, page: Page, selector: str = None, **kwargs) -> SmolToolResult:
+        """Handle the extract_text action"""
+        return await self._extract_text(page, selector)
+    
+    async def _do_scroll(self, page: Page, scroll_direction: str = "down", **kwargs) -> SmolToolResult:
+        """Handle the scroll action"""
+        return await self._scroll(page, scroll_direction)
+    
+    async def _do_wait(self, page: Page, wait_time: int = 1000, **kwargs) -> SmolToolResult:
+        """Handle the wait action"""
+        return await self._wait(wait_time)
+    
+    async def _run_batch(self, actions: List[Dict[str, Any]], headless: bool = True,
+                         lightweight: bool = False) -> SmolToolResult:
+        """
+        Run a sequence of actions on one page in one call, stopping at the first failure.
+        
+        Navigations inside the batch wait for their own ``wait_until`` (DOMContentLoaded
+        by default); there is no extra wait after the last step.
+        """
+        lines = []
+        artifacts: Dict[str, Any] = {}
+        await self._ensure_browser(headless)
+        async with self._checkout_page() as page:
+            for i, step in enumerate(actions, 1):
+                step = dict(step)
+                step_action = step.pop("action", None)
+                if step_action == "close":
+                    await self._close_browser()
+                    lines.append(f"[{i}] close: Browser closed successfully")
+                    break
+                await self._ensure_browser(step.pop("headless", headless))
+                await self._set_lightweight(page, step.pop("lightweight", lightweight))
+                result = await self._perform(page, step_action, **step)
+                for key, value in result.artifacts.items():
+                    artifacts[f"{i}_{key}"] = value
+                if not result.success:
+                    lines.append(f"[{i}] {step_action}: Error: {result.error}")
+                    return SmolToolResult(
+                        output="\n".join(lines),
+                        error=f"Step {i} ({step_action}) failed: {result.error}",
+                        success=False,
+                        artifacts=artifacts
+                    )
+                lines.append(f"[{i}] {step_action}: {result.output}")
+        return SmolToolResult(
+            output="\n".join(lines),
+            success=True,
+            artifacts=artifacts
+        )
+    
     async def execute(self, action: str, url: str = None, selector: str = None,
                      text: str = None, wait_time: int = 1000,
                      scroll_direction: str = "down", headless: bool = True,
-                     timeout: int = 60, **kwargs) -> SmolToolResult:
+                     timeout: int = 60, actions: List[Dict[str, Any]] = None,
+                     full_page: bool = False, encode_base64: bool = False,
+                     wait_until: str = "domcontentloaded", wait_for_selector: str = None,
+                     lightweight: bool = False, prefetch_links: bool = False,
+                     **kwargs) -> SmolToolResult:
         """
         Execute browser action.
         
         Args:
-            action (str): Action to perform
+            action (str): Action to perform, or "batch" to run ``actions``
             url (str): URL for navigation
             selector (str): CSS selector for element operations
             text (str): Text for form filling
@@ -228,63 +688,31 @@ class BrowserTool(AsyncSmolTool):
             scroll_direction (str): Scroll direction
             headless (bool): Run in headless mode
             timeout (int): Timeout in seconds for browser operations
+            actions (list): Sequence of action dicts, each with an "action" key plus
+                the same optional keys as above, run in order within one call
+            full_page (bool): Capture the whole scrollable page instead of the viewport
+            encode_base64 (bool): Also return the screenshot base64-encoded
+            wait_until (str): Load state a navigation waits for (domcontentloaded,
+                load, networkidle)
+            wait_for_selector (str): CSS selector to wait for after navigating
+            lightweight (bool): Skip loading images, fonts, media and stylesheets
+                (off by default; leave off for pages you want to screenshot)
+            prefetch_links (bool): After navigating, prefetch the first few same-origin
+                links into the browser cache (only when lightweight is off)
             
         Returns:
             SmolToolResult: Result of the browser operation
         """
         try:
-            if action == "close":
-                await self._close_browser()
-                return SmolToolResult(
-                    output="Browser closed successfully",
-                    success=True
-                )
-            
-            # Ensure browser is running for all other actions
-            await self._ensure_browser(headless)
-            
-            if action == "navigate":
-                if not url:
-                    return SmolToolResult(
-                        error="URL is required for navigate action",
-                        success=False
-                    )
-                return await self._navigate(url)
-            
-            elif action == "screenshot":
-                return await self._screenshot()
-            
-            elif action == "click":
-                if not selector:
-                    return SmolToolResult(
-                        error="Selector is required for click action",
-                        success=False
-                    )
-                return await self._click(selector)
-            
-            elif action == "fill":
-                if not selector or not text:
-                    return SmolToolResult(
-                        error="Selector and text are required for fill action",
-                        success=False
-                    )
-                return await self._fill(selector, text)
-            
-            elif action == "extract_text":
-                return await self._extract_text(selector)
-            
-            elif action == "scroll":
-                return await self._scroll(scroll_direction)
-            
-            elif action == "wait":
-                return await self._wait(wait_time)
-            
-            else:
-                return SmolToolResult(
-                    error=f"Unknown action: {action}",
-                    success=False
-                )
-                
+            if actions:
+                return await self._run_batch(actions, headless, lightweight)
+            return await self._dispatch(
+                action, url=url, selector=selector, text=text, wait_time=wait_time,
+                scroll_direction=scroll_direction, headless=headless,
+                full_page=full_page, encode_base64=encode_base64,
+                wait_until=wait_until, wait_for_selector=wait_for_selector,
+                lightweight=lightweight, prefetch_links=prefetch_links
+            )
         except Exception as e:
             return SmolToolResult(
                 error=f"Browser tool error: {str(e)}",
@@ -319,33 +747,49 @@ class SimpleBrowserTool(AsyncSmolTool):
                 "description": "Action to perform: content, screenshot, title",
                 "default": "content",
                 "required": False
+            },
+            "encode_base64": {
+                "type": "boolean",
+                "description": "Also return the screenshot base64-encoded",
+                "default": False,
+                "required": False
             }
         }
         self.output_type = "string"
         super().__init__()
     
-    async def execute(self, url: str, action: str = "content", **kwargs) -> SmolToolResult:
+    async def execute(self, url: str, action: str = "content", encode_base64: bool = False,
+                      **kwargs) -> SmolToolResult:
         """Execute simple browser operation"""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            if _shared["browser"] is None:
+                # Cold start: resolve the target host while the browser launches
+                browser, _ = await asyncio.gather(_get_shared_browser(), _preconnect(url))
+            else:
+                browser = await _get_shared_browser()
+            context = await browser.new_context()
+            try:
+                if action != "screenshot":
+                    await context.route("**/*", _block_heavy_resources)
+                page = await context.new_page()
                 
                 await page.goto(url, wait_until="networkidle")
                 
                 if action == "content":
-                    content = await page.text_content("body")
+                    content = await page.evaluate(_BODY_TEXT_JS, 2000)
                     result = SmolToolResult(
                         output=content[:2000] + ("..." if len(content) > 2000 else ""),
                         success=True
                     )
                 elif action == "screenshot":
-                    screenshot = await page.screenshot(full_page=True)
-                    screenshot_b64 = base64.b64encode(screenshot).decode()
+                    screenshot = await page.screenshot(type="jpeg", quality=70)
+                    artifacts = {"screenshot_bytes": screenshot}
+                    if encode_base64:
+                        artifacts["screenshot"] = _b64encode(screenshot)
                     result = SmolToolResult(
                         output=f"Screenshot taken of {url}",
                         success=True,
-                        artifacts={"screenshot": screenshot_b64}
+                        artifacts=artifacts
                     )
                 elif action == "title":
                     title = await page.title()
@@ -359,9 +803,10 @@ class SimpleBrowserTool(AsyncSmolTool):
                         success=False
                     )
                 
-                await browser.close()
                 return result
-                
+            finally:
+                # Only the per-call context is closed; the browser stays warm
+                await context.close()
         except Exception as e:
             return SmolToolResult(
                 error=f"Browser error: {str(e)}",
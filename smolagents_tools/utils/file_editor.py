@@ -2,12 +2,93 @@
 File editing tool adapted for smolagents
 """
 
+import asyncio
+import contextlib
+import copy
+import functools
+import mmap
 import os
+import stat
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import Dict, Iterable, List, Optional, Literal, Tuple
 from collections import defaultdict
 from .base import AsyncSmolTool, SmolToolResult
 
+# Shared by all file tools so their blocking I/O never runs on the event loop thread
+_FILE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smolagents-tools-file")
+
+# Upper bound, in characters, on the numbered text a single view returns
+_VIEW_MAX_CHARS = 65536
+# Lines from the end of the file shown after a truncated full view
+_VIEW_TAIL_LINES = 10
+
+# Permissions open() would give a new file; mkstemp creates temp files as 0600
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+
+# Below this size one read() is cheaper than setting up and tearing down a mapping
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def _load_bytes(f, size: int):
+    """Return an open binary file's contents as bytes, or a read-only mmap if large"""
+    if size < _MMAP_MIN_SIZE:
+        return f.read()
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _view_line(line: bytes) -> str:
+    """Decode one line for a view, showing a CRLF ending as a plain newline like a text-mode read"""
+    if line.endswith(b"\r\n"):
+        line = line[:-2] + b"\n"
+    return line.decode('utf-8', 'replace')
+
+
+def _replace_file(path: str, chunks: Iterable[bytes], mode: int) -> None:
+    """
+    Write chunks to a synced temp file and swap it in for path with os.replace.
+    
+    A symlinked path is resolved first, so the file it points to is replaced and
+    the link is kept. mkstemp picks a temp name that no existing file or other
+    writer is using. The new file gets the given permission bits.
+    """
+    real = os.path.realpath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(real), prefix=f".{os.path.basename(real)}.", suffix=".tmp")
+    try:
+        with open(fd, 'wb', buffering=1 << 20) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, real)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+        raise
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """
+    Write data to path via a synced temp file and os.replace.
+    
+    A crash mid-write leaves either the old file or the new one, never a truncated
+    mix. An existing file's permissions are carried over; a new file gets the
+    usual permissions for the process umask.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+    _replace_file(path, (data,), mode)
+
 
 class FileEditorTool(AsyncSmolTool):
     """
@@ -55,20 +136,86 @@ class FileEditorTool(AsyncSmolTool):
         
         # Track file states for undo functionality
         self._file_states = defaultdict(list)
+        # Line-start offsets per path, valid while (st_mtime_ns, st_size) is unchanged;
+        # the tool's own writes drop the entry, since a same-length edit can keep both
+        self._line_index: Dict[str, Tuple[int, int, List[int]]] = {}
+        self._commands = {
+            "view": self._cmd_view,
+            "create": self._cmd_create,
+            "str_replace": self._cmd_str_replace,
+            "undo_edit": self._cmd_undo_edit,
+        }
+        # Commands run in worker threads; edits and undo history must not interleave
+        self._io_lock = threading.Lock()
         super().__init__()
     
-    def _save_file_state(self, path: str) -> None:
-        """Save current file state for undo"""
+    def __deepcopy__(self, memo):
+        """Copy the tool with its undo history; a lock cannot be copied, so the copy gets its own"""
+        cls = type(self)
+        copied = cls.__new__(cls)
+        memo[id(self)] = copied
+        for name, value in self.__dict__.items():
+            setattr(copied, name, threading.Lock() if name == "_io_lock" else copy.deepcopy(value, memo))
+        return copied
+    
+    def _save_file_state(self, path: str, pos: int, old_b: bytes, new_b: bytes) -> None:
+        """
+        Record the reverse patch of an edit for undo.
+        
+        Only the replaced and replacement bytes are kept, so history costs the size
+        of the edits rather than a copy of the file per edit.
+        """
+        self._file_states[path].append((pos, old_b, new_b))
+        # Keep only last 10 states
+        if len(self._file_states[path]) > 10:
+            self._file_states[path].pop(0)
+    
+    @staticmethod
+    def _splice(path: str, pos: int, length: int, data: bytes) -> None:
+        """Replace ``length`` bytes at ``pos`` in the file with ``data``"""
+        if len(data) == length:
+            # Same length: patch the bytes in place
+            fd = os.open(path, os.O_WRONLY)
+            try:
+                os.pwrite(fd, data, pos)
+            finally:
+                os.close(fd)
+            return
+        
+        # Otherwise splice prefix, data and suffix into a temp file and swap it in
+        with open(path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            content = _load_bytes(f, st.st_size)
         try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self._file_states[path].append(content)
-                # Keep only last 10 states
-                if len(self._file_states[path]) > 10:
-                    self._file_states[path].pop(0)
-        except Exception:
-            pass
+            with memoryview(content) as view:
+                _replace_file(path, (view[:pos], data, view[pos + length:]), stat.S_IMODE(st.st_mode))
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    @staticmethod
+    def _line_offsets(mm: Optional[mmap.mmap]) -> List[int]:
+        """Byte offset at which each line of a mapped file starts"""
+        if mm is None:
+            return []
+        offsets = [0]
+        pos = mm.find(b"\n")
+        while pos >= 0:
+            offsets.append(pos + 1)
+            pos = mm.find(b"\n", pos + 1)
+        if offsets[-1] == len(mm):
+            # A trailing newline ends the last line rather than starting a new one
+            offsets.pop()
+        return offsets
+    
+    def _cached_line_offsets(self, path: str, st: os.stat_result, mm: Optional[mmap.mmap]) -> List[int]:
+        """Line-start offsets for path, rescanning only when the file has changed"""
+        cached = self._line_index.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        offsets = self._line_offsets(mm)
+        self._line_index[path] = (st.st_mtime_ns, st.st_size, offsets)
+        return offsets
     
     def _view_file(self, path: str, view_range: Optional[str] = None) -> SmolToolResult:
         """View file contents"""
@@ -79,29 +226,69 @@ class FileEditorTool(AsyncSmolTool):
                     success=False
                 )
             
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            # Map the file instead of reading it into a list of lines; mmap cannot
+            # map an empty file, which simply has no lines to show
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else None
             
-            if view_range:
-                try:
-                    # Parse range like [1, 50]
-                    range_str = view_range.strip('[]')
-                    start, end = map(int, range_str.split(','))
-                    start = max(1, start) - 1  # Convert to 0-based
-                    end = min(len(lines), end)
-                    lines = lines[start:end]
-                    
-                    output = f"Here's the result of running `view` on {path} (lines {start+1}-{end}):\n"
-                except Exception:
-                    output = f"Here's the result of running `view` on {path}:\n"
-            else:
+            try:
                 output = f"Here's the result of running `view` on {path}:\n"
-            
-            # Add line numbers
-            for i, line in enumerate(lines, 1):
-                output += f"{i:6}|{line}"
-            
-            return SmolToolResult(output=output, success=True)
+                lines = iter(mm.readline, b"") if mm is not None else iter(())
+                ranged = False
+                if view_range:
+                    try:
+                        # Parse range like [1, 50]
+                        range_str = view_range.strip('[]')
+                        start, end = map(int, range_str.split(','))
+                        offsets = self._cached_line_offsets(path, st, mm)
+                        start = max(1, start) - 1  # Convert to 0-based
+                        end = min(len(offsets), end)
+                        count = max(0, end - start)
+                        if count:
+                            mm.seek(offsets[start])
+                            lines = (mm.readline() for _ in range(count))
+                        else:
+                            lines = iter(())
+                        
+                        output = f"Here's the result of running `view` on {path} (lines {start+1}-{end}):\n"
+                        ranged = True
+                    except Exception:
+                        pass
+                
+                # Add line numbers, stopping once the output would exceed the cap
+                parts = [output]
+                budget = _VIEW_MAX_CHARS
+                shown = 0
+                truncated = False
+                for i, line in enumerate(lines, 1):
+                    piece = f"{i:6}|{_view_line(line)}"
+                    if len(piece) > budget:
+                        if shown == 0:
+                            # Show at least the start of an oversized first line
+                            parts.append(piece[:budget] + "\n")
+                        truncated = True
+                        break
+                    parts.append(piece)
+                    budget -= len(piece)
+                    shown = i
+                
+                if truncated:
+                    hint = "use a narrower view_range" if ranged else "use view_range to see more"
+                    parts.append(f"... [truncated at {_VIEW_MAX_CHARS} characters; {hint}] ...\n")
+                    if not ranged:
+                        # Append the last few lines so the end of the file is visible too
+                        offsets = self._cached_line_offsets(path, st, mm)
+                        tail_start = max(shown + 1, len(offsets) - _VIEW_TAIL_LINES)
+                        if tail_start < len(offsets):
+                            mm.seek(offsets[tail_start])
+                            for i in range(tail_start + 1, len(offsets) + 1):
+                                parts.append(f"{i:6}|{_view_line(mm.readline())}")
+            finally:
+                if mm is not None:
+                    mm.close()
+            
+            return SmolToolResult(output="".join(parts), success=True)
             
         except Exception as e:
             return SmolToolResult(
@@ -112,9 +299,6 @@ class FileEditorTool(AsyncSmolTool):
     def _create_file(self, path: str, file_text: str) -> SmolToolResult:
         """Create a new file"""
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
             # Check if file already exists
             if os.path.exists(path):
                 return SmolToolResult(
@@ -122,8 +306,9 @@ class FileEditorTool(AsyncSmolTool):
                     success=False
                 )
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(file_text)
+            # Creates the directory if it doesn't exist
+            _atomic_write(path, file_text.encode('utf-8'))
+            self._line_index.pop(path, None)
             
             return SmolToolResult(
                 output=f"File created successfully at {path}",
@@ -145,31 +330,50 @@ class FileEditorTool(AsyncSmolTool):
                     success=False
                 )
             
-            # Save current state for undo
-            self._save_file_state(path)
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if old_str not in content:
-                return SmolToolResult(
-                    error=f"String not found in file: {old_str}",
-                    success=False
-                )
-            
-            # Count occurrences
-            count = content.count(old_str)
-            if count > 1:
-                return SmolToolResult(
-                    error=f"Multiple occurrences found ({count}). Please be more specific.",
-                    success=False
-                )
-            
-            # Replace string
-            new_content = content.replace(old_str, new_str)
+            old_b = old_str.encode('utf-8')
+            new_b = new_str.encode('utf-8')
+            
+            with open(path, 'rb') as f:
+                content = _load_bytes(f, os.fstat(f.fileno()).st_size)
+            
+            try:
+                # Search the encoded bytes directly; the file is never decoded
+                pos = content.find(old_b)
+                if pos < 0 and b"\n" in old_b and content.find(b"\r\n") >= 0:
+                    # Let "\n" match CRLF line endings, as reading in text mode did,
+                    # and write the replacement with the file's CRLF endings
+                    old_b = old_b.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+                    new_b = new_b.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+                    pos = content.find(old_b)
+                if pos < 0:
+                    return SmolToolResult(
+                        error=f"String not found in file: {old_str}",
+                        success=False
+                    )
+                
+                # Count non-overlapping occurrences; the loop only runs past a second match
+                count = 1
+                if old_b:
+                    nxt = content.find(old_b, pos + len(old_b))
+                    while nxt >= 0:
+                        count += 1
+                        nxt = content.find(old_b, nxt + len(old_b))
+                else:
+                    # The empty string matches at every position
+                    count = len(content) + 1
+                if count > 1:
+                    return SmolToolResult(
+                        error=f"Multiple occurrences found ({count}). Please be more specific.",
+                        success=False
+                    )
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            self._splice(path, pos, len(old_b), new_b)
+            self._line_index.pop(path, None)
+            # Save reverse patch for undo
+            self._save_file_state(path, pos, old_b, new_b)
             
             return SmolToolResult(
                 output=f"String replaced successfully in {path}",
@@ -191,11 +395,20 @@ class FileEditorTool(AsyncSmolTool):
                     success=False
                 )
             
-            # Restore previous state
-            previous_content = self._file_states[path].pop()
+            # Apply the reverse patch, provided the edited bytes are still in place
+            pos, old_b, new_b = self._file_states[path][-1]
+            with open(path, 'rb') as f:
+                f.seek(pos)
+                current = f.read(len(new_b))
+            if current != new_b:
+                return SmolToolResult(
+                    error=f"{path} has changed since the last edit; cannot undo",
+                    success=False
+                )
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(previous_content)
+            self._splice(path, pos, len(new_b), old_b)
+            self._line_index.pop(path, None)
+            self._file_states[path].pop()
             
             return SmolToolResult(
                 output=f"Undid last edit to {path}",
@@ -211,8 +424,22 @@ class FileEditorTool(AsyncSmolTool):
     async def execute(self, command: str, path: str, file_text: str = None,
                      old_str: str = None, new_str: str = None,
                      view_range: str = None, timeout: int = 30, **kwargs) -> SmolToolResult:
+        """Execute file editing command on the shared file I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(
+            _FILE_POOL,
+            functools.partial(
+                self.execute_sync, command, path, file_text=file_text, old_str=old_str,
+                new_str=new_str, view_range=view_range, timeout=timeout
+            )
+        )
+    
+    def execute_sync(self, command: str, path: str, file_text: str = None,
+                     old_str: str = None, new_str: str = None,
+                     view_range: str = None, timeout: int = 30, **kwargs) -> SmolToolResult:
         """
-        Execute file editing command.
+        Execute file editing command (blocking).
+        
+        Synchronous callers use this directly and skip the event loop.
         
         Args:
             command (str): Command to execute (view, create, str_replace, undo_edit)
@@ -230,39 +457,53 @@ class FileEditorTool(AsyncSmolTool):
             # Convert to absolute path
             path = os.path.abspath(path)
             
-            if command == "view":
-                return self._view_file(path, view_range)
-            
-            elif command == "create":
-                if file_text is None:
-                    return SmolToolResult(
-                        error="file_text is required for create command",
-                        success=False
-                    )
-                return self._create_file(path, file_text)
-            
-            elif command == "str_replace":
-                if old_str is None or new_str is None:
-                    return SmolToolResult(
-                        error="old_str and new_str are required for str_replace command",
-                        success=False
-                    )
-                return self._str_replace(path, old_str, new_str)
-            
-            elif command == "undo_edit":
-                return self._undo_edit(path)
-            
-            else:
-                return SmolToolResult(
-                    error=f"Unknown command: {command}. Use view, create, str_replace, or undo_edit",
-                    success=False
-                )
+            with self._io_lock:
+                return self._run_command(command, path, file_text, old_str, new_str, view_range)
                 
         except Exception as e:
             return SmolToolResult(
                 error=f"File editor error: {str(e)}",
                 success=False
             )
+    
+    def _run_command(self, command: str, path: str, file_text: Optional[str],
+                     old_str: Optional[str], new_str: Optional[str],
+                     view_range: Optional[str]) -> SmolToolResult:
+        """Validate arguments and run one command"""
+        handler = self._commands.get(command)
+        if handler is None:
+            return SmolToolResult(
+                error=f"Unknown command: {command}. Use view, create, str_replace, or undo_edit",
+                success=False
+            )
+        return handler(path, file_text=file_text, old_str=old_str, new_str=new_str, view_range=view_range)
+    
+    def _cmd_view(self, path: str, view_range: Optional[str] = None, **kwargs) -> SmolToolResult:
+        """Handle the view command"""
+        return self._view_file(path, view_range)
+    
+    def _cmd_create(self, path: str, file_text: Optional[str] = None, **kwargs) -> SmolToolResult:
+        """Handle the create command"""
+        if file_text is None:
+            return SmolToolResult(
+                error="file_text is required for create command",
+                success=False
+            )
+        return self._create_file(path, file_text)
+    
+    def _cmd_str_replace(self, path: str, old_str: Optional[str] = None,
+                         new_str: Optional[str] = None, **kwargs) -> SmolToolResult:
+        """Handle the str_replace command"""
+        if old_str is None or new_str is None:
+            return SmolToolResult(
+                error="old_str and new_str are required for str_replace command",
+                success=False
+            )
+        return self._str_replace(path, old_str, new_str)
+    
+    def _cmd_undo_edit(self, path: str, **kwargs) -> SmolToolResult:
+        """Handle the undo_edit command"""
+        return self._undo_edit(path)
 
 
 class SimpleFileReaderTool(AsyncSmolTool):
@@ -283,7 +524,11 @@ class SimpleFileReaderTool(AsyncSmolTool):
         super().__init__()
     
     async def execute(self, path: str, timeout: int = 30, **kwargs) -> SmolToolResult:
-        """Read file contents"""
+        """Read file contents on the shared file I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(_FILE_POOL, self.execute_sync, path)
+    
+    def execute_sync(self, path: str, timeout: int = 30, **kwargs) -> SmolToolResult:
+        """Read file contents (blocking)"""
         try:
             if not os.path.exists(path):
                 return SmolToolResult(
@@ -329,13 +574,14 @@ class SimpleFileWriterTool(AsyncSmolTool):
         super().__init__()
     
     async def execute(self, path: str, content: str, timeout: int = 30, **kwargs) -> SmolToolResult:
-        """Write content to file"""
+        """Write content to file on the shared file I/O pool"""
+        return await asyncio.get_running_loop().run_in_executor(_FILE_POOL, self.execute_sync, path, content)
+    
+    def execute_sync(self, path: str, content: str, timeout: int = 30, **kwargs) -> SmolToolResult:
+        """Write content to file (blocking)"""
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Creates the directory if it doesn't exist
+            _atomic_write(path, content.encode('utf-8'))
             
             return SmolToolResult(
                 output=f"Successfully wrote to {path}",
@@ -4,9 +4,13 @@ Based on the macOS-use library (mlx-use)
 """
 
 import asyncio
+import atexit
+import itertools
 import logging
-import subprocess
-from typing import Optional, Dict, Any, List
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from .base import AsyncSmolTool, SmolToolResult
 
 # Import macOS-use components
@@ -28,6 +32,231 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# One mlx-use controller and tree builder shared by every MacOSUseTool; building them
+# loads Cocoa, registers actions and opens AX connections
+_shared: Dict[str, Any] = {"controller": None, "builder": None, "caps": None}
+_shared_lock = threading.Lock()
+
+_OSA_SENTINEL = "__END__"
+
+# Filled with the app name quoted by _as_literal, so any name is safe to interpolate
+_OPEN_APP_TMPL = 'tell application {} to activate'
+
+# Evaluated by the coprocess for every script: runs it via ``run script`` so a
+# failure cannot wedge the interactive session, and reports "<status>\n<text>"
+_OSA_WRAPPER = (
+    'on run {s}\n'
+    '  try\n'
+    '    set r to run script s\n'
+    '  on error m number n\n'
+    '    if n is -2763 then return "0" & linefeed\n'
+    '    return (n as text) & linefeed & m\n'
+    '  end try\n'
+    '  try\n'
+    '    return "0" & linefeed & (r as text)\n'
+    '  on error\n'
+    '    return "0" & linefeed\n'
+    '  end try\n'
+    'end run'
+)
+
+
+def _as_literal(text: str) -> str:
+    """Quote text as a single-line AppleScript string literal"""
+    return '"' + (
+        text.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    ) + '"'
+
+
+async def _run_process(*args: str) -> Tuple[int, str, str]:
+    """Run a short-lived command without blocking the event loop"""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+def _check_required(action: str, required: tuple, args: Dict[str, Any]) -> Optional[SmolToolResult]:
+    """Return an error result when any of the action's required arguments is missing"""
+    for name in required:
+        # Only absent arguments are missing: an empty string is a legitimate value,
+        # e.g. input_text with text="" clears a field
+        if args[name] is None:
+            names = " and ".join(required)
+            verb = "is" if len(required) == 1 else "are"
+            return SmolToolResult(
+                error=f"{names} {verb} required for {action} action",
+                success=False
+            )
+    return None
+
+
+async def _run_osa_batch(session: "OsascriptSession", scripts: List[str]) -> SmolToolResult:
+    """Run scripts on an osascript session and report each one's outcome"""
+    try:
+        results = await session.run_batch(scripts)
+    except Exception as e:
+        return SmolToolResult(
+            error=f"AppleScript batch failed: {str(e)}",
+            success=False
+        )
+    report = []
+    failed = 0
+    for i, (returncode, stdout, stderr) in enumerate(results, 1):
+        if returncode == 0:
+            report.append(f"[{i}] {stdout.strip()}")
+        else:
+            failed += 1
+            report.append(f"[{i}] failed: {stderr}")
+    if failed:
+        return SmolToolResult(
+            error=f"{failed} of {len(scripts)} scripts failed:\n" + "\n".join(report),
+            success=False
+        )
+    return SmolToolResult(
+        output="\n".join(report),
+        success=True
+    )
+
+
+def _get_shared_controller() -> Tuple[Any, Any, Dict[str, bool]]:
+    """Return the shared controller, tree builder and probed capabilities, creating them on first use"""
+    with _shared_lock:
+        if _shared["controller"] is None:
+            controller = Controller()
+            registry = controller.registry
+            actions = getattr(getattr(registry, "registry", registry), "actions", {})
+            _shared.update(
+                controller=controller,
+                builder=MacUITreeBuilder(),
+                caps={
+                    name: name in actions
+                    for name in ("open_app", "run_apple_script", "right_click_element", "scroll_element")
+                },
+            )
+        return _shared["controller"], _shared["builder"], _shared["caps"]
+
+
+@atexit.register
+def _cleanup_shared_controller() -> None:
+    """Release the shared tree builder at interpreter exit"""
+    builder = _shared["builder"]
+    if builder is not None and hasattr(builder, "cleanup"):
+        try:
+            builder.cleanup()
+        except Exception:
+            pass
+
+
+def _launch_app_native(app_name: str) -> Tuple[bool, Optional[int]]:
+    """Launch and activate an app in-process through NSWorkspace, returning (launched, pid)"""
+    workspace = Cocoa.NSWorkspace.sharedWorkspace()
+    if not workspace.launchApplication_(app_name):
+        return False, None
+    for app in workspace.runningApplications():
+        if app.localizedName() == app_name:
+            return True, app.processIdentifier()
+    return True, None
+
+
+class OsascriptSession:
+    """A long-lived ``osascript -i`` process that evaluates scripts sent over stdin"""
+    
+    def __init__(self, timeout: float = 30.0):
+        self._process = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = asyncio.Lock()
+        self._timeout = timeout  # seconds
+        self._prefix = f"run script {_as_literal(_OSA_WRAPPER)} with parameters {{".encode()
+        self._suffix = f'}}\n"{_OSA_SENTINEL}"\n'.encode()
+    
+    def _bind_loop(self):
+        """Start over on a new event loop: subprocess pipes are bound to the loop that created them"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self.stop()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+    
+    async def start(self):
+        """Start the osascript process unless it is already running"""
+        self._bind_loop()
+        async with self._lock:
+            await self._spawn()
+    
+    async def _spawn(self):
+        """Spawn the process if needed; callers hold the lock so concurrent calls share one process"""
+        if self._process is not None and self._process.returncode is None:
+            return
+        self._process = await asyncio.create_subprocess_exec(
+            "osascript", "-i",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    
+    def stop(self):
+        """Terminate the osascript process."""
+        if self._process is not None and self._process.returncode is None:
+            self._process.terminate()
+        self._process = None
+    
+    async def run(self, script: str) -> Tuple[int, str, str]:
+        """Evaluate a script, returning (returncode, stdout, stderr) like ``osascript -e``"""
+        return (await self.run_batch([script]))[0]
+    
+    async def run_batch(self, scripts: List[str]) -> List[Tuple[int, str, str]]:
+        """Evaluate several scripts in order with a single write, returning one result per script"""
+        self._bind_loop()
+        async with self._lock:
+            await self._spawn()
+            process = self._process
+            process.stdin.write(b"".join(
+                self._prefix + _as_literal(script).encode() + self._suffix for script in scripts
+            ))
+            await process.stdin.drain()
+            replies = []
+            for _ in scripts:
+                try:
+                    lines = await asyncio.wait_for(self._read_reply(process.stdout), timeout=self._timeout)
+                except asyncio.TimeoutError:
+                    # Whatever the script prints later would desync the next reply
+                    self.stop()
+                    raise Exception(f"osascript did not respond within {self._timeout} seconds")
+                replies.append(lines)
+        
+        results = []
+        for lines in replies:
+            status, _, text = "\n".join(lines).partition("\n")
+            if status == "0":
+                results.append((0, text, ""))
+            else:
+                results.append((1, "", f"{text} ({status})"))
+        return results
+    
+    async def _read_reply(self, stream: asyncio.StreamReader) -> List[str]:
+        """Collect result lines up to the sentinel line"""
+        lines = []
+        while True:
+            raw = await stream.readline()
+            if not raw:
+                self.stop()
+                raise Exception("osascript exited unexpectedly")
+            line = raw.decode(errors="replace").rstrip("\n")
+            # Interactive mode may print a prompt ahead of each result
+            if line.startswith("?> "):
+                line = line[3:]
+            if line == _OSA_SENTINEL:
+                return lines
+            lines.append(line)
+
 
 class MacOSUseTool(AsyncSmolTool):
     """
@@ -35,14 +264,14 @@ class MacOSUseTool(AsyncSmolTool):
     Provides UI element interaction, app launching, and AppleScript execution
     """
     
-    def __init__(self):
+    def __init__(self, ui_tree_ttl: float = 0.5):
         self.name = "macos"
         self.description = """A tool for macOS automation. Can open apps, interact with UI elements, take screenshots, run AppleScript, and automate macOS applications."""
         
         self.inputs = {
             "action": {
                 "type": "string",
-                "description": "Action to perform: open_app, get_ui_tree, click_element, input_text, right_click, scroll, run_applescript, screenshot, close",
+                "description": "Action to perform: open_app, get_ui_tree, click_element, input_text, right_click, scroll, run_applescript, run_applescript_batch, screenshot, close",
                 "required": True
             },
             "app_name": {
@@ -82,6 +311,21 @@ class MacOSUseTool(AsyncSmolTool):
                 "type": "string",
                 "description": "AppleScript code to execute (required for 'run_applescript' action)",
                 "required": False
+            },
+            "scripts": {
+                "type": "array",
+                "description": "AppleScript snippets to execute in order in one call (required for 'run_applescript_batch' action)",
+                "required": False
+            },
+            "max_elements": {
+                "type": "integer",
+                "description": "Maximum number of UI elements to return (for 'get_ui_tree' action)",
+                "required": False
+            },
+            "node_filter": {
+                "type": "string",
+                "description": "Only return UI elements whose line contains this text, case-insensitive (for 'get_ui_tree' action)",
+                "required": False
             }
         }
         self.output_type = "string"
@@ -89,44 +333,81 @@ class MacOSUseTool(AsyncSmolTool):
         self._controller: Optional[Controller] = None
         self._mac_tree_builder: Optional[MacUITreeBuilder] = None
         self._current_app_pid: Optional[int] = None
+        self._osa = OsascriptSession()
+        # pid -> (built at, root); reused by get_ui_tree for ui_tree_ttl seconds and
+        # dropped after any action that changes the UI
+        self._ui_tree_cache: Dict[int, Tuple[float, Any]] = {}
+        self._ui_tree_ttl = ui_tree_ttl
+        
+        # Resolve the mlx-use branch once so action handlers don't re-check it per call
+        if MACOS_USE_AVAILABLE:
+            self._init_controller()
+            if not self._caps["open_app"]:
+                self._open_app = self._open_app_fallback
+            if not self._caps["run_apple_script"]:
+                self._run_applescript = self._run_applescript_subprocess
+        else:
+            self._open_app = self._open_app_fallback
+            self._run_applescript = self._run_applescript_subprocess
+            self._get_ui_tree = self._unavailable("UI tree functionality")
+            self._click_element = self._unavailable("Element clicking")
+            self._input_text = self._unavailable("Text input")
+            self._right_click_element = self._unavailable("Right-click")
+            self._scroll_element = self._unavailable("Scrolling")
+        
+        # action -> (handler, execute() arguments passed positionally, required arguments)
+        self._actions = {
+            "open_app": (self._open_app, ("app_name",), ("app_name",)),
+            "get_ui_tree": (self._get_ui_tree, ("max_elements", "node_filter"), ()),
+            "click_element": (self._click_element, ("element_index", "click_action"), ("element_index",)),
+            "input_text": (self._input_text, ("element_index", "text", "submit"), ("element_index", "text")),
+            "right_click": (self._right_click_element, ("element_index",), ("element_index",)),
+            "scroll": (self._scroll_element, ("element_index", "scroll_direction"), ("element_index",)),
+            "run_applescript": (self._run_applescript, ("script",), ("script",)),
+            "run_applescript_batch": (self._run_applescript_batch, ("scripts",), ("scripts",)),
+            "screenshot": (self._screenshot, (), ()),
+            "close": (self._close, (), ()),
+        }
         super().__init__()
     
-    def _ensure_controller(self) -> None:
-        """Ensure controller is initialized"""
-        if not MACOS_USE_AVAILABLE:
-            return
-        if self._controller is None:
-            self._controller = Controller()
-            self._mac_tree_builder = MacUITreeBuilder()
+    def _init_controller(self) -> None:
+        """Attach the shared mlx-use controller and UI tree builder"""
+        self._controller, self._mac_tree_builder, self._caps = _get_shared_controller()
+    
+    @staticmethod
+    def _unavailable(feature: str):
+        """Build a handler that reports that mlx-use is missing"""
+        async def handler(*args, **kwargs) -> SmolToolResult:
+            return SmolToolResult(
+                error=f"{feature} requires mlx-use library. Please install with: pip install mlx-use",
+                success=False
+            )
+        return handler
     
     async def _open_app(self, app_name: str) -> SmolToolResult:
         """Open a macOS application"""
         try:
-            if MACOS_USE_AVAILABLE:
-                self._ensure_controller()
-                # Try to use mlx-use if available
-                try:
-                    result = await self._controller.registry.execute_action(
-                        "open_app", 
-                        {"app_name": app_name}
-                    )
-                    
-                    if isinstance(result, ActionResult):
-                        if result.error:
-                            # Fall back to AppleScript
-                            return await self._open_app_applescript(app_name)
-                        else:
-                            self._current_app_pid = getattr(result, 'current_app_pid', None)
-                            return SmolToolResult(
-                                output=f"Successfully opened {app_name}. PID: {self._current_app_pid}",
-                                success=True
-                            )
+            # Try to use mlx-use if available
+            try:
+                result = await self._controller.registry.execute_action(
+                    "open_app", 
+                    {"app_name": app_name}
+                )
+                
+                if isinstance(result, ActionResult):
+                    if result.error:
+                        # Fall back to AppleScript
+                        return await self._open_app_fallback(app_name)
                     else:
-                        return await self._open_app_applescript(app_name)
-                except Exception:
-                    return await self._open_app_applescript(app_name)
-            else:
-                return await self._open_app_applescript(app_name)
+                        self._current_app_pid = getattr(result, 'current_app_pid', None)
+                        return SmolToolResult(
+                            output=f"Successfully opened {app_name}. PID: {self._current_app_pid}",
+                            success=True
+                        )
+                else:
+                    return await self._open_app_fallback(app_name)
+            except Exception:
+                return await self._open_app_fallback(app_name)
                 
         except Exception as e:
             return SmolToolResult(
@@ -134,20 +415,33 @@ class MacOSUseTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _open_app_applescript(self, app_name: str) -> SmolToolResult:
-        """Open app using AppleScript fallback"""
+    async def _open_app_fallback(self, app_name: str) -> SmolToolResult:
+        """Open app without mlx-use: natively through NSWorkspace when Cocoa is available, else AppleScript"""
         try:
-            script = f'tell application "{app_name}" to activate'
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            if COCOA_AVAILABLE:
+                launched, pid = _launch_app_native(app_name)
+                if not launched:
+                    return SmolToolResult(
+                        error=f"Failed to open app '{app_name}': NSWorkspace could not launch it",
+                        success=False
+                    )
+                if pid is not None:
+                    self._current_app_pid = pid
+                return SmolToolResult(
+                    output=f"Opened app '{app_name}' successfully. PID: {pid}",
+                    success=True
+                )
+            
+            script = _OPEN_APP_TMPL.format(_as_literal(app_name))
+            returncode, _, stderr = await self._osa.run(script)
+            if returncode == 0:
                 return SmolToolResult(
                     output=f"Opened app '{app_name}' successfully using AppleScript",
                     success=True
                 )
             else:
                 return SmolToolResult(
-                    error=f"Failed to open app '{app_name}': {result.stderr}",
+                    error=f"Failed to open app '{app_name}': {stderr}",
                     success=False
                 )
         except Exception as e:
@@ -156,29 +450,50 @@ class MacOSUseTool(AsyncSmolTool):
                 success=False
             )
     
-    async def _get_ui_tree(self) -> SmolToolResult:
-        """Get the current UI tree of the active application"""
+    async def _cached_tree(self, pid: int):
+        """Build the UI tree for pid, reusing a recent build"""
+        cached = self._ui_tree_cache.get(pid)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._ui_tree_ttl:
+            return cached[1]
+        root = await self._mac_tree_builder.build_tree(pid)
+        if root:
+            self._ui_tree_cache[pid] = (now, root)
+        return root
+    
+    async def _get_ui_tree(self, max_elements: Optional[int] = None,
+                           node_filter: Optional[str] = None) -> SmolToolResult:
+        """Get the current UI tree of the active application, optionally filtered and capped"""
         try:
-            if not MACOS_USE_AVAILABLE:
-                return SmolToolResult(
-                    error="UI tree functionality requires mlx-use library. Please install with: pip install mlx-use",
-                    success=False
-                )
-            
-            self._ensure_controller()
-            
             if not self._current_app_pid:
                 return SmolToolResult(
                     error="No app is currently open. Use 'open_app' action first.",
                     success=False
                 )
             
-            # Build UI tree
-            root = await self._mac_tree_builder.build_tree(self._current_app_pid)
+            root = await self._cached_tree(self._current_app_pid)
             if root:
                 ui_tree_string = root.get_clickable_elements_string()
+                if max_elements is None and not node_filter:
+                    return SmolToolResult(
+                        output=f"UI Tree for PID {self._current_app_pid}:\n{ui_tree_string}",
+                        success=True
+                    )
+                
+                lines = iter(ui_tree_string.splitlines())
+                if node_filter:
+                    needle = node_filter.lower()
+                    lines = (line for line in lines if needle in line.lower())
+                if max_elements is not None:
+                    selected = list(itertools.islice(lines, max_elements))
+                    truncated = next(lines, None) is not None
+                else:
+                    selected = list(lines)
+                    truncated = False
+                header = f"UI Tree for PID {self._current_app_pid} ({len(selected)} elements"
+                header += ", truncated)" if truncated else ")"
                 return SmolToolResult(
-                    output=f"UI Tree for PID {self._current_app_pid}:\n{ui_tree_string}",
+                    output="\n".join([header + ":"] + selected),
                     success=True
                 )
             else:
@@ -196,14 +511,6 @@ class MacOSUseTool(AsyncSmolTool):
     async def _click_element(self, element_index: int, click_action: str = "AXPress") -> SmolToolResult:
         """Click a UI element by index"""
         try:
-            if not MACOS_USE_AVAILABLE:
-                return SmolToolResult(
-                    error="Element clicking requires mlx-use library. Please install with: pip install mlx-use",
-                    success=False
-                )
-            
-            self._ensure_controller()
-            
             result = await self._controller.registry.execute_action(
                 "click_element",
                 {"index": element_index, "action": click_action},
@@ -217,6 +524,7 @@ class MacOSUseTool(AsyncSmolTool):
                         success=False
                     )
                 else:
+                    self._ui_tree_cache.pop(self._current_app_pid, None)
                     return SmolToolResult(
                         output=f"Successfully clicked element {element_index}",
                         success=True
@@ -236,14 +544,6 @@ class MacOSUseTool(AsyncSmolTool):
     async def _input_text(self, element_index: int, text: str, submit: bool = False) -> SmolToolResult:
         """Input text into a UI element"""
         try:
-            if not MACOS_USE_AVAILABLE:
-                return SmolToolResult(
-                    error="Text input requires mlx-use library. Please install with: pip install mlx-use",
-                    success=False
-                )
-            
-            self._ensure_controller()
-            
             result = await self._controller.registry.execute_action(
                 "input_text",
                 {"index": element_index, "text": text, "submit": submit},
@@ -257,6 +557,7 @@ class MacOSUseTool(AsyncSmolTool):
                         success=False
                     )
                 else:
+                    self._ui_tree_cache.pop(self._current_app_pid, None)
                     return SmolToolResult(
                         output=f"Successfully input text into element {element_index}",
                         success=True
@@ -276,23 +577,14 @@ class MacOSUseTool(AsyncSmolTool):
     async def _right_click_element(self, element_index: int) -> SmolToolResult:
         """Right-click a UI element"""
         try:
-            if not MACOS_USE_AVAILABLE:
-                return SmolToolResult(
-                    error="Right-click requires mlx-use library. Please install with: pip install mlx-use",
-                    success=False
-                )
-            
-            self._ensure_controller()
-            
-            # Use the controller's right_click_element action if available
-            try:
+            if self._caps["right_click_element"]:
                 result = await self._controller.registry.execute_action(
                     "right_click_element",
                     {"index": element_index},
                     mac_tree_builder=self._mac_tree_builder
                 )
-            except Exception:
-                # Fallback: try to use click with AXShowMenu action
+            else:
+                # Fallback: use click with AXShowMenu action
                 result = await self._controller.registry.execute_action(
                     "click_element",
                     {"index": element_index, "action": "AXShowMenu"},
@@ -306,6 +598,7 @@ class MacOSUseTool(AsyncSmolTool):
                         success=False
                     )
                 else:
+                    self._ui_tree_cache.pop(self._current_app_pid, None)
                     return SmolToolResult(
                         output=f"Successfully right-clicked element {element_index}",
                         success=True
@@ -325,27 +618,17 @@ class MacOSUseTool(AsyncSmolTool):
     async def _scroll_element(self, element_index: int, direction: str = "down") -> SmolToolResult:
         """Scroll a UI element"""
         try:
-            if not MACOS_USE_AVAILABLE:
+            if not self._caps["scroll_element"]:
                 return SmolToolResult(
-                    error="Scrolling requires mlx-use library. Please install with: pip install mlx-use",
+                    error="Scroll functionality not available in current mlx-use version",
                     success=False
                 )
             
-            self._ensure_controller()
-            
-            # Use the controller's scroll_element action if available
-            try:
-                result = await self._controller.registry.execute_action(
-                    "scroll_element",
-                    {"index": element_index, "direction": direction},
-                    mac_tree_builder=self._mac_tree_builder
-                )
-            except Exception:
-                # Fallback: return error message
-                return SmolToolResult(
-                    error=f"Scroll functionality not available in current mlx-use version",
-                    success=False
-                )
+            result = await self._controller.registry.execute_action(
+                "scroll_element",
+                {"index": element_index, "direction": direction},
+                mac_tree_builder=self._mac_tree_builder
+            )
             
             if isinstance(result, ActionResult):
                 if result.error:
@@ -354,6 +637,7 @@ class MacOSUseTool(AsyncSmolTool):
                         success=False
                     )
                 else:
+                    self._ui_tree_cache.pop(self._current_app_pid, None)
                     return SmolToolResult(
                         output=f"Successfully scrolled element {element_index} {direction}",
                         success=True
@@ -373,28 +657,24 @@ class MacOSUseTool(AsyncSmolTool):
     async def _run_applescript(self, script: str) -> SmolToolResult:
         """Execute AppleScript code"""
         try:
-            if MACOS_USE_AVAILABLE:
-                self._ensure_controller()
-                try:
-                    result = await self._controller.registry.execute_action(
-                        "run_apple_script",
-                        {"script": script}
-                    )
-                    
-                    if isinstance(result, ActionResult):
-                        if result.error:
-                            # Fall back to subprocess
-                            return await self._run_applescript_subprocess(script)
-                        else:
-                            return SmolToolResult(
-                                output=f"AppleScript executed successfully: {result.extracted_content}",
-                                success=True
-                            )
-                    else:
+            try:
+                result = await self._controller.registry.execute_action(
+                    "run_apple_script",
+                    {"script": script}
+                )
+                
+                if isinstance(result, ActionResult):
+                    if result.error:
+                        # Fall back to subprocess
                         return await self._run_applescript_subprocess(script)
-                except Exception:
+                    else:
+                        return SmolToolResult(
+                            output=f"AppleScript executed successfully: {result.extracted_content}",
+                            success=True
+                        )
+                else:
                     return await self._run_applescript_subprocess(script)
-            else:
+            except Exception:
                 return await self._run_applescript_subprocess(script)
                 
         except Exception as e:
@@ -406,16 +686,15 @@ class MacOSUseTool(AsyncSmolTool):
     async def _run_applescript_subprocess(self, script: str) -> SmolToolResult:
         """Execute AppleScript using subprocess fallback"""
         try:
-            result = subprocess.run(['osascript', '-e', script], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            returncode, stdout, stderr = await self._osa.run(script)
+            if returncode == 0:
                 return SmolToolResult(
-                    output=f"AppleScript executed successfully: {result.stdout.strip()}",
+                    output=f"AppleScript executed successfully: {stdout.strip()}",
                     success=True
                 )
             else:
                 return SmolToolResult(
-                    error=f"AppleScript failed: {result.stderr}",
+                    error=f"AppleScript failed: {stderr}",
                     success=False
                 )
         except Exception as e:
@@ -424,24 +703,32 @@ class MacOSUseTool(AsyncSmolTool):
                 success=False
             )
     
+    async def _run_applescript_batch(self, scripts: List[str]) -> SmolToolResult:
+        """Execute several AppleScript snippets in order through one round trip"""
+        return await _run_osa_batch(self._osa, scripts)
+    
     async def _screenshot(self) -> SmolToolResult:
         """Take a screenshot of the current screen"""
         try:
-            # Use AppleScript to take a screenshot
-            script = '''
-            set screenshotPath to (path to desktop as string) & "screenshot_" & (current date) & ".png"
-            do shell script "screencapture -x " & quoted form of POSIX path of screenshotPath
-            return POSIX path of screenshotPath
-            '''
-            
-            result = await self._run_applescript(script)
-            if result.success:
+            # screencapture runs as its own process so it overlaps with
+            # scripts queued on the osascript session
+            # Millisecond resolution so back-to-back screenshots don't overwrite each other
+            now = time.time()
+            path = os.path.join(
+                os.path.expanduser("~/Desktop"),
+                time.strftime("screenshot_%Y-%m-%d_%H.%M.%S", time.localtime(now)) + f".{int(now * 1000) % 1000:03d}.png",
+            )
+            returncode, _, stderr = await _run_process("screencapture", "-x", path)
+            if returncode == 0:
                 return SmolToolResult(
-                    output=f"Screenshot saved: {result.output}",
+                    output=f"Screenshot saved: {path}",
                     success=True
                 )
             else:
-                return result
+                return SmolToolResult(
+                    error=f"Failed to take screenshot: {stderr.strip()}",
+                    success=False
+                )
                 
         except Exception as e:
             return SmolToolResult(
@@ -452,13 +739,11 @@ class MacOSUseTool(AsyncSmolTool):
     async def _close(self) -> SmolToolResult:
         """Close the current session and cleanup"""
         try:
-            if self._mac_tree_builder:
-                if hasattr(self._mac_tree_builder, 'cleanup'):
-                    self._mac_tree_builder.cleanup()
-                self._mac_tree_builder = None
-            
-            self._controller = None
+            # The controller and tree builder are shared with other instances,
+            # so only this instance's session state is reset
             self._current_app_pid = None
+            self._ui_tree_cache.clear()
+            self._osa.stop()
             
             return SmolToolResult(
                 output="macOS session closed successfully",
@@ -473,7 +758,9 @@ class MacOSUseTool(AsyncSmolTool):
     
     async def execute(self, action: str, app_name: str = None, element_index: int = None,
                      text: str = None, submit: bool = False, click_action: str = "AXPress",
-                     scroll_direction: str = "down", script: str = None, timeout: int = 30, **kwargs) -> SmolToolResult:
+                     scroll_direction: str = "down", script: str = None, timeout: int = 30,
+                     scripts: Optional[List[str]] = None, max_elements: Optional[int] = None,
+                     node_filter: Optional[str] = None, **kwargs) -> SmolToolResult:
         """
         Execute macOS automation action.
         
@@ -486,74 +773,38 @@ class MacOSUseTool(AsyncSmolTool):
             click_action (str): Type of click action
             scroll_direction (str): Scroll direction
             script (str): AppleScript code
+            scripts (list): AppleScript snippets for run_applescript_batch
             timeout (int): Timeout in seconds for macOS operations
+            max_elements (int): Maximum number of UI elements for get_ui_tree
+            node_filter (str): Case-insensitive text filter for get_ui_tree elements
             
         Returns:
             SmolToolResult: Result of the macOS operation
         """
         try:
-            if action == "open_app":
-                if not app_name:
-                    return SmolToolResult(
-                        error="app_name is required for open_app action",
-                        success=False
-                    )
-                return await self._open_app(app_name)
-            
-            elif action == "get_ui_tree":
-                return await self._get_ui_tree()
-            
-            elif action == "click_element":
-                if element_index is None:
-                    return SmolToolResult(
-                        error="element_index is required for click_element action",
-                        success=False
-                    )
-                return await self._click_element(element_index, click_action)
-            
-            elif action == "input_text":
-                if element_index is None or not text:
-                    return SmolToolResult(
-                        error="element_index and text are required for input_text action",
-                        success=False
-                    )
-                return await self._input_text(element_index, text, submit)
-            
-            elif action == "right_click":
-                if element_index is None:
-                    return SmolToolResult(
-                        error="element_index is required for right_click action",
-                        success=False
-                    )
-                return await self._right_click_element(element_index)
-            
-            elif action == "scroll":
-                if element_index is None:
-                    return SmolToolResult(
-                        error="element_index is required for scroll action",
-                        success=False
-                    )
-                return await self._scroll_element(element_index, scroll_direction)
-            
-            elif action == "run_applescript":
-                if not script:
-                    return SmolToolResult(
-                        error="script is required for run_applescript action",
-                        success=False
-                    )
-                return await self._run_applescript(script)
-            
-            elif action == "screenshot":
-                return await self._screenshot()
-            
-            elif action == "close":
-                return await self._close()
-            
-            else:
+            entry = self._actions.get(action)
+            if entry is None:
                 return SmolToolResult(
                     error=f"Unknown action: {action}",
                     success=False
                 )
+            handler, params, required = entry
+            args = {
+                "app_name": app_name,
+                "element_index": element_index,
+                "text": text,
+                "submit": submit,
+                "click_action": click_action,
+                "scroll_direction": scroll_direction,
+                "script": script,
+                "scripts": scripts,
+                "max_elements": max_elements,
+                "node_filter": node_filter,
+            }
+            missing = _check_required(action, required, args)
+            if missing is not None:
+                return missing
+            return await handler(*[args[name] for name in params])
                 
         except Exception as e:
             return SmolToolResult(
@@ -563,13 +814,15 @@ class MacOSUseTool(AsyncSmolTool):
     
     async def __aenter__(self):
         """Async context manager entry"""
-        if MACOS_USE_AVAILABLE:
-            self._ensure_controller()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self._close()
+    
+    def __del__(self):
+        """Cleanup when tool is destroyed"""
+        self._osa.stop()
 
 
 class SimpleMacOSTool(AsyncSmolTool):
@@ -582,7 +835,7 @@ class SimpleMacOSTool(AsyncSmolTool):
         self.inputs = {
             "action": {
                 "type": "string",
-                "description": "Action to perform: open_app, run_applescript",
+                "description": "Action to perform: open_app, run_applescript, run_applescript_batch",
                 "required": True
             },
             "app_name": {
@@ -594,77 +847,104 @@ class SimpleMacOSTool(AsyncSmolTool):
                 "type": "string",
                 "description": "AppleScript code to execute (required for 'run_applescript' action)",
                 "required": False
+            },
+            "scripts": {
+                "type": "array",
+                "description": "AppleScript snippets to execute in order in one call (required for 'run_applescript_batch' action)",
+                "required": False
             }
         }
         self.output_type = "string"
+        self._osa = OsascriptSession()
+        # action -> (handler, required argument)
+        self._actions = {
+            "open_app": (self._open_app, "app_name"),
+            "run_applescript": (self._run_applescript, "script"),
+            "run_applescript_batch": (self._run_applescript_batch, "scripts"),
+        }
         super().__init__()
     
-    async def execute(self, action: str, app_name: str = None, script: str = None, 
-                     **kwargs) -> SmolToolResult:
-        """Execute simple macOS operation"""
-        
+    async def _open_app(self, app_name: str) -> SmolToolResult:
+        """Open a macOS application"""
         try:
-            if action == "open_app":
-                if not app_name:
+            if COCOA_AVAILABLE:
+                launched, _ = _launch_app_native(app_name)
+                if launched:
                     return SmolToolResult(
-                        error="app_name is required for open_app action",
-                        success=False
-                    )
-                
-                try:
-                    applescript = f'tell application "{app_name}" to activate'
-                    result = subprocess.run(['osascript', '-e', applescript], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        return SmolToolResult(
-                            output=f"Successfully opened {app_name}",
-                            success=True
-                        )
-                    else:
-                        return SmolToolResult(
-                            error=f"Failed to open {app_name}: {result.stderr}",
-                            success=False
-                        )
-                except Exception as e:
-                    return SmolToolResult(
-                        error=f"Failed to open {app_name}: {str(e)}",
-                        success=False
-                    )
-            
-            elif action == "run_applescript":
-                if not script:
-                    return SmolToolResult(
-                        error="script is required for run_applescript action",
-                        success=False
-                    )
-                
-                try:
-                    result = subprocess.run(['osascript', '-e', script], 
-                                          capture_output=True, text=True)
-                    if result.returncode == 0:
-                        return SmolToolResult(
-                            output=f"AppleScript executed successfully: {result.stdout.strip()}",
-                            success=True
-                        )
-                    else:
-                        return SmolToolResult(
-                            error=f"AppleScript failed: {result.stderr}",
-                            success=False
-                        )
-                except Exception as e:
-                    return SmolToolResult(
-                        error=f"AppleScript execution failed: {str(e)}",
-                        success=False
+                        output=f"Successfully opened {app_name}",
+                        success=True
                     )
+                return SmolToolResult(
+                    error=f"Failed to open {app_name}: NSWorkspace could not launch it",
+                    success=False
+                )
             
+            applescript = _OPEN_APP_TMPL.format(_as_literal(app_name))
+            returncode, _, stderr = await self._osa.run(applescript)
+            if returncode == 0:
+                return SmolToolResult(
+                    output=f"Successfully opened {app_name}",
+                    success=True
+                )
             else:
                 return SmolToolResult(
-                    error=f"Unknown action: {action}. Available actions: open_app, run_applescript",
+                    error=f"Failed to open {app_name}: {stderr}",
                     success=False
                 )
+        except Exception as e:
+            return SmolToolResult(
+                error=f"Failed to open {app_name}: {str(e)}",
+                success=False
+            )
+    
+    async def _run_applescript(self, script: str) -> SmolToolResult:
+        """Execute AppleScript code"""
+        try:
+            returncode, stdout, stderr = await self._osa.run(script)
+            if returncode == 0:
+                return SmolToolResult(
+                    output=f"AppleScript executed successfully: {stdout.strip()}",
+                    success=True
+                )
+            else:
+                return SmolToolResult(
+                    error=f"AppleScript failed: {stderr}",
+                    success=False
+                )
+        except Exception as e:
+            return SmolToolResult(
+                error=f"AppleScript execution failed: {str(e)}",
+                success=False
+            )
+    
+    async def _run_applescript_batch(self, scripts: List[str]) -> SmolToolResult:
+        """Execute several AppleScript snippets in order through one round trip"""
+        return await _run_osa_batch(self._osa, scripts)
+    
+    async def execute(self, action: str, app_name: str = None, script: str = None, 
+                     scripts: Optional[List[str]] = None, **kwargs) -> SmolToolResult:
+        """Execute simple macOS operation"""
+        
+        try:
+            entry = self._actions.get(action)
+            if entry is None:
+                return SmolToolResult(
+                    error=f"Unknown action: {action}. Available actions: open_app, run_applescript, run_applescript_batch",
+                    success=False
+                )
+            handler, param = entry
+            args = {"app_name": app_name, "script": script, "scripts": scripts}
+            missing = _check_required(action, (param,), args)
+            if missing is not None:
+                return missing
+            return await handler(args[param])
                 
         except Exception as e:
             return SmolToolResult(
                 error=f"Simple macOS tool error: {str(e)}",
                 success=False
-            )
\ No newline at end of file
+            )
+    
+    def __del__(self):
+        """Cleanup when tool is destroyed"""
+        self._osa.stop()
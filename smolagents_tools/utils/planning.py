@@ -2,11 +2,127 @@
 Planning and task management tool adapted for smolagents
 """
 
+import functools
+import heapq
 import json
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime
 from .base import AsyncSmolTool, SmolToolResult
 
+# Keyword groups checked in order by _break_down_task, first match wins
+_WEBSITE_KEYS = ("website", "web app")
+_API_KEYS = ("api",)
+_ANALYSIS_KEYS = ("data analysis", "analysis")
+
+
+def _template(*steps: Tuple[str, str]) -> Tuple[Mapping[str, str], ...]:
+    """Freeze (title, description) pairs into a read-only subtask template"""
+    return tuple(
+        MappingProxyType({"title": title, "description": description})
+        for title, description in steps
+    )
+
+
+# Subtask templates are shared by every call; _break_down_task copies the chosen one
+_WEBSITE_TEMPLATE = _template(
+    ("Plan and Design", "Create wireframes and plan the structure"),
+    ("Setup Project", "Initialize project structure and dependencies"),
+    ("Implement Frontend", "Create user interface components"),
+    ("Implement Backend", "Create server-side logic and APIs"),
+    ("Testing", "Test functionality and fix bugs"),
+    ("Deployment", "Deploy to production environment"),
+)
+_API_TEMPLATE = _template(
+    ("Design API", "Define endpoints and data structures"),
+    ("Setup Framework", "Initialize API framework and dependencies"),
+    ("Implement Endpoints", "Create API endpoints and logic"),
+    ("Add Authentication", "Implement security and authentication"),
+    ("Testing", "Test API endpoints and functionality"),
+    ("Documentation", "Create API documentation"),
+)
+_ANALYSIS_TEMPLATE = _template(
+    ("Data Collection", "Gather and prepare data sources"),
+    ("Data Cleaning", "Clean and preprocess the data"),
+    ("Exploratory Analysis", "Perform initial data exploration"),
+    ("Analysis", "Conduct detailed analysis"),
+    ("Visualization", "Create charts and visualizations"),
+    ("Report", "Compile findings into a report"),
+)
+_GENERIC_TEMPLATE = _template(
+    ("Research and Planning", "Research requirements and plan approach"),
+    ("Setup and Preparation", "Prepare tools and environment"),
+    ("Implementation", "Execute the main work"),
+    ("Testing and Validation", "Test and validate the results"),
+    ("Documentation", "Document the process and results"),
+)
+
+
+@dataclass(slots=True)
+class Task:
+    """A single task within a plan"""
+    id: str
+    title: str
+    description: str
+    status: str = "pending"
+    priority: str = "medium"
+    estimated_time: Optional[str] = None
+    dependencies: List[str] = field(default_factory=list)
+    created_at: str = ""
+    updates: List[Dict[str, str]] = field(default_factory=list)
+    completed_at: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict view for artifacts; optional fields appear only once set"""
+        data = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "priority": self.priority,
+        }
+        if self.estimated_time is not None:
+            data["estimated_time"] = self.estimated_time
+        data["dependencies"] = list(self.dependencies)
+        data["created_at"] = self.created_at
+        if self.updates:
+            data["updates"] = [dict(update) for update in self.updates]
+        if self.completed_at is not None:
+            data["completed_at"] = self.completed_at
+        return data
+
+
+@functools.lru_cache(maxsize=256)
+def _template_for(task_description: str) -> Tuple[Mapping[str, str], ...]:
+    """Pick the subtask template for a task description by keyword"""
+    desc = task_description.lower()
+    if any(key in desc for key in _WEBSITE_KEYS):
+        return _WEBSITE_TEMPLATE
+    if any(key in desc for key in _API_KEYS):
+        return _API_TEMPLATE
+    if any(key in desc for key in _ANALYSIS_KEYS):
+        return _ANALYSIS_TEMPLATE
+    return _GENERIC_TEMPLATE
+
+
+@functools.lru_cache(maxsize=256)
+def _analysis_text(task_description: str) -> str:
+    """Format the analyze_task report; it depends only on the description"""
+    template = _template_for(task_description)
+    parts = [f"Analysis for task: {task_description}\n\n", "Suggested breakdown:\n"]
+    append = parts.append
+    for i, step in enumerate(template, 1):
+        append(
+            f"{i}. {step['title']}\n"
+            f"   Description: {step['description']}\n"
+            f"   Priority: medium\n\n"
+        )
+    append(f"Total estimated subtasks: {len(template)}\n")
+    append("Use 'create_plan' action to create an actual plan from this analysis.")
+    return "".join(parts)
+
 
 class PlanningTool(AsyncSmolTool):
     """
@@ -14,6 +130,8 @@ class PlanningTool(AsyncSmolTool):
     Adapted from OpenManus PlanningTool
     """
     
+    _STATUS_ICONS = {"completed": "✓", "pending": "○", "in_progress": "◐"}
+    
     def __init__(self):
         self.name = "planning"
         self.description = """A tool for creating, managing, and tracking task plans and workflows. Can break down complex tasks into subtasks."""
@@ -21,7 +139,7 @@ class PlanningTool(AsyncSmolTool):
         self.inputs = {
             "action": {
                 "type": "string",
-                "description": "Action to perform: create_plan, add_task, update_task, complete_task, get_plan, analyze_task",
+                "description": "Action to perform: create_plan, add_task, update_task, complete_task, get_plan, get_ready_tasks, analyze_task",
                 "required": True
             },
             "task_description": {
@@ -31,7 +149,7 @@ class PlanningTool(AsyncSmolTool):
             },
             "plan_id": {
                 "type": "string",
-                "description": "ID of the plan to work with (required for most actions except create_plan)",
+                "description": "ID of the plan to work with (required for most actions except create_plan and analyze_task)",
                 "required": False
             },
             "task_id": {
@@ -75,6 +193,12 @@ class PlanningTool(AsyncSmolTool):
         
         # In-memory storage for plans (in real implementation, this would be persistent)
         self._plans: Dict[str, Dict[str, Any]] = {}
+        # plan_id -> task_id -> task, kept beside the plans so plan artifacts keep their shape
+        self._task_index: Dict[str, Dict[str, Task]] = {}
+        # plan_id -> number of tasks in each status; progress is derived from this
+        self._status_counts: Dict[str, Counter] = {}
+        # plan_id -> task_id -> ids of the tasks that depend on it; rebuilt lazily after add_task
+        self._successors: Dict[str, Dict[str, List[str]]] = {}
         self._next_plan_id = 1
         self._next_task_id = 1
         super().__init__()
@@ -91,98 +215,88 @@ class PlanningTool(AsyncSmolTool):
         self._next_task_id += 1
         return task_id
     
-    def _break_down_task(self, task_description: str) -> List[Dict[str, Any]]:
+    def _break_down_task(self, task_description: str, now_iso: Optional[str] = None) -> List[Task]:
         """Break down a complex task into subtasks using simple heuristics"""
         # This is a simplified version - in a real implementation, 
         # this could use LLM or more sophisticated analysis
         
-        subtasks = []
-        
-        # Common task patterns and their breakdowns
-        if "website" in task_description.lower() or "web app" in task_description.lower():
-            subtasks = [
-                {"title": "Plan and Design", "description": "Create wireframes and plan the structure"},
-                {"title": "Setup Project", "description": "Initialize project structure and dependencies"},
-                {"title": "Implement Frontend", "description": "Create user interface components"},
-                {"title": "Implement Backend", "description": "Create server-side logic and APIs"},
-                {"title": "Testing", "description": "Test functionality and fix bugs"},
-                {"title": "Deployment", "description": "Deploy to production environment"}
-            ]
-        elif "api" in task_description.lower():
-            subtasks = [
-                {"title": "Design API", "description": "Define endpoints and data structures"},
-                {"title": "Setup Framework", "description": "Initialize API framework and dependencies"},
-                {"title": "Implement Endpoints", "description": "Create API endpoints and logic"},
-                {"title": "Add Authentication", "description": "Implement security and authentication"},
-                {"title": "Testing", "description": "Test API endpoints and functionality"},
-                {"title": "Documentation", "description": "Create API documentation"}
-            ]
-        elif "data analysis" in task_description.lower() or "analysis" in task_description.lower():
-            subtasks = [
-                {"title": "Data Collection", "description": "Gather and prepare data sources"},
-                {"title": "Data Cleaning", "description": "Clean and preprocess the data"},
-                {"title": "Exploratory Analysis", "description": "Perform initial data exploration"},
-                {"title": "Analysis", "description": "Conduct detailed analysis"},
-                {"title": "Visualization", "description": "Create charts and visualizations"},
-                {"title": "Report", "description": "Compile findings into a report"}
-            ]
-        else:
-            # Generic breakdown
-            subtasks = [
-                {"title": "Research and Planning", "description": "Research requirements and plan approach"},
-                {"title": "Setup and Preparation", "description": "Prepare tools and environment"},
-                {"title": "Implementation", "description": "Execute the main work"},
-                {"title": "Testing and Validation", "description": "Test and validate the results"},
-                {"title": "Documentation", "description": "Document the process and results"}
-            ]
+        template = _template_for(task_description)
         
-        # Add IDs and metadata to subtasks
-        for i, subtask in enumerate(subtasks):
-            subtask.update({
-                "id": self._generate_task_id(),
-                "status": "pending",
-                "priority": "medium",
-                "created_at": datetime.now().isoformat(),
-                "dependencies": []
-            })
+        # Copy the template, adding IDs and metadata; every subtask shares one timestamp
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        subtasks = [
+            Task(
+                id=self._generate_task_id(),
+                title=step["title"],
+                description=step["description"],
+                created_at=now_iso,
+            )
+            for step in template
+        ]
         
         return subtasks
     
+    @staticmethod
+    def _progress_view(counts: Counter) -> Dict[str, int]:
+        """Progress summary in the shape plan artifacts have always used"""
+        return {
+            "total_tasks": sum(counts.values()),
+            "completed_tasks": counts["completed"],
+            "in_progress_tasks": counts["in_progress"],
+            "pending_tasks": counts["pending"]
+        }
+    
+    def _plan_view(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a plan with its tasks as plain dicts and its progress, for artifacts"""
+        return {
+            **plan,
+            "tasks": [task.to_dict() for task in plan["tasks"]],
+            "progress": self._progress_view(self._status_counts[plan["id"]]),
+        }
+    
+    def _set_status(self, plan_id: str, task: Task, status: str) -> None:
+        """Move a task to a new status, keeping the plan's status counts in step"""
+        counts = self._status_counts[plan_id]
+        counts[task.status] -= 1
+        counts[status] += 1
+        task.status = status
+    
     def _create_plan(self, task_description: str) -> SmolToolResult:
         """Create a new plan"""
         try:
             plan_id = self._generate_plan_id()
-            subtasks = self._break_down_task(task_description)
+            now_iso = datetime.now().isoformat()
+            subtasks = self._break_down_task(task_description, now_iso)
             
             plan = {
                 "id": plan_id,
                 "title": task_description,
                 "description": f"Plan for: {task_description}",
-                "created_at": datetime.now().isoformat(),
+                "created_at": now_iso,
                 "status": "active",
-                "tasks": subtasks,
-                "progress": {
-                    "total_tasks": len(subtasks),
-                    "completed_tasks": 0,
-                    "in_progress_tasks": 0,
-                    "pending_tasks": len(subtasks)
-                }
+                "tasks": subtasks
             }
             
             self._plans[plan_id] = plan
+            self._task_index[plan_id] = {task.id: task for task in subtasks}
+            self._status_counts[plan_id] = Counter(task.status for task in subtasks)
             
             # Format output
-            output = f"Created plan '{plan_id}' for: {task_description}\n\n"
-            output += "Subtasks:\n"
+            parts = [f"Created plan '{plan_id}' for: {task_description}\n\n", "Subtasks:\n"]
+            append = parts.append
             for i, task in enumerate(subtasks, 1):
-                output += f"{i}. {task['title']} (ID: {task['id']})\n"
-                output += f"   Description: {task['description']}\n"
-                output += f"   Status: {task['status']}\n\n"
+                append(
+                    f"{i}. {task.title} (ID: {task.id})\n"
+                    f"   Description: {task.description}\n"
+                    f"   Status: {task.status}\n\n"
+                )
+            output = "".join(parts)
             
             return SmolToolResult(
                 output=output,
                 success=True,
-                artifacts={"plan_id": plan_id, "plan": plan}
+                artifacts={"plan_id": plan_id, "plan": self._plan_view(plan)}
             )
             
         except Exception as e:
@@ -206,25 +320,25 @@ class PlanningTool(AsyncSmolTool):
             deps = dependencies.split(",") if dependencies else []
             deps = [dep.strip() for dep in deps if dep.strip()]
             
-            new_task = {
-                "id": task_id,
-                "title": title,
-                "description": description,
-                "status": "pending",
-                "priority": priority,
-                "estimated_time": estimated_time,
-                "dependencies": deps,
-                "created_at": datetime.now().isoformat()
-            }
+            new_task = Task(
+                id=task_id,
+                title=title,
+                description=description,
+                priority=priority,
+                estimated_time=estimated_time,
+                dependencies=deps,
+                created_at=datetime.now().isoformat(),
+            )
             
             self._plans[plan_id]["tasks"].append(new_task)
-            self._plans[plan_id]["progress"]["total_tasks"] += 1
-            self._plans[plan_id]["progress"]["pending_tasks"] += 1
+            self._task_index[plan_id][task_id] = new_task
+            self._successors.pop(plan_id, None)
+            self._status_counts[plan_id][new_task.status] += 1
             
             return SmolToolResult(
                 output=f"Added task '{title}' (ID: {task_id}) to plan {plan_id}",
                 success=True,
-                artifacts={"task_id": task_id, "task": new_task}
+                artifacts={"task_id": task_id, "task": new_task.to_dict()}
             )
             
         except Exception as e:
@@ -242,12 +356,7 @@ class PlanningTool(AsyncSmolTool):
                     success=False
                 )
             
-            plan = self._plans[plan_id]
-            task = None
-            for t in plan["tasks"]:
-                if t["id"] == task_id:
-                    task = t
-                    break
+            task = self._task_index[plan_id].get(task_id)
             
             if not task:
                 return SmolToolResult(
@@ -256,10 +365,7 @@ class PlanningTool(AsyncSmolTool):
                 )
             
             # Add update to task
-            if "updates" not in task:
-                task["updates"] = []
-            
-            task["updates"].append({
+            task.updates.append({
                 "timestamp": datetime.now().isoformat(),
                 "content": update_content
             })
@@ -267,7 +373,7 @@ class PlanningTool(AsyncSmolTool):
             return SmolToolResult(
                 output=f"Updated task {task_id} in plan {plan_id}",
                 success=True,
-                artifacts={"task": task}
+                artifacts={"task": task.to_dict()}
             )
             
         except Exception as e:
@@ -286,11 +392,7 @@ class PlanningTool(AsyncSmolTool):
                 )
             
             plan = self._plans[plan_id]
-            task = None
-            for t in plan["tasks"]:
-                if t["id"] == task_id:
-                    task = t
-                    break
+            task = self._task_index[plan_id].get(task_id)
             
             if not task:
                 return SmolToolResult(
@@ -298,24 +400,16 @@ class PlanningTool(AsyncSmolTool):
                     success=False
                 )
             
-            old_status = task["status"]
-            task["status"] = "completed"
-            task["completed_at"] = datetime.now().isoformat()
-            
-            # Update progress
-            progress = plan["progress"]
-            if old_status == "pending":
-                progress["pending_tasks"] -= 1
-            elif old_status == "in_progress":
-                progress["in_progress_tasks"] -= 1
-            progress["completed_tasks"] += 1
+            self._set_status(plan_id, task, "completed")
+            task.completed_at = datetime.now().isoformat()
             
+            progress = self._progress_view(self._status_counts[plan_id])
             completion_rate = (progress["completed_tasks"] / progress["total_tasks"]) * 100
             
             return SmolToolResult(
-                output=f"Completed task '{task['title']}' (ID: {task_id})\nPlan progress: {completion_rate:.1f}% complete",
+                output=f"Completed task '{task.title}' (ID: {task_id})\nPlan progress: {completion_rate:.1f}% complete",
                 success=True,
-                artifacts={"task": task, "progress": progress}
+                artifacts={"task": task.to_dict(), "progress": progress}
             )
             
         except Exception as e:
@@ -334,31 +428,38 @@ class PlanningTool(AsyncSmolTool):
                 )
             
             plan = self._plans[plan_id]
-            progress = plan["progress"]
+            progress = self._progress_view(self._status_counts[plan_id])
             completion_rate = (progress["completed_tasks"] / progress["total_tasks"]) * 100
             
-            output = f"Plan: {plan['title']} (ID: {plan_id})\n"
-            output += f"Status: {plan['status']}\n"
-            output += f"Created: {plan['created_at']}\n"
-            output += f"Progress: {completion_rate:.1f}% complete ({progress['completed_tasks']}/{progress['total_tasks']} tasks)\n\n"
-            
-            output += "Tasks:\n"
+            parts = [
+                f"Plan: {plan['title']} (ID: {plan_id})\n"
+                f"Status: {plan['status']}\n"
+                f"Created: {plan['created_at']}\n"
+                f"Progress: {completion_rate:.1f}% complete ({progress['completed_tasks']}/{progress['total_tasks']} tasks)\n\n"
+                "Tasks:\n"
+            ]
+            append = parts.append
+            icons = self._STATUS_ICONS
             for task in plan["tasks"]:
-                status_icon = "✓" if task["status"] == "completed" else "○" if task["status"] == "pending" else "◐"
-                output += f"{status_icon} {task['title']} (ID: {task['id']}) - {task['status']}\n"
-                output += f"   {task['description']}\n"
-                if task.get("priority") != "medium":
-                    output += f"   Priority: {task['priority']}\n"
-                if task.get("estimated_time"):
-                    output += f"   Estimated time: {task['estimated_time']}\n"
-                if task.get("dependencies"):
-                    output += f"   Dependencies: {', '.join(task['dependencies'])}\n"
-                output += "\n"
+                status = task.status
+                append(f"{icons.get(status, '◐')} {task.title} (ID: {task.id}) - {status}\n")
+                append(f"   {task.description}\n")
+                priority = task.priority
+                if priority != "medium":
+                    append(f"   Priority: {priority}\n")
+                estimated_time = task.estimated_time
+                if estimated_time:
+                    append(f"   Estimated time: {estimated_time}\n")
+                dependencies = task.dependencies
+                if dependencies:
+                    append(f"   Dependencies: {', '.join(dependencies)}\n")
+                append("\n")
+            output = "".join(parts)
             
             return SmolToolResult(
                 output=output,
                 success=True,
-                artifacts={"plan": plan}
+                artifacts={"plan": self._plan_view(plan)}
             )
             
         except Exception as e:
@@ -367,25 +468,111 @@ class PlanningTool(AsyncSmolTool):
                 success=False
             )
     
+    def _plan_successors(self, plan_id: str) -> Dict[str, List[str]]:
+        """Map each task id to the tasks that depend on it, cached per plan"""
+        successors = self._successors.get(plan_id)
+        if successors is None:
+            index = self._task_index[plan_id]
+            successors = {task_id: [] for task_id in index}
+            for task in index.values():
+                for dep in task.dependencies:
+                    if dep in successors:
+                        successors[dep].append(task.id)
+            self._successors[plan_id] = successors
+        return successors
+    
+    def _ready_tasks(self, plan_id: str) -> Tuple[List[Task], List[Task], List[Task]]:
+        """
+        Schedule a plan's unfinished tasks with Kahn's algorithm.
+        
+        Returns (ready, order, blocked): the tasks whose dependencies are all complete,
+        a topological order of every unfinished task, and tasks caught in a dependency
+        cycle. Among tasks that are free to run, the ones most others depend on come
+        first, then plan order.
+        """
+        index = self._task_index[plan_id]
+        successors = self._plan_successors(plan_id)
+        position = {task_id: i for i, task_id in enumerate(index)}
+        
+        pending = {task_id for task_id, task in index.items() if task.status != "completed"}
+        indegree = {
+            task_id: sum(1 for dep in index[task_id].dependencies if dep in pending)
+            for task_id in pending
+        }
+        heap = [
+            (-len(successors[task_id]), position[task_id], task_id)
+            for task_id, degree in indegree.items() if degree == 0
+        ]
+        heapq.heapify(heap)
+        ready = [index[task_id] for _, _, task_id in sorted(heap)]
+        
+        order = []
+        while heap:
+            _, _, task_id = heapq.heappop(heap)
+            order.append(index[task_id])
+            for succ in successors[task_id]:
+                if succ in indegree:
+                    indegree[succ] -= 1
+                    if indegree[succ] == 0:
+                        heapq.heappush(heap, (-len(successors[succ]), position[succ], succ))
+        
+        scheduled = {task.id for task in order}
+        blocked = [index[task_id] for task_id in sorted(pending - scheduled, key=position.get)]
+        return ready, order, blocked
+    
+    def _get_ready_tasks(self, plan_id: str) -> SmolToolResult:
+        """List the tasks that can start now and an execution order for the rest"""
+        try:
+            if plan_id not in self._plans:
+                return SmolToolResult(
+                    error=f"Plan {plan_id} not found",
+                    success=False
+                )
+            
+            ready, order, blocked = self._ready_tasks(plan_id)
+            
+            parts = [f"Ready tasks for plan {plan_id}:\n"]
+            append = parts.append
+            for task in ready:
+                append(f"- {task.title} (ID: {task.id})\n")
+            if not ready:
+                append("(none)\n")
+            append("\nExecution order:\n")
+            for i, task in enumerate(order, 1):
+                append(f"{i}. {task.title} (ID: {task.id})\n")
+            if blocked:
+                append("\nBlocked by a dependency cycle:\n")
+                for task in blocked:
+                    append(f"- {task.title} (ID: {task.id})\n")
+            output = "".join(parts)
+            
+            return SmolToolResult(
+                output=output,
+                success=True,
+                artifacts={
+                    "ready": [task.id for task in ready],
+                    "order": [task.id for task in order],
+                    "blocked": [task.id for task in blocked],
+                }
+            )
+            
+        except Exception as e:
+            return SmolToolResult(
+                error=f"Failed to get ready tasks: {str(e)}",
+                success=False
+            )
+    
     def _analyze_task(self, task_description: str) -> SmolToolResult:
         """Analyze a task and provide breakdown suggestions"""
         try:
             subtasks = self._break_down_task(task_description)
             
-            output = f"Analysis for task: {task_description}\n\n"
-            output += "Suggested breakdown:\n"
-            for i, task in enumerate(subtasks, 1):
-                output += f"{i}. {task['title']}\n"
-                output += f"   Description: {task['description']}\n"
-                output += f"   Priority: {task['priority']}\n\n"
-            
-            output += f"Total estimated subtasks: {len(subtasks)}\n"
-            output += "Use 'create_plan' action to create an actual plan from this analysis."
+            output = _analysis_text(task_description)
             
             return SmolToolResult(
                 output=output,
                 success=True,
-                artifacts={"suggested_subtasks": subtasks}
+                artifacts={"suggested_subtasks": [task.to_dict() for task in subtasks]}
             )
             
         except Exception as e:
@@ -461,6 +648,14 @@ class PlanningTool(AsyncSmolTool):
                     )
                 return self._get_plan(plan_id)
             
+            elif action == "get_ready_tasks":
+                if not plan_id:
+                    return SmolToolResult(
+                        error="plan_id is required for get_ready_tasks action",
+                        success=False
+                    )
+                return self._get_ready_tasks(plan_id)
+            
             elif action == "analyze_task":
                 if not task_description:
                     return SmolToolResult(
@@ -2,12 +2,196 @@
 Python code execution tool adapted for smolagents
 """
 
+import ast
+import asyncio
+import atexit
+import builtins
+import hashlib
+import importlib
+import marshal
 import multiprocessing
+import multiprocessing.util
+import os
 import sys
+import threading
+from collections import OrderedDict, deque
 from io import StringIO
-from typing import Dict
+from typing import Any, Deque, Dict, FrozenSet, Optional, Tuple
 from .base import AsyncSmolTool, SmolToolResult
 
+# Warm worker processes. Each imports common stdlib modules up front so short
+# snippets don't pay interpreter/import startup, then runs exactly one snippet
+# and exits, so nothing a snippet changes is seen by the next one.
+_SPARE_WORKERS = min(2, os.cpu_count() or 1)
+_PREIMPORT_MODULES = (
+    "collections", "datetime", "functools", "itertools", "json", "math", "os", "random", "re", "sys",
+)
+# Workers are forked from a fork server (spawned where there is none), never from this
+# process: its background loop and file-pool threads could hold a lock at fork time,
+# which would then stay locked in the child. The server preloads this module and the
+# common imports, so a worker starts from an already-warm interpreter.
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _mp = multiprocessing.get_context("forkserver")
+    _mp.set_forkserver_preload([__name__, *_PREIMPORT_MODULES])
+else:
+    _mp = multiprocessing.get_context("spawn")
+_spares: "Deque[_Worker]" = deque()
+_spares_lock = threading.Lock()
+
+# The worker's builtins as they were before any snippet ran
+_base_builtins: Dict[str, Any] = {}
+
+# LRU of marshalled code objects, keyed by a digest of the source
+_CODE_CACHE_SIZE = 256
+_code_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_code_cache_lock = threading.Lock()
+
+
+def _preimport() -> None:
+    """
+    Worker start-up, before it receives a snippet: import common modules and
+    take the builtins snapshot every snippet's builtins are built from.
+    """
+    for name in _PREIMPORT_MODULES:
+        importlib.import_module(name)
+    _base_builtins.update(builtins.__dict__)
+
+
+def _worker_main(conn) -> None:
+    """Worker process body: get ready, then run one snippet and send back its result"""
+    _preimport()
+    try:
+        # Only the parent holds the other end of the pipe, so its exit, however
+        # abrupt, shows up here as EOF
+        run_args = conn.recv()
+    except EOFError:
+        # The parent shut down before handing this spare a snippet
+        return
+    conn.send(_run_code(*run_args))
+
+
+class _Worker:
+    """A started worker process and the parent's end of its pipe"""
+    
+    def __init__(self):
+        self.conn, child_conn = _mp.Pipe()
+        self.process = _mp.Process(target=_worker_main, args=(child_conn,))
+        self.process.start()
+        child_conn.close()
+    
+    def run(self, run_args: tuple, timeout: float) -> Tuple[bool, str]:
+        """
+        Run one snippet and return (success, output).
+        
+        Raises TimeoutError if it does not finish in time and EOFError if the
+        worker dies first. Either way the worker is gone afterwards.
+        """
+        try:
+            self.conn.send(run_args)
+            if not self.conn.poll(timeout):
+                raise TimeoutError
+            return self.conn.recv()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise EOFError from e
+        finally:
+            self.close()
+    
+    def close(self) -> None:
+        """Stop the worker if it is still running and release its pipe"""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1)
+        self.conn.close()
+
+
+def _take_worker() -> _Worker:
+    """Return a warm worker for one snippet and start replacements for the spares in use"""
+    worker = None
+    with _spares_lock:
+        while _spares and worker is None:
+            worker = _spares.popleft()
+            if not worker.process.is_alive():
+                worker.close()
+                worker = None
+        while len(_spares) < _SPARE_WORKERS:
+            _spares.append(_Worker())
+    return worker or _Worker()
+
+
+def _run_in_worker(run_args: tuple, timeout: float) -> Tuple[bool, str]:
+    """Blocking: run a snippet on its own worker process"""
+    return _take_worker().run(run_args, timeout)
+
+
+# Registered after multiprocessing.util's exit hook (imported above), so it runs first
+@atexit.register
+def _shutdown_spares() -> None:
+    """Stop idle spares at interpreter exit, so multiprocessing does not wait on them"""
+    with _spares_lock:
+        while _spares:
+            _spares.popleft().close()
+
+
+def _compile_cached(code: str) -> bytes:
+    """
+    Compile a snippet to a marshalled code object for a worker.
+    
+    The result is reused when the same source ran recently. Raises SyntaxError
+    (or ValueError for null bytes) for code that does not compile.
+    """
+    key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+    with _code_cache_lock:
+        marshalled = _code_cache.get(key)
+        if marshalled is not None:
+            _code_cache.move_to_end(key)
+            return marshalled
+    marshalled = marshal.dumps(compile(code, "<string>", "exec"))
+    with _code_cache_lock:
+        _code_cache[key] = marshalled
+        if len(_code_cache) > _CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    return marshalled
+
+
+def _builtins_for(restricted_functions: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """
+    Builtins table for a restriction set, built from the worker's start-up snapshot.
+    
+    Both kinds are built from the snapshot rather than the live builtins module,
+    so a rebound builtin never reaches a restricted table. Each call gets a new
+    plain dict: the interpreter needs a real dict for `__builtins__`, so that a
+    missing `__import__` is reported as an ImportError.
+    """
+    if restricted_functions is None:
+        return dict(_base_builtins)
+    safe_builtins = {
+        name: value for name, value in _base_builtins.items()
+        if name not in restricted_functions
+    }
+    safe_builtins["print"] = print
+    return safe_builtins
+
+
+def _run_code(marshalled: bytes, restricted_functions: Optional[FrozenSet[str]] = None) -> Tuple[bool, str]:
+    """
+    Run a marshalled snippet in a worker with stdout captured; builtins are filtered when restricted.
+    
+    Returns (success, output), where output is the error message on failure.
+    """
+    safe_globals = {"__builtins__": _builtins_for(restricted_functions)}
+    
+    original_stdout = sys.stdout
+    try:
+        output_buffer = StringIO()
+        sys.stdout = output_buffer
+        exec(marshal.loads(marshalled), safe_globals, safe_globals)
+        return True, output_buffer.getvalue()
+    except BaseException as e:
+        # BaseException so that sys.exit() in user code is reported, not fatal to the worker
+        return False, str(e)
+    finally:
+        sys.stdout = original_stdout
+
 
 class PythonExecutorTool(AsyncSmolTool):
     """
@@ -15,6 +199,8 @@ class PythonExecutorTool(AsyncSmolTool):
     Adapted from OpenManus PythonExecute
     """
     
+    _error_label = "Python execution failed"
+    
     def __init__(self):
         self.name = "python_executor"
         self.description = """Executes Python code string. Note: Only print outputs are visible, function return values are not captured. Use print statements to see results."""
@@ -35,20 +221,17 @@ class PythonExecutorTool(AsyncSmolTool):
         self.output_type = "string"
         super().__init__()
     
-    def _run_code(self, code: str, result_dict: dict, safe_globals: dict) -> None:
-        """Run code in a separate process"""
-        original_stdout = sys.stdout
+    def _prepare(self, code: str) -> Tuple[Optional[str], tuple]:
+        """
+        Check and compile code before it is sent to a worker.
+        
+        Returns (rejection, args): an error message if the code must not be run,
+        else None together with the arguments for the worker-side _run_code.
+        """
         try:
-            output_buffer = StringIO()
-            sys.stdout = output_buffer
-            exec(code, safe_globals, safe_globals)
-            result_dict["output"] = output_buffer.getvalue()
-            result_dict["success"] = True
-        except Exception as e:
-            result_dict["output"] = str(e)
-            result_dict["success"] = False
-        finally:
-            sys.stdout = original_stdout
+            return None, (_compile_cached(code),)
+        except (SyntaxError, ValueError) as e:
+            return str(e), ()
     
     async def execute(self, code: str, timeout: int = 30, **kwargs) -> SmolToolResult:
         """
@@ -62,50 +245,42 @@ class PythonExecutorTool(AsyncSmolTool):
             SmolToolResult: Contains execution output or error message and success status.
         """
         try:
-            with multiprocessing.Manager() as manager:
-                result = manager.dict({"output": "", "success": False})
-                
-                # Create safe globals for execution
-                if isinstance(__builtins__, dict):
-                    safe_globals = {"__builtins__": __builtins__}
-                else:
-                    safe_globals = {"__builtins__": __builtins__.__dict__.copy()}
-                
-                # Start process
-                proc = multiprocessing.Process(
-                    target=self._run_code, 
-                    args=(code, result, safe_globals)
+            rejection, run_args = self._prepare(code)
+            if rejection:
+                return SmolToolResult(output="", error=rejection, success=False)
+            
+            try:
+                success, output = await asyncio.to_thread(_run_in_worker, run_args, timeout)
+            except TimeoutError:
+                return SmolToolResult(
+                    output=f"Execution timeout after {timeout} seconds",
+                    error=f"Code execution timed out after {timeout} seconds",
+                    success=False
+                )
+            except EOFError:
+                # The worker died (e.g. os._exit in user code)
+                return SmolToolResult(
+                    output="",
+                    error="Python worker process exited unexpectedly",
+                    success=False
+                )
+            
+            # Return results
+            if success:
+                return SmolToolResult(
+                    output=output or "Code executed successfully (no output)",
+                    success=True
+                )
+            else:
+                return SmolToolResult(
+                    output="",
+                    error=output,
+                    success=False
                 )
-                proc.start()
-                proc.join(timeout)
-                
-                # Check for timeout
-                if proc.is_alive():
-                    proc.terminate()
-                    proc.join(1)
-                    return SmolToolResult(
-                        output=f"Execution timeout after {timeout} seconds",
-                        error=f"Code execution timed out after {timeout} seconds",
-                        success=False
-                    )
-                
-                # Return results
-                result_dict = dict(result)
-                if result_dict["success"]:
-                    return SmolToolResult(
-                        output=result_dict["output"] or "Code executed successfully (no output)",
-                        success=True
-                    )
-                else:
-                    return SmolToolResult(
-                        output="",
-                        error=result_dict["output"],
-                        success=False
-                    )
                     
         except Exception as e:
             return SmolToolResult(
-                error=f"Python execution failed: {str(e)}",
+                error=f"{self._error_label}: {str(e)}",
                 success=False
             )
 
@@ -115,8 +290,11 @@ class SafePythonExecutorTool(PythonExecutorTool):
     A safer version of Python executor with restricted imports and operations
     """
     
+    _error_label = "Safe Python execution failed"
+    
     def __init__(self):
         super().__init__()
+        # Set after the base init, which assigns the plain executor's name and description
         self.name = "safe_python_executor"
         self.description = """Executes Python code with safety restrictions. Certain dangerous operations and imports are blocked."""
         
@@ -129,100 +307,44 @@ class SafePythonExecutorTool(PythonExecutorTool):
         self.restricted_functions = {
             'eval', 'exec', 'compile', '__import__', 'open', 'input', 'raw_input'
         }
-        
-        # Re-initialize with updated name
-        super().__init__()
     
-    def _create_safe_globals(self):
-        """Create a restricted global environment"""
-        safe_builtins = {}
-        
-        # Copy safe builtins
-        if isinstance(__builtins__, dict):
-            original_builtins = __builtins__
-        else:
-            original_builtins = __builtins__.__dict__
-        
-        for name, value in original_builtins.items():
-            if name not in self.restricted_functions:
-                safe_builtins[name] = value
+    def _prepare(self, code: str) -> Tuple[Optional[str], tuple]:
+        """Reject code that uses restricted imports or functions, else compile it from the checked tree"""
+        # Walk the syntax tree rather than scanning the text, so names inside strings
+        # or comments are not flagged and spacing tricks in imports are still caught
+        try:
+            tree = ast.parse(code, "<string>", mode="exec")
+        except SyntaxError as e:
+            return str(e), ()
         
-        # Add safe print function
-        safe_builtins['print'] = print
+        rejection = self._check_tree(tree)
+        if rejection:
+            return rejection, ()
         
-        return {"__builtins__": safe_builtins}
-    
-    def _run_code(self, code: str, result_dict: dict, safe_globals: dict) -> None:
-        """Run code with safety checks"""
-        original_stdout = sys.stdout
+        # Compiled from the checked tree rather than parsing the source a second time
         try:
-            # Check for restricted imports in code
-            for module in self.restricted_modules:
-                if f"import {module}" in code or f"from {module}" in code:
-                    result_dict["output"] = f"Restricted module '{module}' is not allowed"
-                    result_dict["success"] = False
-                    return
-            
-            # Check for restricted functions
-            for func in self.restricted_functions:
-                if func in code:
-                    result_dict["output"] = f"Restricted function '{func}' is not allowed"
-                    result_dict["success"] = False
-                    return
-            
-            output_buffer = StringIO()
-            sys.stdout = output_buffer
-            
-            # Use the safe globals
-            exec(code, safe_globals, safe_globals)
-            
-            result_dict["output"] = output_buffer.getvalue()
-            result_dict["success"] = True
-            
-        except Exception as e:
-            result_dict["output"] = str(e)
-            result_dict["success"] = False
-        finally:
-            sys.stdout = original_stdout
+            compiled = compile(tree, "<string>", "exec")
+        except SyntaxError as e:
+            # Some errors (e.g. 'return' outside a function) only surface at compile time
+            return str(e), ()
+        return None, (marshal.dumps(compiled), frozenset(self.restricted_functions))
     
-    async def execute(self, code: str, timeout: int = 30, **kwargs) -> SmolToolResult:
-        """Execute code with safety restrictions"""
-        try:
-            with multiprocessing.Manager() as manager:
-                result = manager.dict({"output": "", "success": False})
-                safe_globals = self._create_safe_globals()
-                
-                proc = multiprocessing.Process(
-                    target=self._run_code,
-                    args=(code, result, safe_globals)
-                )
-                proc.start()
-                proc.join(timeout)
-                
-                if proc.is_alive():
-                    proc.terminate()
-                    proc.join(1)
-                    return SmolToolResult(
-                        output=f"Execution timeout after {timeout} seconds",
-                        error=f"Code execution timed out after {timeout} seconds",
-                        success=False
-                    )
-                
-                result_dict = dict(result)
-                if result_dict["success"]:
-                    return SmolToolResult(
-                        output=result_dict["output"] or "Code executed successfully (no output)",
-                        success=True
-                    )
-                else:
-                    return SmolToolResult(
-                        output="",
-                        error=result_dict["output"],
-                        success=False
-                    )
-                    
-        except Exception as e:
-            return SmolToolResult(
-                error=f"Safe Python execution failed: {str(e)}",
-                success=False
-            )
\ No newline at end of file
+    def _check_tree(self, tree: ast.AST) -> Optional[str]:
+        """Return an error message if the tree uses a restricted import or function, else None"""
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                modules = [node.module] if node.module else []
+            elif isinstance(node, ast.Name):
+                if node.id in self.restricted_functions:
+                    return f"Restricted function '{node.id}' is not allowed"
+                continue
+            else:
+                continue
+            for module in modules:
+                root = module.split(".", 1)[0]
+                if root in self.restricted_modules:
+                    return f"Restricted module '{root}' is not allowed"
+        
+        return None
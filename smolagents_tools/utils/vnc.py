@@ -2,17 +2,47 @@
 VNC Computer Use Tool for smolagents
 Provides automation capabilities for VNC servers using vncdotool command-line interface
 FIXED VERSION: Uses command-line vncdotool to avoid Python SDK hanging issues
+Mouse and keyboard input goes over a persistent native RFB connection when possible
 """
 
 import asyncio
+import binascii
+import functools
 import logging
+import mmap
+import struct
 import subprocess
-from typing import Optional, Dict, Any
+import tempfile
+import time
+from typing import Optional, Dict, Any, Tuple
 from .base import AsyncSmolTool, SmolToolResult
-import base64
 
 logger = logging.getLogger(__name__)
 
+# vncdotool's key names, so the native client accepts exactly what the CLI does
+try:
+    from vncdotool.keys import KEYMAP as _VNC_KEYMAP
+except ImportError:
+    _VNC_KEYMAP = None
+
+# DES for VNC password authentication; without it such servers go through the CLI
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, modes
+    try:
+        from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+    except ImportError:
+        from cryptography.hazmat.primitives.ciphers.algorithms import TripleDES
+    DES_AVAILABLE = True
+except ImportError:
+    DES_AVAILABLE = False
+
+# Pillow (a vncdotool dependency) for reducing the color depth of captures
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 
 import json
 import os
@@ -20,31 +50,353 @@ import os
 # File to persist VNC connection state across Python processes
 VNC_STATE_FILE = '/tmp/vnc_connection_state.json'
 
-def _load_vnc_state():
-    """Load VNC connection state from file"""
-    try:
-        if os.path.exists(VNC_STATE_FILE):
-            with open(VNC_STATE_FILE, 'r') as f:
-                return json.load(f)
-    except Exception:
-        pass
+# Last state read from or written to the file, and the file stamp it matches;
+# the file is only parsed again when its stamp changes
+_state_stamp = None
+_state_cache = None
+
+def _empty_vnc_state():
+    """Connection state for when no VNC server is connected"""
     return {
         'connected_host': None,
         'connection_string': None,
         'password': None
     }
 
+def _state_file_stamp():
+    """Cheap change marker for the state file, or None when it does not exist"""
+    try:
+        st = os.stat(VNC_STATE_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _load_vnc_state():
+    """Load VNC connection state from file"""
+    global _state_stamp, _state_cache
+    stamp = _state_file_stamp()
+    if stamp is None:
+        return _empty_vnc_state()
+    if stamp != _state_stamp:
+        try:
+            with open(VNC_STATE_FILE, 'r') as f:
+                _state_cache = json.load(f)
+        except Exception:
+            return _empty_vnc_state()
+        _state_stamp = stamp
+    # Copy, since callers update the state they are given
+    return dict(_state_cache)
+
 def _save_vnc_state(state):
     """Save VNC connection state to file"""
+    global _state_stamp, _state_cache
+    # Write a sibling file and rename it over the old one: readers in other processes
+    # see either the old or the new state, never a truncated file. mkstemp gives each
+    # save its own temp file, so concurrent saves from worker threads cannot rename
+    # each other's half-written data into place. No fsync, since the file only has
+    # to outlive the processes using it, not a crash.
+    tmp_file = None
     try:
-        with open(VNC_STATE_FILE, 'w') as f:
+        fd, tmp_file = tempfile.mkstemp(
+            dir=os.path.dirname(VNC_STATE_FILE), prefix=f".{os.path.basename(VNC_STATE_FILE)}.", suffix=".tmp"
+        )
+        with open(fd, 'w') as f:
             json.dump(state, f)
+        os.replace(tmp_file, VNC_STATE_FILE)
+    except Exception:
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        return
+    _state_cache = dict(state)
+    _state_stamp = _state_file_stamp()
+
+def _remove_vnc_state():
+    """Remove the VNC connection state file"""
+    try:
+        if os.path.exists(VNC_STATE_FILE):
+            os.remove(VNC_STATE_FILE)
     except Exception:
         pass
 
+# The state helpers touch the disk, so coroutines run them on a worker thread
+# rather than blocking the event loop
+async def _load_vnc_state_async():
+    """Load VNC connection state without blocking the event loop"""
+    return await asyncio.to_thread(_load_vnc_state)
+
+async def _save_vnc_state_async(state):
+    """Save VNC connection state without blocking the event loop"""
+    await asyncio.to_thread(_save_vnc_state, dict(state))
+
 # Global connection state to persist across tool instances
 _global_vnc_state = _load_vnc_state()
 
+@functools.lru_cache(maxsize=8)
+def _vncdotool_base(connection_string, password):
+    """Leading vncdotool arguments for a server, built once per connection"""
+    if password:
+        return ("vncdotool", "-s", connection_string, "-p", password)
+    return ("vncdotool", "-s", connection_string)
+
+def _reduce_color_depth(filename, color_depth):
+    """
+    Rewrite a captured PNG with fewer colors, so it encodes smaller.
+    
+    8 (or less) gives a 256-color palette image; 16 keeps 5 bits per channel.
+    """
+    if not PIL_AVAILABLE:
+        logger.warning("Pillow is not installed; keeping the capture at full color depth")
+        return
+    try:
+        with Image.open(filename) as img:
+            img = img.convert("RGB")
+        if color_depth <= 8:
+            img = img.quantize(colors=256)
+        else:
+            img = ImageOps.posterize(img, 5)
+        img.save(filename, optimize=True)
+    except Exception as e:
+        logger.warning(f"Could not reduce color depth of {filename}: {str(e)}")
+
+def _wants_image(display, include_in_next_call):
+    """Whether a capture's caller will use the image tag: not when it is neither shown nor passed on"""
+    return str(display).lower() != "false" or str(include_in_next_call).lower() != "false"
+
+def _image_tag(filename, img_title, img_alt, display, include_in_next_call):
+    """<img> tag embedding a PNG file as a base64 data URL"""
+    # Encode straight from a read-only mapping of the file: the raw image is paged
+    # in from the page cache rather than copied into a bytes object first
+    with open(filename, 'rb') as img_file:
+        if os.fstat(img_file.fileno()).st_size == 0:
+            base64_data = ""
+        else:
+            with mmap.mmap(img_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                base64_data = binascii.b2a_base64(mapped, newline=False).decode('ascii')
+    return f'<img title="{img_title}" alt="{img_alt}" src="data:image/png;base64,{base64_data}" display="{display}" include_in_next_call="{include_in_next_call}">'
+
+# Native RFB connection shared by tool instances in this process
+_shared = {"rfb": None, "key": None, "unsupported": None}
+
+
+class RFBUnsupported(Exception):
+    """The server needs something the native RFB client does not implement"""
+
+
+def _parse_connection_string(connection_string: str) -> Tuple[str, int]:
+    """Inverse of _build_connection_string: host, host:display or host::port"""
+    if "::" in connection_string:
+        host, port = connection_string.split("::", 1)
+        return host, int(port)
+    if ":" in connection_string:
+        host, display = connection_string.split(":", 1)
+        return host, 5900 + int(display)
+    return connection_string, 5900
+
+
+def _vnc_auth_response(password: str, challenge: bytes) -> bytes:
+    """DES-encrypt the server's challenge with the password, as RFB VNC authentication requires"""
+    # The key is the password zero-padded to 8 bytes with each byte's bits reversed
+    key = bytes(int(f"{b:08b}"[::-1], 2) for b in password.encode("latin-1")[:8].ljust(8, b"\0"))
+    # Triple DES with the same key three times is single DES
+    encryptor = Cipher(TripleDES(key * 3), modes.ECB()).encryptor()
+    return encryptor.update(challenge) + encryptor.finalize()
+
+
+# A mouse_move to where the pointer was sent less than this many seconds ago is dropped
+_MOVE_DEDUP_WINDOW = 0.05
+
+# KeyEvent: message type 4, down flag, padding, keysym
+_KEY_EVENT = struct.Struct(">BBxxI")
+
+
+class RFBClient:
+    """
+    Minimal RFB (VNC protocol) client for pointer and key events.
+    
+    One connection is kept open across actions, so input events cost a socket
+    write instead of a vncdotool process and a fresh VNC handshake. Server
+    messages are read and discarded, since no framebuffer updates are requested.
+    """
+    
+    def __init__(self, host: str, port: int, password: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.loop = None
+        self._reader = None
+        self._writer = None
+        self._discard_task = None
+        self._x = 0
+        self._y = 0
+    
+    @property
+    def closed(self) -> bool:
+        return self._writer is None or self._writer.is_closing() or self.loop.is_closed()
+    
+    async def connect(self) -> None:
+        """Open the connection and run the RFB handshake up to ServerInit"""
+        self.loop = asyncio.get_running_loop()
+        # asyncio's TCP transports already set TCP_NODELAY, so small event writes
+        # go out immediately instead of waiting on Nagle's algorithm
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            await self._handshake()
+        except BaseException:
+            self.close()
+            raise
+        self._discard_task = asyncio.ensure_future(self._discard_server_messages())
+    
+    async def _handshake(self) -> None:
+        reader, writer = self._reader, self._writer
+        banner = await reader.readexactly(12)
+        if not banner.startswith(b"RFB "):
+            raise RFBUnsupported(f"Not an RFB server: {banner!r}")
+        server_version = (int(banner[4:7]), int(banner[8:11]))
+        version = (3, 8) if server_version >= (3, 8) else (3, 7) if server_version >= (3, 7) else (3, 3)
+        writer.write(b"RFB %03d.%03d\n" % version)
+        
+        if version >= (3, 7):
+            count = (await reader.readexactly(1))[0]
+            if count == 0:
+                raise ConnectionError(await self._read_reason())
+            offered = await reader.readexactly(count)
+            if 1 in offered:
+                security = 1
+            elif 2 in offered and self.password is not None:
+                security = 2
+            else:
+                raise RFBUnsupported(f"No supported security type in {list(offered)}")
+            writer.write(bytes([security]))
+        else:
+            (security,) = struct.unpack(">I", await reader.readexactly(4))
+            if security == 0:
+                raise ConnectionError(await self._read_reason())
+            if security not in (1, 2) or (security == 2 and self.password is None):
+                raise RFBUnsupported(f"Unsupported security type {security}")
+        
+        if security == 2:
+            if not DES_AVAILABLE:
+                raise RFBUnsupported("VNC authentication needs the cryptography package")
+            challenge = await reader.readexactly(16)
+            writer.write(_vnc_auth_response(self.password, challenge))
+        
+        # SecurityResult is always sent from 3.8, and only after VNC authentication before that
+        if security == 2 or version >= (3, 8):
+            (status,) = struct.unpack(">I", await reader.readexactly(4))
+            if status != 0:
+                reason = await self._read_reason() if version >= (3, 8) else "authentication failed"
+                raise ConnectionError(f"VNC authentication failed: {reason}")
+        
+        # ClientInit (shared session), then ServerInit: size, pixel format, name
+        writer.write(b"\x01")
+        header = await reader.readexactly(24)
+        (name_length,) = struct.unpack(">I", header[20:24])
+        await reader.readexactly(name_length)
+    
+    async def _read_reason(self) -> str:
+        (length,) = struct.unpack(">I", await self._reader.readexactly(4))
+        return (await self._reader.readexactly(length)).decode("latin-1")
+    
+    async def _discard_server_messages(self) -> None:
+        try:
+            while await self._reader.read(65536):
+                pass
+        except (OSError, asyncio.CancelledError):
+            pass
+    
+    def _pointer(self, buttons: int) -> None:
+        self._writer.write(struct.pack(">BBHH", 5, buttons, self._x, self._y))
+    
+    def _key(self, keysym: int, down: bool) -> None:
+        self._writer.write(_KEY_EVENT.pack(4, down, keysym))
+    
+    def move(self, x: int, y: int) -> None:
+        """Queue a pointer move"""
+        self._x, self._y = x, y
+        self._pointer(0)
+    
+    def click(self, button: int = 1) -> None:
+        """Queue a press and release of a mouse button at the current position"""
+        self._pointer(1 << (button - 1))
+        self._pointer(0)
+    
+    def key_press(self, key: str) -> None:
+        """Queue a key or hyphenated combination (vncdotool key names), pressed and released"""
+        names = [key] if len(key) == 1 else key.split("-")
+        try:
+            keysyms = [_VNC_KEYMAP.get(name) or ord(name) for name in names]
+        except TypeError:
+            raise ValueError(f"Unknown key: {key}")
+        for keysym in keysyms:
+            self._key(keysym, True)
+        for keysym in reversed(keysyms):
+            self._key(keysym, False)
+    
+    def type_text(self, text: str) -> None:
+        """Queue a press and release for each character, as a single write"""
+        buf = bytearray(_KEY_EVENT.size * 2 * len(text))
+        offset = 0
+        for char in text:
+            keysym = _VNC_KEYMAP.get(char) or ord(char)
+            _KEY_EVENT.pack_into(buf, offset, 4, 1, keysym)
+            _KEY_EVENT.pack_into(buf, offset + _KEY_EVENT.size, 4, 0, keysym)
+            offset += _KEY_EVENT.size * 2
+        self._writer.write(buf)
+    
+    async def flush(self) -> None:
+        """Wait until queued events have been handed to the socket"""
+        await self._writer.drain()
+    
+    def close(self) -> None:
+        if self._discard_task is not None:
+            self._discard_task.cancel()
+        if self._writer is not None and not self.loop.is_closed():
+            self._writer.close()
+
+
+def _close_shared_rfb() -> None:
+    """Drop this process's native RFB connection"""
+    client = _shared["rfb"]
+    _shared["rfb"] = None
+    if client is not None:
+        client.close()
+
+
+async def _get_rfb_client(state: Dict[str, Any], timeout: float) -> Optional[RFBClient]:
+    """
+    Native RFB connection for the server in the connection state.
+    
+    Returns None when input has to go through the vncdotool CLI instead: the
+    client is unavailable or the server needs something it does not support.
+    Connection errors are raised.
+    """
+    if _VNC_KEYMAP is None:
+        return None
+    key = (state['connection_string'], state['password'])
+    if _shared["unsupported"] == key:
+        return None
+    client = _shared["rfb"]
+    # Reconnect when the state now names another server, or the connection or its loop is gone
+    if client is not None and (_shared["key"] != key or client.closed
+                               or client.loop is not asyncio.get_running_loop()):
+        _close_shared_rfb()
+        client = None
+    if client is None:
+        host, port = _parse_connection_string(state['connection_string'])
+        client = RFBClient(host, port, state['password'])
+        try:
+            await asyncio.wait_for(client.connect(), timeout)
+        except RFBUnsupported as e:
+            logger.debug(f"Native RFB client not usable, falling back to vncdotool: {e}")
+            _shared["unsupported"] = key
+            return None
+        _shared["rfb"] = client
+        _shared["key"] = key
+    return client
+
 class VNCComputerUseTool(AsyncSmolTool):
     """
     A tool for VNC automation using vncdotool command-line interface
@@ -169,49 +521,51 @@ EXAMPLES:
                 "description": "Whether to include screenshot in next agent call (used with capture_screen and capture_region)",
                 "default": "true",
                 "required": False
+            },
+            "color_depth": {
+                "type": "integer",
+                "description": "Color depth of the saved screenshot: 24 (full), 16 or 8 (256 colors). Lower depths trade fidelity for a smaller image that is faster to encode and send (used with capture_screen and capture_region)",
+                "default": 24,
+                "required": False
             }
         }
         self.output_type = "string"
         super().__init__()
+        
+        # Last pointer position sent and when, so immediately repeated moves can be dropped
+        self._last_pointer = (None, 0.0)
+        
+        # action -> (handler, parameters passed to it, required parameters, error when one is missing)
+        capture_params = ("img_title", "img_alt", "display", "include_in_next_call", "color_depth")
+        self._actions = {
+            "connect": (self._connect, ("host", "port", "password", "timeout"), ("host",),
+                        "host is required for connect action"),
+            "disconnect": (self._disconnect, ("timeout",), (), None),
+            "mouse_move": (self._mouse_move, ("x", "y", "timeout"), ("x", "y"),
+                           "x and y coordinates are required for mouse_move action"),
+            "mouse_click": (self._mouse_click, ("x", "y", "button", "timeout"), ("x", "y"),
+                            "x and y coordinates are required for mouse_click action"),
+            "key_press": (self._key_press, ("key", "timeout"), ("key",),
+                          "key is required for key_press action"),
+            "type_text": (self._type_text, ("text", "timeout"), ("text",),
+                          "text is required for type_text action"),
+            "capture_screen": (self._capture_screen, ("filename", "timeout") + capture_params, ("filename",),
+                               "filename is required for capture_screen action"),
+            "capture_region": (self._capture_region, ("x", "y", "width", "height", "filename", "timeout") + capture_params,
+                               ("x", "y", "width", "height", "filename"),
+                               "x, y, width, height, and filename are required for capture_region action"),
+        }
     
-    @property
-    def _connected_host(self):
-        # Reload state from file to get latest updates
-        global _global_vnc_state
-        _global_vnc_state = _load_vnc_state()
-        return _global_vnc_state['connected_host']
-    
-    @_connected_host.setter
-    def _connected_host(self, value):
-        global _global_vnc_state
-        _global_vnc_state['connected_host'] = value
-        _save_vnc_state(_global_vnc_state)
-    
-    @property
-    def _connection_string(self):
-        # Reload state from file to get latest updates
-        global _global_vnc_state
-        _global_vnc_state = _load_vnc_state()
-        return _global_vnc_state['connection_string']
-    
-    @_connection_string.setter
-    def _connection_string(self, value):
-        global _global_vnc_state
-        _global_vnc_state['connection_string'] = value
-        _save_vnc_state(_global_vnc_state)
-    
-    @property
-    def _password(self):
-        # Reload state from file to get latest updates
+    async def _get_state(self) -> Dict[str, Any]:
+        """Reload the shared connection state, which another process may have changed"""
         global _global_vnc_state
-        _global_vnc_state = _load_vnc_state()
-        return _global_vnc_state['password']
+        _global_vnc_state = await _load_vnc_state_async()
+        return _global_vnc_state
     
-    @_password.setter
-    def _password(self, value):
-        global _global_vnc_state
-        _global_vnc_state['password'] = value
-        _save_vnc_state(_global_vnc_state)
+    async def _update_state(self, **fields) -> None:
+        """Update and persist fields of the shared connection state"""
+        _global_vnc_state.update(fields)
+        await _save_vnc_state_async(_global_vnc_state)
     
     def _build_connection_string(self, host: str, port: int) -> str:
         """Build VNC connection string for vncdotool command-line"""
@@ -223,22 +577,27 @@ EXAMPLES:
         else:
             return f"{host}::{port}"
     
-    async def _execute_vnc_command(self, command_args: list, timeout: float = 15) -> SmolToolResult:
-        """Execute vncdotool command-line with proper error handling"""
+    async def _execute_vnc_command(self, command_args: list, timeout: float = 15,
+                                   state: Optional[Dict[str, Any]] = None) -> SmolToolResult:
+        """
+        Execute vncdotool command-line with proper error handling.
+        
+        command_args may chain several vncdotool commands (e.g. ["key", "a", "key", "enter"]),
+        which then share one process and one VNC connection. Callers that already
+        loaded the connection state pass it in, so it is not loaded twice.
+        """
         try:
-            if not self._connection_string:
+            if state is None:
+                state = await self._get_state()
+            if not state['connection_string']:
                 return SmolToolResult(
                     error="Not connected to VNC server. Use 'connect' action first.",
                     success=False
                 )
             
-            # Build base command
-            base_cmd = ["vncdotool", "-s", self._connection_string]
-            if self._password:
-                base_cmd.extend(["-p", self._password])
-            
-            full_cmd = base_cmd + command_args
-            logger.debug(f"Executing VNC command: {' '.join(full_cmd)}")
+            full_cmd = _vncdotool_base(state['connection_string'], state['password']) + tuple(command_args)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Executing VNC command: {' '.join(full_cmd)}")
             
             # Execute command with timeout
             process = await asyncio.create_subprocess_exec(
@@ -281,16 +640,43 @@ EXAMPLES:
     async def _connect(self, host: str, port: int = 5900, password: str = None, timeout: float = 15) -> SmolToolResult:
         """Connect to a VNC server by testing connection"""
         try:
+            # A new connection may be to another server, where the pointer is elsewhere
+            self._last_pointer = (None, 0.0)
+            
             # Build connection string
             connection_string = self._build_connection_string(host, port)
             
-            # Test connection with a simple capture command
-            base_cmd = ["vncdotool", "-s", connection_string]
-            if password:
-                base_cmd.extend(["-p", password])
+            # The native RFB handshake doubles as the connection test, and leaves
+            # the connection open for the actions that follow
+            try:
+                client = await _get_rfb_client(
+                    {'connection_string': connection_string, 'password': password}, timeout
+                )
+            except asyncio.TimeoutError:
+                return SmolToolResult(
+                    error=f"Connection to VNC server timed out after {timeout} seconds",
+                    success=False
+                )
+            except (OSError, EOFError) as e:
+                return SmolToolResult(
+                    error=f"Failed to connect to VNC server: {str(e) or type(e).__name__}",
+                    success=False
+                )
+            if client is not None:
+                await self._update_state(
+                    connected_host=host,
+                    connection_string=connection_string,
+                    password=password
+                )
+                return SmolToolResult(
+                    output=f"Successfully connected to VNC server at {connection_string}",
+                    success=True
+                )
             
-            test_cmd = base_cmd + ["capture", "/tmp/vnc_connection_test.png"]
-            logger.debug(f"Testing VNC connection: {' '.join(test_cmd)}")
+            # Test connection with a simple capture command
+            test_cmd = _vncdotool_base(connection_string, password) + ("capture", "/tmp/vnc_connection_test.png")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Testing VNC connection: {' '.join(test_cmd)}")
             
             process = await asyncio.create_subprocess_exec(
                 *test_cmd,
@@ -306,9 +692,11 @@ EXAMPLES:
                 
                 if process.returncode == 0:
                     # Connection successful, store connection details
-                    self._connected_host = host
-                    self._connection_string = connection_string
-                    self._password = password
+                    await self._update_state(
+                        connected_host=host,
+                        connection_string=connection_string,
+                        password=password
+                    )
                     
                     return SmolToolResult(
                         output=f"Successfully connected to VNC server at {connection_string}",
@@ -342,17 +730,12 @@ EXAMPLES:
     async def _disconnect(self, timeout: float = 15) -> SmolToolResult:
         """Disconnect from VNC server"""
         try:
-            # Clear connection state
-            self._connected_host = None
-            self._connection_string = None
-            self._password = None
+            _close_shared_rfb()
+            self._last_pointer = (None, 0.0)
             
-            # Also remove the state file
-            try:
-                if os.path.exists(VNC_STATE_FILE):
-                    os.remove(VNC_STATE_FILE)
-            except Exception:
-                pass
+            # Clear connection state and remove the state file
+            _global_vnc_state.update(connected_host=None, connection_string=None, password=None)
+            await asyncio.to_thread(_remove_vnc_state)
             
             return SmolToolResult(
                 output="Successfully disconnected from VNC server",
@@ -365,36 +748,72 @@ EXAMPLES:
                 success=False
             )
     
+    async def _send_input(self, queue_events, command_args: list, timeout: float = 15) -> SmolToolResult:
+        """
+        Send input events over the native RFB connection, or through vncdotool when it can't be used.
+        
+        queue_events(client) queues the events on an RFBClient; command_args are the
+        equivalent vncdotool commands.
+        """
+        state = await self._get_state()
+        if state['connection_string']:
+            try:
+                client = await _get_rfb_client(state, timeout)
+                if client is not None:
+                    queue_events(client)
+                    await asyncio.wait_for(client.flush(), timeout)
+                    return SmolToolResult(output="Command executed successfully", success=True)
+            except (ValueError, struct.error) as e:
+                # Bad arguments, e.g. an unknown key or coordinates outside 0-65535
+                return SmolToolResult(error=f"VNC command failed: {str(e)}", success=False)
+            except (OSError, EOFError, asyncio.TimeoutError) as e:
+                # Drop the broken connection; vncdotool retries with a fresh one
+                logger.debug(f"Native RFB send failed, falling back to vncdotool: {e!r}")
+                _close_shared_rfb()
+        return await self._execute_vnc_command(command_args, timeout, state)
+    
     async def _mouse_move(self, x: int, y: int, timeout: float = 15) -> SmolToolResult:
         """Move mouse to coordinates"""
-        result = await self._execute_vnc_command(["mousemove", str(x), str(y)], timeout)
+        # Moving is idempotent, so a repeat of the last position within the window is a no-op
+        now = time.monotonic()
+        position, sent_at = self._last_pointer
+        if position == (x, y) and now - sent_at < _MOVE_DEDUP_WINDOW:
+            return SmolToolResult(output=f"Mouse moved to ({x}, {y})", success=True)
+        
+        result = await self._send_input(
+            lambda client: client.move(x, y),
+            ["mousemove", str(x), str(y)], timeout
+        )
         if result.success:
+            self._last_pointer = ((x, y), now)
             result.output = f"Mouse moved to ({x}, {y})"
         return result
     
     async def _mouse_click(self, x: int, y: int, button: int = 1, timeout: float = 15) -> SmolToolResult:
         """Click mouse at coordinates"""
-        # Move mouse first
-        move_result = await self._execute_vnc_command(["mousemove", str(x), str(y)], timeout)
-        if not move_result.success:
-            return move_result
+        def queue_events(client):
+            client.move(x, y)
+            client.click(button)
         
-        # Then click
-        click_result = await self._execute_vnc_command(["click", str(button)], timeout)
-        if click_result.success:
-            click_result.output = f"Mouse clicked at ({x}, {y}) with button {button}"
-        return click_result
+        # vncdotool runs chained commands in order over one connection, so move and click together
+        result = await self._send_input(
+            queue_events, ["mousemove", str(x), str(y), "click", str(button)], timeout
+        )
+        if result.success:
+            self._last_pointer = ((x, y), time.monotonic())
+            result.output = f"Mouse clicked at ({x}, {y}) with button {button}"
+        return result
     
     async def _key_press(self, key: str, timeout: float = 15) -> SmolToolResult:
         """Press a key"""
-        result = await self._execute_vnc_command(["key", key], timeout)
+        result = await self._send_input(lambda client: client.key_press(key), ["key", key], timeout)
         if result.success:
             result.output = f"Key '{key}' pressed"
         return result
     
     async def _type_text(self, text: str, timeout: float = 15) -> SmolToolResult:
         """Type text"""
-        result = await self._execute_vnc_command(["type", text], timeout)
+        result = await self._send_input(lambda client: client.type_text(text), ["type", text], timeout)
         if result.success:
             result.output = f"Typed text: {text}"
         return result
@@ -403,18 +822,24 @@ EXAMPLES:
                             img_title: str = "VNC Screenshot",
                             img_alt: str = "VNC screen capture",
                             display: str = "true",
-                            include_in_next_call: str = "true") -> SmolToolResult:
+                            include_in_next_call: str = "true",
+                            color_depth: int = 24) -> SmolToolResult:
         """Capture entire screen"""
+        # Use provided title/alt or defaults
+        img_title = img_title or "VNC Screenshot"
+        img_alt = img_alt or "VNC screen capture"
         result = await self._execute_vnc_command(["capture", filename], timeout)
-        if result.success:
+        if result.success and color_depth < 24:
+            await asyncio.to_thread(_reduce_color_depth, filename, color_depth)
+        if result.success and not _wants_image(display, include_in_next_call):
+            result.output = f"Screen captured and saved to {filename}"
+        elif result.success:
             try:
-                # Read the captured image and encode it to base64
-                with open(filename, 'rb') as img_file:
-                    img_data = img_file.read()
-                    base64_data = base64.b64encode(img_data).decode('utf-8')
-                
-                # Create the image tag with base64 data
-                img_tag = f'<img title="{img_title}" alt="{img_alt}" src="data:image/png;base64,{base64_data}" display="{display}" include_in_next_call="{include_in_next_call}">'
+                # Create the image tag with the captured image as base64 data; the file
+                # read runs on a worker thread so it does not block the event loop
+                img_tag = await asyncio.to_thread(
+                    _image_tag, filename, img_title, img_alt, display, include_in_next_call
+                )
                 
                 # Return both the success message and the image tag
                 result.output = f"Screen captured and saved to {filename}\n{img_tag}"
@@ -427,36 +852,44 @@ EXAMPLES:
                             img_title: str = "VNC Region Screenshot",
                             img_alt: str = None,
                             display: str = "true",
-                            include_in_next_call: str = "true") -> SmolToolResult:
+                            include_in_next_call: str = "true",
+                            color_depth: int = 24) -> SmolToolResult:
         """Capture a region of the screen"""
-        # vncdotool command-line doesn't have direct region capture, so we'll use capture and note the limitation
-        result = await self._execute_vnc_command(["capture", filename], timeout)
-        if result.success:
+        # Use provided title or default; the alt text default depends on the region
+        img_title = img_title or "VNC Region Screenshot"
+        # rcapture crops to the region before saving, so only the region is written and encoded
+        result = await self._execute_vnc_command(
+            ["rcapture", filename, str(x), str(y), str(width), str(height)], timeout
+        )
+        if result.success and color_depth < 24:
+            await asyncio.to_thread(_reduce_color_depth, filename, color_depth)
+        if result.success and not _wants_image(display, include_in_next_call):
+            result.output = f"Region ({x},{y}) {width}x{height} captured and saved to {filename}"
+        elif result.success:
             try:
-                # Read the captured image and encode it to base64
-                with open(filename, 'rb') as img_file:
-                    img_data = img_file.read()
-                    base64_data = base64.b64encode(img_data).decode('utf-8')
-                
                 # Use provided alt text or generate default
                 if img_alt is None:
                     img_alt = f"VNC region capture at ({x},{y}) {width}x{height}"
                 
-                # Create the image tag with base64 data
-                img_tag = f'<img title="{img_title}" alt="{img_alt}" src="data:image/png;base64,{base64_data}" display="{display}" include_in_next_call="{include_in_next_call}">'
+                # Create the image tag with the captured image as base64 data; the file
+                # read runs on a worker thread so it does not block the event loop
+                img_tag = await asyncio.to_thread(
+                    _image_tag, filename, img_title, img_alt, display, include_in_next_call
+                )
                 
                 # Return both the success message and the image tag
-                result.output = f"Screen captured to {filename} (Note: vncdotool command-line doesn't support region capture, full screen captured instead)\n{img_tag}"
+                result.output = f"Region ({x},{y}) {width}x{height} captured and saved to {filename}\n{img_tag}"
             except Exception as e:
                 logger.error(f"Error encoding image to base64: {str(e)}")
-                result.output = f"Screen captured to {filename} (Note: vncdotool command-line doesn't support region capture, full screen captured instead) (base64 encoding failed: {str(e)})"
+                result.output = f"Region ({x},{y}) {width}x{height} captured and saved to {filename} (base64 encoding failed: {str(e)})"
         return result
     
     async def execute(self, action: str, host: str = None, port: int = 5900, password: str = None,
                      x: int = None, y: int = None, button: int = 1, key: str = None,
                      text: str = None, filename: str = None, width: int = None, height: int = None,
                      timeout: float = 15, img_title: str = None, img_alt: str = None,
-                     display: str = "true", include_in_next_call: str = "true", **kwargs) -> SmolToolResult:
+                     display: str = "true", include_in_next_call: str = "true", color_depth: int = 24,
+                     **kwargs) -> SmolToolResult:
         """
         Execute VNC automation action using reliable command-line vncdotool.
         
@@ -471,9 +904,10 @@ EXAMPLES:
             key (str): Key to press
             text (str): Text to type
             filename (str): Filename for screen capture
-            width (int): Width for region capture (not supported in command-line mode)
-            height (int): Height for region capture (not supported in command-line mode)
+            width (int): Width for region capture
+            height (int): Height for region capture
             timeout (float): Timeout for the VNC operation in seconds (default: 15)
+            color_depth (int): Color depth of captures: 24, 16 or 8 (default: 24)
             
         Returns:
             SmolToolResult: Result of the VNC operation
@@ -481,75 +915,36 @@ EXAMPLES:
         try:
             logger.debug(f"VNC action: {action} with timeout: {timeout}")
             
-            if action == "connect":
-                if not host:
-                    return SmolToolResult(
-                        error="host is required for connect action",
-                        success=False
-                    )
-                return await self._connect(host, port, password, timeout)
-            
-            elif action == "disconnect":
-                return await self._disconnect(timeout)
-            
-            elif action == "mouse_move":
-                if x is None or y is None:
-                    return SmolToolResult(
-                        error="x and y coordinates are required for mouse_move action",
-                        success=False
-                    )
-                return await self._mouse_move(x, y, timeout)
-            
-            elif action == "mouse_click":
-                if x is None or y is None:
-                    return SmolToolResult(
-                        error="x and y coordinates are required for mouse_click action",
-                        success=False
-                    )
-                return await self._mouse_click(x, y, button, timeout)
-            
-            elif action == "key_press":
-                if not key:
-                    return SmolToolResult(
-                        error="key is required for key_press action",
-                        success=False
-                    )
-                return await self._key_press(key, timeout)
-            
-            elif action == "type_text":
-                if not text:
-                    return SmolToolResult(
-                        error="text is required for type_text action",
-                        success=False
-                    )
-                return await self._type_text(text, timeout)
-            
-            elif action == "capture_screen":
-                if not filename:
-                    return SmolToolResult(
-                        error="filename is required for capture_screen action",
-                        success=False
-                    )
-                # Use provided title/alt or defaults
-                title = img_title or "VNC Screenshot"
-                alt = img_alt or "VNC screen capture"
-                return await self._capture_screen(filename, timeout, title, alt, display, include_in_next_call)
-            
-            elif action == "capture_region":
-                if x is None or y is None or width is None or height is None or not filename:
-                    return SmolToolResult(
-                        error="x, y, width, height, and filename are required for capture_region action",
-                        success=False
-                    )
-                # Use provided title or default
-                title = img_title or "VNC Region Screenshot"
-                return await self._capture_region(x, y, width, height, filename, timeout, title, img_alt, display, include_in_next_call)
-            
-            else:
+            entry = self._actions.get(action)
+            if entry is None:
                 return SmolToolResult(
-                    error=f"Unknown action: {action}. Available actions: connect, disconnect, mouse_move, mouse_click, key_press, type_text, capture_screen, capture_region",
+                    error=f"Unknown action: {action}. Available actions: {', '.join(self._actions)}",
                     success=False
                 )
+            handler, params, required, missing_error = entry
+            args = {
+                "host": host,
+                "port": port,
+                "password": password,
+                "x": x,
+                "y": y,
+                "button": button,
+                "key": key,
+                "text": text,
+                "filename": filename,
+                "width": width,
+                "height": height,
+                "timeout": timeout,
+                "img_title": img_title,
+                "img_alt": img_alt,
+                "display": display,
+                "include_in_next_call": include_in_next_call,
+                "color_depth": color_depth,
+            }
+            # Empty strings count as missing too; 0 is a valid coordinate
+            if any(args[name] is None or args[name] == "" for name in required):
+                return SmolToolResult(error=missing_error, success=False)
+            return await handler(*[args[name] for name in params])
                 
         except Exception as e:
             logger.error(f"VNC tool error: {str(e)}")
@@ -572,6 +967,15 @@ EXAMPLES:
 class SimpleVNCComputerUseTool(AsyncSmolTool):
     """Simplified VNC tool for basic operations using command-line vncdotool"""
     
+    # Full tool that performs the operations; connection state is module-level, so one is shared
+    _full_tool = None
+    
+    @classmethod
+    def _get_full_tool(cls) -> VNCComputerUseTool:
+        if cls._full_tool is None:
+            cls._full_tool = VNCComputerUseTool()
+        return cls._full_tool
+    
     def __init__(self):
         self.name = "simple_vnc_computer"
         self.description = """A simplified VNC automation tool using reliable command-line vncdotool for basic operations."""
@@ -650,7 +1054,7 @@ class SimpleVNCComputerUseTool(AsyncSmolTool):
         """
         try:
             # Use the full VNC tool for actual operations
-            full_tool = VNCComputerUseTool()
+            full_tool = self._get_full_tool()
             
             if action == "connect":
                 return await full_tool._connect(host, port, password, timeout)
@@ -663,8 +1067,10 @@ class SimpleVNCComputerUseTool(AsyncSmolTool):
                         success=False
                     )
                 # Set connection details for the operation
-                full_tool._connection_string = full_tool._build_connection_string(host or "localhost", port)
-                full_tool._password = password
+                await full_tool._update_state(
+                    connection_string=full_tool._build_connection_string(host or "localhost", port),
+                    password=password
+                )
                 return await full_tool._mouse_click(x, y, 1, timeout)
             elif action == "key_press":
                 if not key:
@@ -673,8 +1079,10 @@ class SimpleVNCComputerUseTool(AsyncSmolTool):
                         success=False
                     )
                 # Set connection details for the operation
-                full_tool._connection_string = full_tool._build_connection_string(host or "localhost", port)
-                full_tool._password = password
+                await full_tool._update_state(
+                    connection_string=full_tool._build_connection_string(host or "localhost", port),
+                    password=password
+                )
                 return await full_tool._key_press(key, timeout)
             elif action == "type_text":
                 if not text:
@@ -683,8 +1091,10 @@ class SimpleVNCComputerUseTool(AsyncSmolTool):
                         success=False
                     )
                 # Set connection details for the operation
-                full_tool._connection_string = full_tool._build_connection_string(host or "localhost", port)
-                full_tool._password = password
+                await full_tool._update_state(
+                    connection_string=full_tool._build_connection_string(host or "localhost", port),
+                    password=password
+                )
                 return await full_tool._type_text(text, timeout)
             else:
                 return SmolToolResult(
@@ -3,10 +3,218 @@ Web crawling tool adapted for smolagents
 """
 
 import asyncio
+import atexit
+import functools
+import importlib.util
+import itertools
+import json
 from typing import Optional, List, Dict, Any
 from crawl4ai import AsyncWebCrawler
+from ._cache import _TTLCache, _cache_key, _single_flight
 from .base import AsyncSmolTool, SmolToolResult
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# selectolax is optional: a C HTML parser used to pull text out of plainly fetched pages
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+# orjson is optional: much faster than the stdlib for large extraction payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Process-wide crawler shared by WebCrawlerTool and SimpleWebScraperTool, so the
+# browser behind it starts once, plus a pooled HTTP session for plain page fetches
+# that need no browser. Both are bound to the loop that started them.
+_shared: Dict[str, Any] = {"crawler": None, "http": None, "loop": None, "lock": None}
+
+# Pages at least this large are formatted in a worker thread; below it the hand-off costs more
+_FORMAT_IN_THREAD_CHARS = 256_000
+
+# A page with scripts but less visible text than this is probably rendered client-side
+_MIN_STATIC_TEXT = 200
+
+_HTTP_MAX_CONNECTIONS = 100
+_HTTP_MAX_PER_HOST = 20
+
+# Compressed HTML is a fraction of the bytes on the wire. aiohttp decodes brotli only
+# when a brotli package is installed, so br is advertised only then.
+_HAS_BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+_ACCEPT_ENCODING = "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
+
+# Caps on what a crawl keeps in its artifacts; whole pages are rarely needed downstream
+_ARTIFACT_MAX_CHARS = 64_000
+_ARTIFACT_MAX_LINKS = 50
+_ARTIFACT_MAX_MEDIA = 20
+
+# Plainly fetched pages with their ETag/Last-Modified validators, for conditional GETs
+_VALIDATOR_TTL = 3600
+_page_validators = _TTLCache(max_size=32)
+
+# Recent successful basic-strategy crawls, keyed by URL and crawl options
+_CACHE_TTL = 300
+_crawl_cache = _TTLCache(max_size=64)
+# Crawls currently running, so identical concurrent calls share one page load
+_crawl_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _bind_shared_to_loop() -> None:
+    """Objects from another loop cannot be used here; start over for the running loop"""
+    loop = asyncio.get_running_loop()
+    if _shared["loop"] is not loop:
+        _shared.update(crawler=None, http=None, loop=loop, lock=asyncio.Lock())
+
+
+async def _get_shared_crawler() -> AsyncWebCrawler:
+    """Return the shared crawler, starting it on first use"""
+    _bind_shared_to_loop()
+    async with _shared["lock"]:
+        if _shared["crawler"] is None:
+            crawler = AsyncWebCrawler(verbose=False)
+            await crawler.__aenter__()
+            _shared["crawler"] = crawler
+        return _shared["crawler"]
+
+
+async def _get_shared_http() -> "aiohttp.ClientSession":
+    """Return the shared keep-alive HTTP session, creating it on first use"""
+    _bind_shared_to_loop()
+    session = _shared["http"]
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=_HTTP_MAX_CONNECTIONS, limit_per_host=_HTTP_MAX_PER_HOST)
+        session = _shared["http"] = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Accept-Encoding": _ACCEPT_ENCODING},
+            auto_decompress=True
+        )
+    return session
+
+
+async def _fetch_page(url: str, timeout: int = 30) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a page with a plain GET on the shared session.
+    
+    Returns a page entry with the document under "html", or None when the response
+    is not a successful HTML document, so the caller can fall back to the
+    browser-backed crawler. Pages that came with an ETag or Last-Modified header
+    are remembered and revalidated on the next fetch; a 304 reuses the stored
+    entry, including anything the caller derived from it (such as its text).
+    """
+    session = await _get_shared_http()
+    cached = _page_validators.get(url)
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+    
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        if response.status == 304 and cached is not None:
+            return cached
+        content_type = response.headers.get("content-type", "")
+        if response.status != 200 or "html" not in content_type:
+            return None
+        page = {
+            "html": await response.text(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+    
+    if page["etag"] or page["last_modified"]:
+        _page_validators.set(url, page, _VALIDATOR_TTL)
+    return page
+
+
+def _html_to_text(html: str, static_only: bool = False) -> Optional[str]:
+    """
+    Visible text of an HTML document.
+    
+    With static_only, returns None when the page has scripts but almost no text
+    of its own, since its content is then most likely rendered client-side and
+    needs a browser.
+    """
+    tree = HTMLParser(html)
+    has_scripts = tree.css_first("script") is not None
+    tree.strip_tags(["script", "style", "noscript", "template"])
+    root = tree.body or tree.root
+    text = root.text(separator=" ", strip=True) if root is not None else ""
+    if static_only and has_scripts and len(text) < _MIN_STATIC_TEXT:
+        return None
+    return text
+
+
+def _as_text(value: Any) -> str:
+    """Render extracted content for display; strings (usually JSON already) pass through unchanged"""
+    if isinstance(value, str):
+        return value
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _preview(text: str, limit: int) -> str:
+    """text cut to limit characters, with an ellipsis when anything was cut"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _clip(text: Optional[str], limit: int) -> Optional[str]:
+    """First limit characters of text; a limit of 0 or less keeps everything"""
+    if not text or limit <= 0 or len(text) <= limit:
+        return text
+    return text[:limit]
+
+
+def _clip_items(items: Any, limit: int) -> Any:
+    """First limit entries of a list, or of each list in a dict grouping them (e.g. internal/external links)"""
+    if isinstance(items, list):
+        return items[:limit]
+    if isinstance(items, dict):
+        return {key: _clip_items(value, limit) for key, value in items.items()}
+    return items
+
+
+async def _close_shared_crawler() -> None:
+    """Shut down the shared crawler, its browser and the shared HTTP session"""
+    crawler, session = _shared["crawler"], _shared["http"]
+    _shared.update(crawler=None, http=None)
+    if session is not None:
+        await session.close()
+    if crawler is not None:
+        await crawler.__aexit__(None, None, None)
+
+
+@atexit.register
+def _shutdown_shared_crawler() -> None:
+    """Close the shared crawler and session at interpreter exit if their loop is still running"""
+    loop = _shared["loop"]
+    if loop is None or not loop.is_running():
+        return
+    if _shared["crawler"] is None and _shared["http"] is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_crawler(), loop).result(timeout=5)
+    except Exception:
+        pass
+
 
 class WebCrawlerTool(AsyncSmolTool):
     """
@@ -14,74 +222,111 @@ class WebCrawlerTool(AsyncSmolTool):
     Adapted from OpenManus Crawl4aiTool
     """
     
+    _INPUTS = {
+        "url": {
+            "type": "string",
+            "description": "URL to crawl (required unless urls is given)",
+            "required": False
+        },
+        "urls": {
+            "type": "array",
+            "description": "Several URLs to crawl concurrently in one call, instead of url",
+            "required": False
+        },
+        "max_concurrency": {
+            "type": "integer",
+            "description": "Maximum number of urls crawled at the same time",
+            "default": 5,
+            "required": False
+        },
+        "extraction_strategy": {
+            "type": "string",
+            "description": "Extraction strategy: basic, llm, css, xpath",
+            "default": "basic",
+            "required": False
+        },
+        "css_selector": {
+            "type": "string",
+            "description": "CSS selector for targeted extraction (when using css strategy)",
+            "required": False
+        },
+        "xpath": {
+            "type": "string",
+            "description": "XPath expression for targeted extraction (when using xpath strategy)",
+            "required": False
+        },
+        "word_count_threshold": {
+            "type": "integer",
+            "description": "Minimum word count for content blocks",
+            "default": 10,
+            "required": False
+        },
+        "only_text": {
+            "type": "boolean",
+            "description": "Extract only text content",
+            "default": True,
+            "required": False
+        },
+        "include_links": {
+            "type": "boolean",
+            "description": "Include links in extraction",
+            "default": False,
+            "required": False
+        },
+        "include_images": {
+            "type": "boolean",
+            "description": "Include images in extraction",
+            "default": False,
+            "required": False
+        },
+        "wait_for": {
+            "type": "string",
+            "description": "CSS selector to wait for before extraction",
+            "required": False
+        },
+        "timeout": {
+            "type": "integer",
+            "description": "Request timeout in seconds",
+            "default": 30,
+            "required": False
+        },
+        "artifact_max_chars": {
+            "type": "integer",
+            "description": "Maximum characters of cleaned HTML and markdown kept in the result artifacts (0 for no limit)",
+            "default": _ARTIFACT_MAX_CHARS,
+            "required": False
+        },
+        "include_raw_html": {
+            "type": "boolean",
+            "description": "Also keep the page's raw HTML in the result artifacts",
+            "default": False,
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "web_crawler"
         self.description = """A tool for crawling web pages and extracting structured content. Can extract text, links, images, and perform smart content extraction."""
         
-        self.inputs = {
-            "url": {
-                "type": "string",
-                "description": "URL to crawl",
-                "required": True
-            },
-            "extraction_strategy": {
-                "type": "string",
-                "description": "Extraction strategy: basic, llm, css, xpath",
-                "default": "basic",
-                "required": False
-            },
-            "css_selector": {
-                "type": "string",
-                "description": "CSS selector for targeted extraction (when using css strategy)",
-                "required": False
-            },
-            "xpath": {
-                "type": "string",
-                "description": "XPath expression for targeted extraction (when using xpath strategy)",
-                "required": False
-            },
-            "word_count_threshold": {
-                "type": "integer",
-                "description": "Minimum word count for content blocks",
-                "default": 10,
-                "required": False
-            },
-            "only_text": {
-                "type": "boolean",
-                "description": "Extract only text content",
-                "default": True,
-                "required": False
-            },
-            "include_links": {
-                "type": "boolean",
-                "description": "Include links in extraction",
-                "default": False,
-                "required": False
-            },
-            "include_images": {
-                "type": "boolean",
-                "description": "Include images in extraction",
-                "default": False,
-                "required": False
-            },
-            "wait_for": {
-                "type": "string",
-                "description": "CSS selector to wait for before extraction",
-                "required": False
-            },
-            "timeout": {
-                "type": "integer",
-                "description": "Request timeout in seconds",
-                "default": 30,
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
     
     async def _extract_with_basic_strategy(self, crawler, url: str, **kwargs) -> Dict[str, Any]:
         """Extract content using basic strategy"""
-        result = await crawler.arun(
+        cache_ttl = kwargs.get('cache_ttl', _CACHE_TTL)
+        key = _cache_key(
+            u=url,
+            w=kwargs.get('word_count_threshold', 10),
+            o=kwargs.get('only_text', True),
+            f=kwargs.get('wait_for'),
+        )
+        result = _crawl_cache.get(key) if cache_ttl else None
+        if result is not None:
+            return result
+        
+        crawl = functools.partial(
+            crawler.arun,
             url=url,
             word_count_threshold=kwargs.get('word_count_threshold', 10),
             only_text=kwargs.get('only_text', True),
@@ -89,6 +334,9 @@ class WebCrawlerTool(AsyncSmolTool):
             wait_for=kwargs.get('wait_for'),
             timeout=kwargs.get('timeout', 30)
         )
+        result = await _single_flight(_crawl_inflight, key, crawl)
+        if result.success:
+            _crawl_cache.set(key, result, cache_ttl)
         return result
     
     async def _extract_with_css_strategy(self, crawler, url: str, css_selector: str, **kwargs) -> Dict[str, Any]:
@@ -128,59 +376,98 @@ class WebCrawlerTool(AsyncSmolTool):
         )
         return result
     
-    async def _format_result(self, result: Dict[str, Any], include_links: bool = False, 
-                           include_images: bool = False) -> str:
-        """Format crawling result for output"""
+    def _format_result(self, result, include_links: bool = False, 
+                       include_images: bool = False, plain_text: bool = False) -> str:
+        """
+        Format a crawl4ai result object for output.
+        
+        With plain_text, the content is the page's visible text taken straight from
+        its HTML by selectolax rather than crawl4ai's cleaned HTML, when available.
+        """
         output_parts = []
         
         # Basic info
-        if result.get('url'):
-            output_parts.append(f"URL: {result['url']}")
+        url = getattr(result, 'url', None)
+        if url:
+            output_parts.append(f"URL: {url}")
         
-        if result.get('title'):
-            output_parts.append(f"Title: {result['title']}")
+        title = getattr(result, 'title', None)
+        if title:
+            output_parts.append(f"Title: {title}")
         
         # Main content
-        if result.get('cleaned_html'):
-            content = result['cleaned_html'][:2000]
-            if len(result['cleaned_html']) > 2000:
-                content += "..."
-            output_parts.append(f"Content:\n{content}")
-        elif result.get('markdown'):
-            content = result['markdown'][:2000]
-            if len(result['markdown']) > 2000:
-                content += "..."
-            output_parts.append(f"Content (Markdown):\n{content}")
+        html = getattr(result, 'html', None) if plain_text and SELECTOLAX_AVAILABLE else None
+        text = _html_to_text(html) if html else None
+        cleaned_html = getattr(result, 'cleaned_html', None)
+        markdown = getattr(result, 'markdown', None)
+        if text or cleaned_html:
+            output_parts.append(f"Content:\n{_preview(text or cleaned_html, 2000)}")
+        elif markdown:
+            output_parts.append(f"Content (Markdown):\n{_preview(markdown, 2000)}")
         
         # Links
-        if include_links and result.get('links'):
-            links = result['links'][:10]  # Limit to first 10 links
+        all_links = getattr(result, 'links', None)
+        if include_links and all_links:
+            links = all_links[:10]  # Limit to first 10 links
             links_text = "\n".join([f"- {link.get('text', 'No text')}: {link.get('href', 'No URL')}" 
                                    for link in links])
             output_parts.append(f"Links:\n{links_text}")
         
         # Images
-        if include_images and result.get('media'):
-            images = [item for item in result['media'] if item.get('type') == 'image'][:5]
+        media = getattr(result, 'media', None)
+        if include_images and media:
+            # Stop scanning once five images are found rather than filtering the whole list
+            images = list(itertools.islice((item for item in media if item.get('type') == 'image'), 5))
             if images:
                 images_text = "\n".join([f"- {img.get('alt', 'No alt')}: {img.get('src', 'No src')}" 
                                         for img in images])
                 output_parts.append(f"Images:\n{images_text}")
         
         # Extracted data
-        if result.get('extracted_content'):
-            extracted = str(result['extracted_content'])[:1000]
-            if len(str(result['extracted_content'])) > 1000:
-                extracted += "..."
-            output_parts.append(f"Extracted Data:\n{extracted}")
+        extracted_content = getattr(result, 'extracted_content', None)
+        if extracted_content:
+            output_parts.append(f"Extracted Data:\n{_preview(_as_text(extracted_content), 1000)}")
         
         return "\n\n".join(output_parts)
     
-    async def execute(self, url: str, extraction_strategy: str = "basic", 
+    async def _format_result_async(self, result, **options) -> str:
+        """Format a result, in a worker thread for large pages so parsing them does not stall the loop"""
+        size = max(len(getattr(result, 'html', None) or ""), len(getattr(result, 'cleaned_html', None) or ""))
+        if size < _FORMAT_IN_THREAD_CHARS:
+            return self._format_result(result, **options)
+        return await asyncio.to_thread(self._format_result, result, **options)
+    
+    async def _crawl(self, crawler, url: str, extraction_strategy: str,
+                     css_selector: str = None, **options) -> Any:
+        """Crawl one URL with an extraction strategy that execute has already validated"""
+        if extraction_strategy == "basic":
+            return await self._extract_with_basic_strategy(crawler, url, **options)
+        if extraction_strategy == "css":
+            return await self._extract_with_css_strategy(crawler, url, css_selector, **options)
+        return await self._extract_with_llm_strategy(crawler, url, **options)
+    
+    @staticmethod
+    def _artifacts(result, max_chars: int = _ARTIFACT_MAX_CHARS,
+                   include_raw_html: bool = False) -> Dict[str, Any]:
+        """Artifacts kept for a successful crawl, clipped so large pages are not held in full"""
+        artifacts = {
+            "cleaned_html": _clip(result.cleaned_html, max_chars),
+            "markdown": _clip(result.markdown, max_chars),
+            "links": _clip_items(result.links, _ARTIFACT_MAX_LINKS),
+            "media": _clip_items(result.media, _ARTIFACT_MAX_MEDIA)
+        }
+        if include_raw_html:
+            artifacts["raw_html"] = _clip(result.html, max_chars)
+        return artifacts
+    
+    async def execute(self, url: str = None, extraction_strategy: str = "basic", 
                      css_selector: str = None, xpath: str = None,
                      word_count_threshold: int = 10, only_text: bool = True,
                      include_links: bool = False, include_images: bool = False,
-                     wait_for: str = None, timeout: int = 30, **kwargs) -> SmolToolResult:
+                     wait_for: str = None, timeout: int = 30,
+                     cache_ttl: int = _CACHE_TTL, urls: List[str] = None,
+                     max_concurrency: int = 5, artifact_max_chars: int = _ARTIFACT_MAX_CHARS,
+                     include_raw_html: bool = False, **kwargs) -> SmolToolResult:
         """
         Crawl and extract content from a web page.
         
@@ -195,150 +482,211 @@ class WebCrawlerTool(AsyncSmolTool):
             include_images (bool): Include images in output
             wait_for (str): CSS selector to wait for
             timeout (int): Request timeout in seconds
+            cache_ttl (int): Seconds to reuse a basic crawl of this page for; 0 disables the cache
+            urls (List[str]): URLs to crawl concurrently instead of url
+            max_concurrency (int): Maximum number of urls crawled at the same time
+            artifact_max_chars (int): Maximum characters of cleaned HTML and markdown kept in artifacts
+            include_raw_html (bool): Also keep the raw HTML in artifacts
             
         Returns:
             SmolToolResult: Crawling result with extracted content
         """
+        if not url and not urls:
+            return SmolToolResult(error="url or urls is required", success=False)
+        
+        if extraction_strategy == "css":
+            if not css_selector:
+                return SmolToolResult(
+                    error="css_selector is required for css extraction strategy",
+                    success=False
+                )
+        elif extraction_strategy == "xpath":
+            if not xpath:
+                return SmolToolResult(
+                    error="xpath is required for xpath extraction strategy",
+                    success=False
+                )
+            # XPath strategy would need custom implementation
+            return SmolToolResult(
+                error="XPath extraction strategy not yet implemented",
+                success=False
+            )
+        elif extraction_strategy not in ("basic", "llm"):
+            return SmolToolResult(
+                error=f"Unknown extraction strategy: {extraction_strategy}",
+                success=False
+            )
+        
+        options = {
+            "word_count_threshold": word_count_threshold,
+            "only_text": only_text,
+            "wait_for": wait_for,
+            "timeout": timeout,
+            "cache_ttl": cache_ttl
+        }
+        make_artifacts = functools.partial(
+            self._artifacts,
+            max_chars=artifact_max_chars if artifact_max_chars is not None else _ARTIFACT_MAX_CHARS,
+            include_raw_html=bool(include_raw_html)
+        )
+        
         try:
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                
-                if extraction_strategy == "basic":
-                    result = await self._extract_with_basic_strategy(
-                        crawler, url, 
-                        word_count_threshold=word_count_threshold,
-                        only_text=only_text,
-                        wait_for=wait_for,
-                        timeout=timeout
-                    )
-                
-                elif extraction_strategy == "css":
-                    if not css_selector:
-                        return SmolToolResult(
-                            error="css_selector is required for css extraction strategy",
-                            success=False
-                        )
-                    result = await self._extract_with_css_strategy(
-                        crawler, url, css_selector,
-                        word_count_threshold=word_count_threshold,
-                        wait_for=wait_for,
-                        timeout=timeout
-                    )
-                
-                elif extraction_strategy == "llm":
-                    result = await self._extract_with_llm_strategy(
-                        crawler, url,
-                        wait_for=wait_for,
-                        timeout=timeout
-                    )
-                
-                elif extraction_strategy == "xpath":
-                    if not xpath:
-                        return SmolToolResult(
-                            error="xpath is required for xpath extraction strategy",
-                            success=False
-                        )
-                    # XPath strategy would need custom implementation
-                    return SmolToolResult(
-                        error="XPath extraction strategy not yet implemented",
-                        success=False
-                    )
-                
-                else:
-                    return SmolToolResult(
-                        error=f"Unknown extraction strategy: {extraction_strategy}",
-                        success=False
-                    )
-                
-                # Check if crawling was successful
-                if not result.success:
-                    return SmolToolResult(
-                        error=f"Crawling failed: {result.error_message}",
-                        success=False
-                    )
-                
-                # Format and return result
-                formatted_output = await self._format_result(
-                    result.__dict__,
-                    include_links=include_links,
-                    include_images=include_images
+            crawler = await _get_shared_crawler()
+            
+            if urls:
+                return await self._crawl_many(
+                    crawler, urls, max_concurrency, extraction_strategy, css_selector,
+                    include_links, include_images, options, make_artifacts
                 )
-                
+            
+            result = await self._crawl(crawler, url, extraction_strategy, css_selector, **options)
+            
+            # Check if crawling was successful
+            if not result.success:
                 return SmolToolResult(
-                    output=formatted_output,
-                    success=True,
-                    artifacts={
-                        "raw_html": result.html,
-                        "cleaned_html": result.cleaned_html,
-                        "markdown": result.markdown,
-                        "links": result.links,
-                        "media": result.media
-                    }
+                    error=f"Crawling failed: {result.error_message}",
+                    success=False
                 )
-                
+            
+            # Format and return result
+            formatted_output = await self._format_result_async(
+                result,
+                include_links=include_links,
+                include_images=include_images,
+                plain_text=only_text and extraction_strategy == "basic"
+            )
+            
+            return SmolToolResult(
+                output=formatted_output,
+                success=True,
+                artifacts=make_artifacts(result)
+            )
+        
         except Exception as e:
             return SmolToolResult(
                 error=f"Web crawling failed: {str(e)}",
                 success=False
             )
+    
+    async def _crawl_many(self, crawler, urls: List[str], max_concurrency: int,
+                          extraction_strategy: str, css_selector: Optional[str],
+                          include_links: bool, include_images: bool,
+                          options: Dict[str, Any], make_artifacts) -> SmolToolResult:
+        """Crawl several URLs concurrently; one page failing does not fail the others"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or 1))
+        
+        async def crawl_one(target: str):
+            async with semaphore:
+                return await self._crawl(crawler, target, extraction_strategy, css_selector, **options)
+        
+        results = await asyncio.gather(*(crawl_one(target) for target in urls), return_exceptions=True)
+        
+        sections = []
+        pages = []
+        for target, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                error = str(result)
+            elif not result.success:
+                error = result.error_message
+            else:
+                sections.append(await self._format_result_async(
+                    result,
+                    include_links=include_links,
+                    include_images=include_images,
+                    plain_text=options["only_text"] and extraction_strategy == "basic"
+                ))
+                pages.append({"url": target, **make_artifacts(result)})
+                continue
+            sections.append(f"URL: {target}\nCrawling failed: {error}")
+            pages.append({"url": target, "error": error})
+        
+        succeeded = sum("error" not in page for page in pages)
+        return SmolToolResult(
+            output="\n\n---\n\n".join(sections),
+            error="" if succeeded else f"Crawling failed for all {len(urls)} URLs",
+            success=succeeded > 0,
+            artifacts={"pages": pages, "count": succeeded}
+        )
 
 
 class SimpleWebScraperTool(AsyncSmolTool):
     """Simple web scraper for basic content extraction"""
     
+    _INPUTS = {
+        "url": {
+            "type": "string",
+            "description": "URL to scrape",
+            "required": True
+        },
+        "format": {
+            "type": "string",
+            "description": "Output format: text, markdown, html",
+            "default": "text",
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "simple_web_scraper"
         self.description = "Simple tool for extracting text content from web pages"
         
-        self.inputs = {
-            "url": {
-                "type": "string",
-                "description": "URL to scrape",
-                "required": True
-            },
-            "format": {
-                "type": "string",
-                "description": "Output format: text, markdown, html",
-                "default": "text",
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
     
     async def execute(self, url: str, format: str = "text", **kwargs) -> SmolToolResult:
         """Simple web scraping"""
         try:
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    only_text=(format == "text"),
-                    bypass_cache=True
-                )
-                
-                if not result.success:
-                    return SmolToolResult(
-                        error=f"Scraping failed: {result.error_message}",
-                        success=False
-                    )
-                
-                if format == "text":
-                    content = result.cleaned_html or "No content extracted"
-                elif format == "markdown":
-                    content = result.markdown or "No markdown content"
-                elif format == "html":
-                    content = result.html or "No HTML content"
-                else:
-                    content = result.cleaned_html or "No content extracted"
-                
-                # Limit output size
-                if len(content) > 3000:
-                    content = content[:3000] + "..."
-                
+            if AIOHTTP_AVAILABLE and (format == "html" or (format == "text" and SELECTOLAX_AVAILABLE)):
+                # Static pages need no rendering, so try a plain GET before starting a browser
+                try:
+                    page = await _fetch_page(url, kwargs.get("timeout") or 30)
+                    if page is None:
+                        content = None
+                    elif format == "html":
+                        content = page["html"]
+                    else:
+                        # Kept on the page entry, so a 304 on the next fetch skips parsing too
+                        if "text" not in page:
+                            page["text"] = _html_to_text(page["html"], static_only=True)
+                        content = page["text"]
+                except Exception:
+                    content = None
+                if content is not None:
+                    content = _preview(content, 3000)
+                    empty = "No HTML content" if format == "html" else "No content extracted"
+                    return SmolToolResult(output=content or empty, success=True)
+            
+            crawler = await _get_shared_crawler()
+            result = await crawler.arun(
+                url=url,
+                only_text=(format == "text"),
+                bypass_cache=True
+            )
+            
+            if not result.success:
                 return SmolToolResult(
-                    output=content,
-                    success=True
+                    error=f"Scraping failed: {result.error_message}",
+                    success=False
                 )
-                
+            
+            if format == "text":
+                content = result.cleaned_html or "No content extracted"
+            elif format == "markdown":
+                content = result.markdown or "No markdown content"
+            elif format == "html":
+                content = result.html or "No HTML content"
+            else:
+                content = result.cleaned_html or "No content extracted"
+            
+            # Limit output size
+            content = _preview(content, 3000)
+            
+            return SmolToolResult(
+                output=content,
+                success=True
+            )
+        
         except Exception as e:
             return SmolToolResult(
                 error=f"Web scraping failed: {str(e)}",
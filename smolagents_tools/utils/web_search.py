@@ -3,7 +3,10 @@ Web search tool adapted for smolagents
 """
 
 import asyncio
+import functools
+import threading
 from typing import List, Dict, Any, Optional
+from ._cache import _TTLCache, _cache_key, _single_flight
 from .base import AsyncSmolTool, SmolToolResult
 
 try:
@@ -18,6 +21,26 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+_RULE = "=" * 50
+
+# Recent result lists, so an agent repeating a query does not go back to the network
+_CACHE_TTL = 300
+_search_cache = _TTLCache(max_size=256)
+# Searches currently running, so identical concurrent calls share one request
+_search_inflight: Dict[str, asyncio.Future] = {}
+
+# One DDGS client per worker thread, kept for the thread's lifetime so searches reuse
+# its HTTP session and connections instead of opening new ones every call
+_ddgs_local = threading.local()
+
+
+def _get_ddgs() -> "DDGS":
+    """Return this thread's DDGS client, creating it on first use"""
+    ddgs = getattr(_ddgs_local, "ddgs", None)
+    if ddgs is None:
+        ddgs = _ddgs_local.ddgs = DDGS()
+    return ddgs
+
 
 class WebSearchTool(AsyncSmolTool):
     """
@@ -25,98 +48,151 @@ class WebSearchTool(AsyncSmolTool):
     Adapted from OpenManus WebSearch
     """
     
+    _INPUTS = {
+        "query": {
+            "type": "string",
+            "description": "The search query",
+            "required": True
+        },
+        "engine": {
+            "type": "string",
+            "description": "Search engine to use: duckduckgo, google, bing, or all to query every engine at once",
+            "default": "duckduckgo",
+            "required": False
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10,
+            "required": False
+        },
+        "region": {
+            "type": "string",
+            "description": "Region for search results (e.g., 'us-en', 'uk-en')",
+            "default": "us-en",
+            "required": False
+        },
+        "time_range": {
+            "type": "string",
+            "description": "Time range for results: d (day), w (week), m (month), y (year)",
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "web_search"
         self.description = """Search the web using various search engines (DuckDuckGo, Google, Bing). Returns search results with titles, URLs, and snippets."""
         
-        self.inputs = {
-            "query": {
-                "type": "string",
-                "description": "The search query",
-                "required": True
-            },
-            "engine": {
-                "type": "string",
-                "description": "Search engine to use: duckduckgo, google, bing",
-                "default": "duckduckgo",
-                "required": False
-            },
-            "max_results": {
-                "type": "integer",
-                "description": "Maximum number of results to return",
-                "default": 10,
-                "required": False
-            },
-            "region": {
-                "type": "string",
-                "description": "Region for search results (e.g., 'us-en', 'uk-en')",
-                "default": "us-en",
-                "required": False
-            },
-            "time_range": {
-                "type": "string",
-                "description": "Time range for results: d (day), w (week), m (month), y (year)",
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
+        
+        # engine name -> search coroutine; all take (query, max_results, region=, time_range=, timeout=)
+        self._engines = {
+            "duckduckgo": self._search_duckduckgo,
+            "google": self._search_google,
+            "bing": self._search_bing,
+            "all": self._search_all,
+        }
+        # Engines that have no backend of their own yet and are served by another
+        self._fallbacks = {"google": "duckduckgo", "bing": "duckduckgo"}
     
     async def _search_duckduckgo(self, query: str, max_results: int = 10, 
-                                region: str = "us-en", time_range: str = None) -> List[Dict[str, Any]]:
+                                region: str = "us-en", time_range: str = None,
+                                **kwargs) -> List[Dict[str, Any]]:
         """Search using DuckDuckGo"""
         if not DDGS_AVAILABLE:
             raise ImportError("duckduckgo-search not available. Install with: pip install duckduckgo-search")
         
+        kwargs = {
+            "keywords": query,
+            "region": region,
+            "max_results": max_results
+        }
+        if time_range:
+            kwargs["timelimit"] = time_range
+        
+        def search() -> List[Dict[str, Any]]:
+            return list(_get_ddgs().text(**kwargs))
+        
         try:
-            with DDGS() as ddgs:
-                kwargs = {
-                    "keywords": query,
-                    "region": region,
-                    "max_results": max_results
-                }
-                if time_range:
-                    kwargs["timelimit"] = time_range
-                
-                results = list(ddgs.text(**kwargs))
-                return results
+            # DDGS is blocking; run it off the event loop so other calls keep going
+            return await asyncio.to_thread(search)
         except Exception as e:
             raise Exception(f"DuckDuckGo search failed: {str(e)}")
     
-    async def _search_google(self, query: str, max_results: int = 10, **kwargs) -> List[Dict[str, Any]]:
+    async def _search_google(self, query: str, max_results: int = 10, region: str = "us-en",
+                             time_range: str = None, **kwargs) -> List[Dict[str, Any]]:
         """Search using Google (via SerpAPI or similar)"""
         # This would require a Google API key or SerpAPI
         # For now, fall back to DuckDuckGo
-        return await self._search_duckduckgo(query, max_results)
+        return await self._search_duckduckgo(query, max_results, region=region, time_range=time_range)
     
-    async def _search_bing(self, query: str, max_results: int = 10, **kwargs) -> List[Dict[str, Any]]:
+    async def _search_bing(self, query: str, max_results: int = 10, region: str = "us-en",
+                           time_range: str = None, **kwargs) -> List[Dict[str, Any]]:
         """Search using Bing"""
         # This would require Bing API key
         # For now, fall back to DuckDuckGo
-        return await self._search_duckduckgo(query, max_results)
+        return await self._search_duckduckgo(query, max_results, region=region, time_range=time_range)
+    
+    async def _search_all(self, query: str, max_results: int = 10, region: str = "us-en",
+                          time_range: str = None, timeout: int = 30, **kwargs) -> List[Dict[str, Any]]:
+        """Query every distinct backend concurrently and return the first results to arrive, deduplicated by URL"""
+        # Engines served by the same backend would send it the same request
+        backends = {self._fallbacks.get(name, name) for name in self._engines if name != "all"}
+        pending = {
+            asyncio.create_task(self._engines[name](query, max_results, region=region, time_range=time_range))
+            for name in backends
+        }
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        results: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        try:
+            # Keep waiting past engines that fail or come back empty
+            while pending and not results:
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, deadline - loop.time()),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise Exception(f"All search engines timed out after {timeout} seconds")
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                    else:
+                        results.extend(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        if not results and errors:
+            raise errors[0]
+        
+        merged = {}
+        for result in results:
+            url = result.get("href", result.get("url"))
+            merged.setdefault(url if url else id(result), result)
+        return list(merged.values())[:max_results]
     
     def _format_results(self, results: List[Dict[str, Any]], query: str) -> str:
         """Format search results for output"""
         if not results:
             return f"No results found for query: {query}"
         
-        output = f"Search results for: {query}\n"
-        output += "=" * 50 + "\n\n"
-        
+        parts = [f"Search results for: {query}\n{_RULE}\n\n"]
         for i, result in enumerate(results, 1):
             title = result.get("title", "No title")
             url = result.get("href", result.get("url", "No URL"))
             snippet = result.get("body", result.get("snippet", "No description"))
-            
-            output += f"{i}. {title}\n"
-            output += f"   URL: {url}\n"
-            output += f"   Description: {snippet}\n\n"
+            parts.append(f"{i}. {title}\n   URL: {url}\n   Description: {snippet}\n\n")
         
-        return output
+        return "".join(parts)
     
     async def execute(self, query: str, engine: str = "duckduckgo",
                      max_results: int = 10, region: str = "us-en",
-                     time_range: str = None, timeout: int = 30, **kwargs) -> SmolToolResult:
+                     time_range: str = None, timeout: int = 30,
+                     cache_ttl: int = _CACHE_TTL, **kwargs) -> SmolToolResult:
         """
         Execute web search.
         
@@ -127,23 +203,30 @@ class WebSearchTool(AsyncSmolTool):
             region (str): Search region
             time_range (str): Time range filter
             timeout (int): Timeout in seconds for search operations
+            cache_ttl (int): Seconds to reuse these results for; 0 disables the cache
             
         Returns:
             SmolToolResult: Search results
         """
         try:
-            if engine.lower() == "duckduckgo":
-                results = await self._search_duckduckgo(query, max_results, region, time_range)
-            elif engine.lower() == "google":
-                results = await self._search_google(query, max_results)
-            elif engine.lower() == "bing":
-                results = await self._search_bing(query, max_results)
-            else:
+            engine_name = engine.lower()
+            engine_search = self._engines.get(engine_name)
+            if engine_search is None:
                 return SmolToolResult(
-                    error=f"Unknown search engine: {engine}. Supported: duckduckgo, google, bing",
+                    error=f"Unknown search engine: {engine}. Supported: {', '.join(self._engines)}",
                     success=False
                 )
             
+            key = _cache_key(q=query, e=engine_name, n=max_results, r=region, t=time_range)
+            results = _search_cache.get(key) if cache_ttl else None
+            if results is None:
+                search = functools.partial(
+                    engine_search, query, max_results,
+                    region=region, time_range=time_range, timeout=timeout
+                )
+                results = await _single_flight(_search_inflight, key, search)
+                _search_cache.set(key, results, cache_ttl)
+            
             formatted_output = self._format_results(results, query)
             
             return SmolToolResult(
@@ -164,39 +247,52 @@ class WebSearchTool(AsyncSmolTool):
             )
 
 
+_web_search: Optional[WebSearchTool] = None
+
+
+def _get_web_search() -> WebSearchTool:
+    """The WebSearchTool that the single-engine tools delegate to, created on first use"""
+    global _web_search
+    if _web_search is None:
+        _web_search = WebSearchTool()
+    return _web_search
+
+
 class DuckDuckGoSearchTool(AsyncSmolTool):
     """
     Dedicated DuckDuckGo search tool
     """
     
+    _INPUTS = {
+        "query": {
+            "type": "string",
+            "description": "The search query",
+            "required": True
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10,
+            "required": False
+        },
+        "region": {
+            "type": "string",
+            "description": "Region for search results (e.g., 'us-en', 'uk-en')",
+            "default": "us-en",
+            "required": False
+        },
+        "time_range": {
+            "type": "string",
+            "description": "Time range for results: d (day), w (week), m (month), y (year)",
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "duckduckgo_search"
         self.description = """Search the web using DuckDuckGo search engine. Returns search results with titles, URLs, and snippets."""
         
-        self.inputs = {
-            "query": {
-                "type": "string",
-                "description": "The search query",
-                "required": True
-            },
-            "max_results": {
-                "type": "integer",
-                "description": "Maximum number of results to return",
-                "default": 10,
-                "required": False
-            },
-            "region": {
-                "type": "string",
-                "description": "Region for search results (e.g., 'us-en', 'uk-en')",
-                "default": "us-en",
-                "required": False
-            },
-            "time_range": {
-                "type": "string",
-                "description": "Time range for results: d (day), w (week), m (month), y (year)",
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
     
@@ -204,8 +300,7 @@ class DuckDuckGoSearchTool(AsyncSmolTool):
                      region: str = "us-en", time_range: str = None, 
                      **kwargs) -> SmolToolResult:
         """Execute DuckDuckGo search"""
-        web_search = WebSearchTool()
-        return await web_search.execute(
+        return await _get_web_search().execute(
             query=query,
             engine="duckduckgo",
             max_results=max_results,
@@ -219,36 +314,37 @@ class GoogleSearchTool(AsyncSmolTool):
     Google search tool (currently falls back to DuckDuckGo)
     """
     
+    _INPUTS = {
+        "query": {
+            "type": "string",
+            "description": "The search query",
+            "required": True
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10,
+            "required": False
+        },
+        "api_key": {
+            "type": "string",
+            "description": "Google API key (optional)",
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "google_search"
         self.description = """Search the web using Google search engine. Currently falls back to DuckDuckGo."""
         
-        self.inputs = {
-            "query": {
-                "type": "string",
-                "description": "The search query",
-                "required": True
-            },
-            "max_results": {
-                "type": "integer",
-                "description": "Maximum number of results to return",
-                "default": 10,
-                "required": False
-            },
-            "api_key": {
-                "type": "string",
-                "description": "Google API key (optional)",
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
     
     async def execute(self, query: str, max_results: int = 10, 
                      api_key: str = None, **kwargs) -> SmolToolResult:
         """Execute Google search (falls back to DuckDuckGo)"""
-        web_search = WebSearchTool()
-        return await web_search.execute(
+        return await _get_web_search().execute(
             query=query,
             engine="google",
             max_results=max_results
@@ -260,36 +356,37 @@ class BingSearchTool(AsyncSmolTool):
     Bing search tool (currently falls back to DuckDuckGo)
     """
     
+    _INPUTS = {
+        "query": {
+            "type": "string",
+            "description": "The search query",
+            "required": True
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10,
+            "required": False
+        },
+        "api_key": {
+            "type": "string",
+            "description": "Bing API key (optional)",
+            "required": False
+        }
+    }
+    
     def __init__(self):
         self.name = "bing_search"
         self.description = """Search the web using Bing search engine. Currently falls back to DuckDuckGo."""
         
-        self.inputs = {
-            "query": {
-                "type": "string",
-                "description": "The search query",
-                "required": True
-            },
-            "max_results": {
-                "type": "integer",
-                "description": "Maximum number of results to return",
-                "default": 10,
-                "required": False
-            },
-            "api_key": {
-                "type": "string",
-                "description": "Bing API key (optional)",
-                "required": False
-            }
-        }
+        self.inputs = self._INPUTS
         self.output_type = "string"
         super().__init__()
     
     async def execute(self, query: str, max_results: int = 10, 
                      api_key: str = None, **kwargs) -> SmolToolResult:
         """Execute Bing search (falls back to DuckDuckGo)"""
-        web_search = WebSearchTool()
-        return await web_search.execute(
+        return await _get_web_search().execute(
             query=query,
             engine="bing",
             max_results=max_results
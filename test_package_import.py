@@ -4,6 +4,9 @@ Simple test to verify the package can be imported and basic structure works
 without requiring full dependencies.
 """
 
+import ast
+
+
 def test_package_structure():
     """Test basic package structure without dependencies"""
     print("Testing smolagents-tools package structure...")
@@ -68,31 +71,46 @@ def test_package_structure():
         return False
 
 
+# Below this many example files, parsing them in-process is quicker than starting workers
+PARALLEL_SYNTAX_CHECK_MIN_FILES = 32
+
+
+def _check_syntax(filepath):
+    """Parse one file; returns None when the syntax is valid, else the exception"""
+    try:
+        # Bytes let ast.parse honour the file's own encoding declaration
+        with open(filepath, 'rb') as f:
+            ast.parse(f.read())
+        return None
+    except Exception as e:
+        return e
+
+
 def test_examples_syntax():
     """Test that example files have valid Python syntax"""
     print("\nTesting example files syntax...")
     
-    import ast
     import os
+    from concurrent.futures import ProcessPoolExecutor
     
     examples_dir = os.path.join(os.path.dirname(__file__), 'examples')
     python_files = [f for f in os.listdir(examples_dir) if f.endswith('.py')]
+    filepaths = [os.path.join(examples_dir, filename) for filename in python_files]
+    
+    if len(filepaths) >= PARALLEL_SYNTAX_CHECK_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            errors = list(executor.map(_check_syntax, filepaths, chunksize=8))
+    else:
+        errors = [_check_syntax(filepath) for filepath in filepaths]
     
-    for filename in python_files:
-        filepath = os.path.join(examples_dir, filename)
-        try:
-            with open(filepath, 'r') as f:
-                content = f.read()
-            
-            # Parse the file to check syntax
-            ast.parse(content)
+    for filename, error in zip(python_files, errors):
+        if error is None:
             print(f"✓ {filename} - syntax OK")
-            
-        except SyntaxError as e:
-            print(f"❌ {filename} - syntax error: {e}")
+        elif isinstance(error, SyntaxError):
+            print(f"❌ {filename} - syntax error: {error}")
             return False
-        except Exception as e:
-            print(f"⚠️  {filename} - could not read: {e}")
+        else:
+            print(f"⚠️  {filename} - could not read: {error}")
     
     print("✅ All example files have valid syntax!")
     return True
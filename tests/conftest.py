@@ -0,0 +1,72 @@
+import copy
+
+import pytest
+from smolagents_tools import (
+    create_tool,
+    create_basic_toolset,
+    create_web_toolset,
+    create_development_toolset,
+    create_ai_toolset,
+)
+
+
+def _isolated(cached):
+    """A per-test deep copy of a cached toolset, so tests cannot change each other's tools"""
+    return copy.deepcopy(cached)
+
+
+# Tools and toolsets are built once per test session; toolset tests get their own copies
+
+@pytest.fixture(scope="session")
+def bash_tool():
+    return create_tool("bash")
+
+
+@pytest.fixture(scope="session")
+def python_executor_tool():
+    return create_tool("python_executor")
+
+
+@pytest.fixture(scope="session")
+def file_editor_tool():
+    return create_tool("file_editor")
+
+
+@pytest.fixture(scope="session")
+def _basic_toolset_cached():
+    return create_basic_toolset()
+
+
+@pytest.fixture
+def basic_toolset(_basic_toolset_cached):
+    return _isolated(_basic_toolset_cached)
+
+
+@pytest.fixture(scope="session")
+def _web_toolset_cached():
+    return create_web_toolset()
+
+
+@pytest.fixture
+def web_toolset(_web_toolset_cached):
+    return _isolated(_web_toolset_cached)
+
+
+@pytest.fixture(scope="session")
+def _development_toolset_cached():
+    return create_development_toolset()
+
+
+@pytest.fixture
+def development_toolset(_development_toolset_cached):
+    return _isolated(_development_toolset_cached)
+
+
+@pytest.fixture(scope="session")
+def _ai_toolset_cached():
+    return create_ai_toolset()
+
+
+@pytest.fixture
+def ai_toolset(_ai_toolset_cached):
+    return _isolated(_ai_toolset_cached)
@@ -0,0 +1,121 @@
+"""
+Test cases for Browser Tool, run against mocked Playwright pages
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+browser = pytest.importorskip("smolagents_tools.utils.browser", reason="Browser tools not available")
+BrowserTool = browser.BrowserTool
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _mock_page():
+    """A page whose navigations return no response"""
+    page = AsyncMock()
+    page.goto.return_value = None
+    page.title.return_value = "Example"
+    return page
+
+
+@pytest.fixture
+def tool_and_pages():
+    """A tool whose page pool is already filled with mocked pages, so no browser starts"""
+    tool = BrowserTool(pool_size=2)
+    pages = [_mock_page(), _mock_page()]
+    tool._pool = asyncio.LifoQueue()
+    for page in pages:
+        tool._pool.put_nowait(page)
+    return tool, pages
+
+
+async def test_browser_dispatch_table(tool_and_pages):
+    """Test that every page action has a handler and unknown actions are rejected"""
+    tool, _ = tool_and_pages
+    assert set(tool._actions) == {"navigate", "screenshot", "click", "fill", "extract_text", "scroll", "wait"}
+
+    result = await tool.execute(action="unknown_action")
+    assert not result.success
+    assert "Unknown action" in result.error
+
+
+async def test_browser_checkout_returns_pages(tool_and_pages):
+    """Test that a checked-out page goes back to the pool, even when the action fails"""
+    tool, pages = tool_and_pages
+    async with tool._checkout_page() as page:
+        assert page in pages
+        assert tool._pool.qsize() == 1
+    assert tool._pool.qsize() == 2
+
+    with pytest.raises(RuntimeError):
+        async with tool._checkout_page():
+            raise RuntimeError("action failed")
+    assert tool._pool.qsize() == 2
+
+
+async def test_browser_batch_stops_at_first_failure(tool_and_pages):
+    """Test that a batch reports the failing step and skips the rest"""
+    tool, pages = tool_and_pages
+    for page in pages:
+        page.click.side_effect = Exception("no such element")
+
+    result = await tool.execute(action="batch", actions=[
+        {"action": "navigate", "url": "https://example.com"},
+        {"action": "click", "selector": "#missing"},
+        {"action": "fill", "selector": "#q", "text": "never typed"},
+    ])
+    assert not result.success
+    assert result.error.startswith("Step 2 (click) failed")
+    assert result.output.splitlines()[0].startswith("[1] navigate: Successfully navigated")
+    for page in pages:
+        page.fill.assert_not_called()
+
+
+async def test_browser_lightweight_is_per_call(tool_and_pages):
+    """Test that lightweight mode is routed on the call's page and removed afterwards"""
+    tool, _ = tool_and_pages
+    await tool.execute(action="wait", wait_time=0, lightweight=True)
+    page = await tool._pool.get()
+    page.route.assert_awaited_once()
+    tool._pool.put_nowait(page)
+
+    await tool.execute(action="wait", wait_time=0)
+    page.unroute.assert_awaited_once()
+
+
+async def test_browser_records_json_skill_without_credentials(tool_and_pages):
+    """Test that a JSON navigation is recorded for replay without its credential headers"""
+    tool, pages = tool_and_pages
+    url = "https://example.com/api/items"
+    response = Mock(ok=True, url=url)
+    response.header_value = AsyncMock(return_value="application/json")
+    response.request.all_headers = AsyncMock(return_value={
+        ":method": "GET",
+        "accept": "application/json",
+        "cookie": "session=secret",
+        "Authorization": "Bearer secret",
+    })
+    for page in pages:
+        page.goto.return_value = response
+
+    result = await tool.execute(action="navigate", url=url + "#section")
+    assert result.success
+    # Keyed without the fragment, and without the credentials
+    assert browser._skill_key(url + "#section") == url
+    assert tool._skills[url]["headers"] == {"accept": "application/json"}
+
+
+async def test_browser_replay_falls_back_to_browser(tool_and_pages):
+    """Test that an unreachable recorded request is forgotten and the page is loaded"""
+    tool, pages = tool_and_pages
+    url = "http://127.0.0.1:9/api"
+    tool._skills[url] = {"url": url, "headers": {}}
+
+    result = await tool.execute(action="navigate", url=url)
+    assert result.success
+    assert "Page title: Example" in result.output
+    assert url not in tool._skills
+    assert sum(page.goto.await_count for page in pages) == 1
@@ -0,0 +1,79 @@
+"""
+Test cases for the osascript session behind the macOS tools, run against a fake ``osascript -i``
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+macos = pytest.importorskip("smolagents_tools.utils.macos", reason="macOS tools not available")
+OsascriptSession = macos.OsascriptSession
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def _fake_osascript(replies):
+    """A create_subprocess_exec stand-in whose process prints the given interactive-mode output"""
+    spawned = []
+
+    async def create_subprocess_exec(*args, **kwargs):
+        # Yield first, as a real spawn does, so concurrent callers can interleave
+        await asyncio.sleep(0)
+        stdout = asyncio.StreamReader()
+        stdout.feed_data(replies.encode())
+        stdout.feed_eof()
+        process = Mock(returncode=None, stdout=stdout)
+        process.stdin.drain = Mock(side_effect=lambda: asyncio.sleep(0))
+        spawned.append(process)
+        return process
+
+    return create_subprocess_exec, spawned
+
+
+async def test_osascript_session_parses_prompted_replies():
+    """Test that prompts are stripped and each reply becomes (returncode, stdout, stderr)"""
+    replies = (
+        "?> 0\n"
+        "first line\n"
+        "second line\n"
+        "?> __END__\n"
+        "?> -1728\n"
+        "Can't get window 1.\n"
+        "?> __END__\n"
+    )
+    fake_exec, spawned = _fake_osascript(replies)
+    session = OsascriptSession()
+    with patch.object(macos.asyncio, "create_subprocess_exec", fake_exec):
+        results = await session.run_batch(['return "ok"', "get window 1"])
+
+    assert results == [
+        (0, "first line\nsecond line", ""),
+        (1, "", "Can't get window 1. (-1728)"),
+    ]
+    # Both scripts went out in a single write, each quoted as one literal
+    written = spawned[0].stdin.write.call_args.args[0].decode()
+    assert written.count(f'"{macos._OSA_SENTINEL}"') == 2
+    assert '"get window 1"' in written
+
+
+async def test_osascript_session_concurrent_first_calls_share_process():
+    """Test that concurrent first calls spawn a single osascript process"""
+    fake_exec, spawned = _fake_osascript("?> 0\na\n?> __END__\n?> 0\nb\n?> __END__\n")
+    session = OsascriptSession()
+    with patch.object(macos.asyncio, "create_subprocess_exec", fake_exec):
+        first, second = await asyncio.gather(session.run("a"), session.run("b"))
+
+    assert len(spawned) == 1
+    assert (first, second) == ((0, "a", ""), (0, "b", ""))
+
+
+async def test_osascript_session_exit_is_reported():
+    """Test that a process exiting mid-reply raises and is not reused"""
+    fake_exec, spawned = _fake_osascript("?> 0\n")
+    session = OsascriptSession()
+    with patch.object(macos.asyncio, "create_subprocess_exec", fake_exec):
+        with pytest.raises(Exception, match="exited unexpectedly"):
+            await session.run("beep")
+    assert session._process is None
+    spawned[0].terminate.assert_called_once()
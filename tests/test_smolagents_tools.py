@@ -4,12 +4,9 @@ from smolagents_tools import (
     create_tool, 
     list_tools, 
     get_tool_info,
-    create_basic_toolset,
-    create_web_toolset,
-    create_development_toolset,
-    create_ai_toolset,
     AVAILABLE_TOOLS,
-    TOOL_CATEGORIES
+    TOOL_CATEGORIES,
+    SmolTool,
 )
 
 
@@ -60,55 +57,45 @@ def test_get_tool_info():
     """Test getting tool information"""
     bash_info = get_tool_info("bash")
     assert bash_info is not None
-    assert "name" in bash_info
-    assert "description" in bash_info
-    assert "inputs" in bash_info
+    assert bash_info.name is not None
+    assert bash_info.description is not None
+    assert bash_info.inputs is not None
     
     # Test non-existent tool
     non_existent_info = get_tool_info("non_existent_tool")
     assert non_existent_info is None
 
 
-def test_create_basic_toolset():
-    """Test creating basic toolset"""
-    tools = create_basic_toolset()
-    assert len(tools) > 0
-    
-    # Check that all tools have the required interface
-    for tool in tools:
-        assert hasattr(tool, 'forward')
-        assert hasattr(tool, 'name')
-        assert hasattr(tool, 'description')
-
-
-def test_create_web_toolset():
-    """Test creating web toolset"""
-    tools = create_web_toolset()
-    assert len(tools) > 0
-    
-    # Check that all tools have the required interface
-    for tool in tools:
-        assert hasattr(tool, 'forward')
+def test_get_tool_info_is_read_only_and_dict_compatible():
+    """Test that the shared ToolInfo cannot be changed and still answers dict-style lookups"""
+    tool_name = next(iter(AVAILABLE_TOOLS))
+    info = get_tool_info(tool_name)
+    assert info["name"] == info.name
+    assert info["class"] == info.class_name == get_tool(tool_name).__name__
+    assert info.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        info["__class__"]
 
-
-def test_create_development_toolset():
-    """Test creating development toolset"""
-    tools = create_development_toolset()
-    assert len(tools) > 0
-    
-    # Check that all tools have the required interface
-    for tool in tools:
-        assert hasattr(tool, 'forward')
+    input_name = next(iter(info.inputs))
+    with pytest.raises(TypeError):
+        info.inputs[input_name]["required"] = False
+    with pytest.raises(TypeError):
+        info.inputs["extra"] = {}
 
 
-def test_create_ai_toolset():
-    """Test creating AI toolset"""
-    tools = create_ai_toolset()
+@pytest.mark.parametrize(
+    "toolset",
+    ["basic_toolset", "web_toolset", "development_toolset", "ai_toolset"],
+    ids=["basic", "web", "development", "ai"],
+)
+def test_create_toolset(toolset, request):
+    """Test creating each of the predefined toolsets"""
+    tools = request.getfixturevalue(toolset)
     assert len(tools) > 0
     
-    # Check that all tools have the required interface
+    # SmolTool guarantees the interface: forward, name and description
     for tool in tools:
-        assert hasattr(tool, 'forward')
+        assert isinstance(tool, SmolTool), type(tool).__name__
 
 
 def test_tool_categories():
@@ -118,14 +105,15 @@ def test_tool_categories():
     assert "web" in TOOL_CATEGORIES
     
     # Check that category tools exist in main registry
-    for category, tools in TOOL_CATEGORIES.items():
-        for tool_name in tools:
-            assert tool_name in AVAILABLE_TOOLS
+    available = frozenset(AVAILABLE_TOOLS)
+    missing = {
+        tool_name for tools in TOOL_CATEGORIES.values() for tool_name in tools
+    } - available
+    assert not missing
 
 
-def test_bash_tool_basic():
+def test_bash_tool_basic(bash_tool):
     """Test basic bash tool functionality"""
-    bash_tool = create_tool("bash")
     assert bash_tool is not None
     
     # Test simple command
@@ -133,25 +121,282 @@ def test_bash_tool_basic():
     assert result is not None
 
 
-def test_python_executor_basic():
+def test_python_executor_basic(python_executor_tool):
     """Test basic python executor functionality"""
-    python_tool = create_tool("python_executor")
-    assert python_tool is not None
+    assert python_executor_tool is not None
     
     # Test simple Python code
-    result = python_tool.forward(code="print('Hello, World!')")
+    result = python_executor_tool.forward(code="print('Hello, World!')")
     assert result is not None
 
 
-def test_file_editor_basic():
+def test_file_editor_basic(file_editor_tool):
     """Test basic file editor functionality"""
-    file_tool = create_tool("file_editor")
-    assert file_tool is not None
+    assert file_editor_tool is not None
     
     # Test viewing a file (should handle non-existent files gracefully)
-    result = file_tool.forward(command="view", path="/tmp/test_file_that_does_not_exist.txt")
+    result = file_editor_tool.forward(command="view", path="/tmp/test_file_that_does_not_exist.txt")
     assert result is not None
 
 
+def test_file_editor_view_range(tmp_path):
+    """Test that view ranges stay correct when the file changes between views"""
+    from smolagents_tools import FileEditorTool
+
+    file_tool = FileEditorTool()
+    path = tmp_path / "lines.txt"
+    path.write_text("one\ntwo\nthree\n")
+
+    result = file_tool.forward(command="view", path=str(path), view_range="[2, 3]")
+    assert result.endswith("     1|two\n     2|three\n")
+
+    path.write_text("alpha\nbeta\ngamma\ndelta\n")
+    result = file_tool.forward(command="view", path=str(path), view_range="[3, 9]")
+    assert "(lines 3-4)" in result
+    assert result.endswith("     1|gamma\n     2|delta\n")
+
+    # A same-length edit that moves a line break keeps the file size
+    file_tool.forward(command="str_replace", path=str(path), old_str="alpha\nbeta", new_str="alphab\neta")
+    result = file_tool.forward(command="view", path=str(path), view_range="[2, 2]")
+    assert result.endswith("     1|eta\n")
+
+
+def test_file_editor_undo_round_trip(tmp_path):
+    """Test that undo_edit reverses same-length, growing and shrinking edits in order"""
+    from smolagents_tools import FileEditorTool
+
+    file_tool = FileEditorTool()
+    path = tmp_path / "undo.txt"
+    original = "alpha\nbeta\ngamma\n"
+    path.write_text(original)
+
+    edits = [
+        ("beta", "BETA"),                 # same length, patched in place
+        ("alpha\n", "alpha\ninserted\n"),  # insertion
+        ("gamma\n", ""),                  # deletion
+    ]
+    for old_str, new_str in edits:
+        assert "replaced successfully" in file_tool.forward(
+            command="str_replace", path=str(path), old_str=old_str, new_str=new_str
+        )
+    assert path.read_text() == "alpha\ninserted\nBETA\n"
+
+    for _ in edits:
+        assert "Undid last edit" in file_tool.forward(command="undo_edit", path=str(path))
+    assert path.read_text() == original
+    assert "No previous state" in file_tool.forward(command="undo_edit", path=str(path))
+
+    # Undo refuses to apply once the edited bytes have been changed elsewhere
+    file_tool.forward(command="str_replace", path=str(path), old_str="beta", new_str="BETA")
+    path.write_text(original)
+    assert "cannot undo" in file_tool.forward(command="undo_edit", path=str(path))
+
+
+def test_file_editor_edits_through_symlink(tmp_path):
+    """Test that an edit keeps a symlink and leaves unrelated .tmp files alone"""
+    from smolagents_tools import FileEditorTool
+
+    file_tool = FileEditorTool()
+    target = tmp_path / "real.txt"
+    target.write_text("hello world\n")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+    (tmp_path / "link.txt.tmp").write_text("user data")
+
+    result = file_tool.forward(command="str_replace", path=str(link), old_str="world", new_str="there, everyone")
+    assert "replaced successfully" in result
+    assert link.is_symlink()
+    assert target.read_text() == "hello there, everyone\n"
+    assert (tmp_path / "link.txt.tmp").read_text() == "user data"
+
+
+def test_file_editor_replaces_across_crlf_lines(tmp_path):
+    """Test that a multi-line old_str matches a CRLF file and keeps its line endings"""
+    from smolagents_tools import FileEditorTool
+
+    file_tool = FileEditorTool()
+    path = tmp_path / "crlf.txt"
+    path.write_bytes(b"one\r\ntwo\r\nthree\r\n")
+
+    result = file_tool.forward(command="str_replace", path=str(path), old_str="one\ntwo", new_str="1\n2\n2.5")
+    assert "replaced successfully" in result
+    assert path.read_bytes() == b"1\r\n2\r\n2.5\r\nthree\r\n"
+
+    # Views show the lines without their carriage returns, as a text-mode read would
+    result = file_tool.forward(command="view", path=str(path), view_range="[3, 4]")
+    assert result.endswith("     1|2.5\n     2|three\n")
+    assert "\r" not in file_tool.forward(command="view", path=str(path))
+
+
+def test_safe_python_executor_checks_syntax_tree():
+    """Test that restrictions apply to code, not to matching text in strings"""
+    from smolagents_tools import SafePythonExecutorTool
+
+    safe_tool = SafePythonExecutorTool()
+    assert "open sesame" in safe_tool.forward(code="print('open sesame')")
+    assert "Restricted function 'eval'" in safe_tool.forward(code="eval('1')")
+    assert "Restricted module 'os'" in safe_tool.forward(code="from os.path import join")
+    assert "__import__ not found" in safe_tool.forward(code="import json")
+
+
+def test_python_executor_isolates_calls():
+    """Test that a timed-out snippet and changed module state do not affect other calls"""
+    import asyncio
+    from smolagents_tools import PythonExecutorTool
+
+    executor = PythonExecutorTool()
+
+    async def run_together():
+        return await asyncio.gather(
+            executor.execute(code="import time; time.sleep(5)", timeout=1),
+            executor.execute(code="import time; time.sleep(1.5); print('done')", timeout=10),
+        )
+
+    timed_out, finished = asyncio.run(run_together())
+    assert not timed_out.success and "timed out" in timed_out.error
+    assert finished.success and finished.output == "done\n"
+
+    assert executor.forward(code="import math; math.pi = 3") is not None
+    assert executor.forward(code="import math; print(math.pi)").startswith("3.14")
+
+
+def _plan_with_tasks(*specs):
+    """A planning tool and a plan holding only the given (name, dependency names) tasks, plus their ids"""
+    import asyncio
+    from smolagents_tools import PlanningTool
+
+    planner = PlanningTool()
+    run = lambda **kwargs: asyncio.run(planner.execute(**kwargs))
+    created = run(action="create_plan", task_description="write a report")
+    plan_id = created.artifacts["plan_id"]
+    # Template tasks are completed, so they only count as satisfied dependencies
+    for task in created.artifacts["plan"]["tasks"]:
+        run(action="complete_task", plan_id=plan_id, task_id=task["id"])
+
+    # Task ids are sequential, so a task can name one that is added after it
+    template_ids = [task["id"] for task in created.artifacts["plan"]["tasks"]]
+    next_id = int(template_ids[-1].split("_")[1]) + 1
+    ids = {"done": template_ids[0]}
+    ids.update((name, f"task_{next_id + i}") for i, (name, _) in enumerate(specs))
+    for name, deps in specs:
+        added = run(action="add_task", plan_id=plan_id, subtask_title=name, subtask_description=name,
+                    dependencies=",".join(ids[dep] for dep in deps))
+        assert added.artifacts["task_id"] == ids[name]
+    ready = run(action="get_ready_tasks", plan_id=plan_id)
+    names = {task_id: name for name, task_id in ids.items()}
+    return {key: [names[task_id] for task_id in ready.artifacts[key]] for key in ("ready", "order", "blocked")}
+
+
+def test_planning_ready_tasks_follow_dependencies():
+    """Test that tasks run after their dependencies, most-depended-on first, ties in plan order"""
+    scheduled = _plan_with_tasks(
+        ("a", []), ("b", []), ("c", ["b"]), ("d", ["b"]), ("e", ["a"]), ("f", ["done"]),
+    )
+    # b unblocks two tasks and a one; c, d, e and f unblock none and keep plan order
+    assert scheduled["ready"] == ["b", "a", "f"]
+    assert scheduled["order"] == ["b", "a", "c", "d", "e", "f"]
+    assert scheduled["blocked"] == []
+
+
+def test_planning_ready_tasks_report_cycles():
+    """Test that tasks in or behind a dependency cycle are blocked, not scheduled"""
+    scheduled = _plan_with_tasks(("free", []), ("first", ["second"]), ("second", ["first"]), ("after", ["first"]))
+    assert scheduled["ready"] == ["free"]
+    assert scheduled["order"] == ["free"]
+    assert scheduled["blocked"] == ["first", "second", "after"]
+
+
+def test_web_search_all_queries_each_backend_once():
+    """Test that engine="all" sends one request per distinct backend, with every filter"""
+    import asyncio
+    from smolagents_tools import WebSearchTool
+
+    search_tool = WebSearchTool()
+    calls = []
+
+    async def fake_backend(query, max_results=10, region="us-en", time_range=None, **kwargs):
+        calls.append((region, time_range))
+        return [{"href": "https://example.com", "title": "Example", "body": ""}]
+
+    search_tool._engines["duckduckgo"] = fake_backend
+    results = asyncio.run(search_tool._search_all("query", 5, region="uk-en", time_range="w"))
+    assert len(results) == 1
+    assert calls == [("uk-en", "w")]
+
+
+def test_single_flight_survives_cancelled_leader():
+    """Test that waiters of a cancelled fetch are not cancelled and one of them fetches instead"""
+    import asyncio
+    from smolagents_tools.utils._cache import _single_flight
+
+    inflight = {}
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def scenario():
+        leader = asyncio.create_task(_single_flight(inflight, "key", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(_single_flight(inflight, "key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        return leader.cancelled(), results
+
+    leader_cancelled, results = asyncio.run(scenario())
+    assert leader_cancelled
+    # The leader's fetch and a single replacement, shared by all three waiters
+    assert results == [2, 2, 2]
+    assert len(calls) == 2
+    assert not inflight
+
+
+def test_bash_tool_reuses_session():
+    """Test that the bash_tool wrapper keeps one shell alive across calls"""
+    from smolagents_tools import bash_tool
+
+    bash_tool(command="export SMOLAGENTS_TOOLS_TEST=kept")
+    assert bash_tool(command="echo $SMOLAGENTS_TOOLS_TEST") == "kept"
+
+
+def test_bash_tool_recovers_from_timeout_and_exit():
+    """Test that a timed-out or exited shell is reported and replaced on the next call"""
+    from smolagents_tools import bash_tool
+
+    assert bash_tool(command="sleep 3", timeout=1) == "Error: Command timed out after 1.0 seconds"
+    assert bash_tool(command="echo hi") == "hi"
+
+    result = bash_tool(command="echo out; exit 3")
+    assert result == "Error: bash has exited with returncode 3\nSTDOUT: out"
+    assert bash_tool(command="echo hi") == "hi"
+
+
+def test_bash_tool_stream():
+    """Test that bash_tool_stream yields output before the command completes"""
+    from smolagents_tools import bash_tool_stream
+
+    chunks = list(bash_tool_stream(command="echo first; sleep 0.2; echo second"))
+    assert len(chunks) >= 2
+    assert "".join(chunks) == "first\nsecond\n"
+
+
+def test_run_sync_inside_event_loop():
+    """Test that sync wrappers can drive coroutines from inside a running loop"""
+    import asyncio
+    from smolagents_tools.utils._runtime import _run_sync
+
+    async def answer():
+        return 42
+
+    async def caller():
+        return _run_sync(answer())
+
+    assert _run_sync(answer()) == 42
+    assert asyncio.run(caller()) == 42
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
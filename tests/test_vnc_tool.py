@@ -4,122 +4,167 @@ Test cases for VNC Computer Use Tool
 
 import pytest
 import asyncio
+import socket
+import struct
 from unittest.mock import Mock, patch, AsyncMock
 
-try:
-    from smolagents_tools.vnc import VNCComputerUseTool, SimpleVNCComputerUseTool
-    VNC_AVAILABLE = True
-except ImportError:
-    VNC_AVAILABLE = False
+vnc = pytest.importorskip("smolagents_tools.utils.vnc", reason="VNC tools not available")
+VNCComputerUseTool, SimpleVNCComputerUseTool = vnc.VNCComputerUseTool, vnc.SimpleVNCComputerUseTool
 
+# All tests in this module run on one event loop instead of a new loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
-async def test_vnc_tool_initialization():
+
+# Built once per session; no test connects, so the shared tools stay disconnected
+
+@pytest.fixture(scope="session")
+def vnc_tool():
+    """A VNC tool with no connection"""
+    return VNCComputerUseTool()
+
+
+@pytest.fixture(scope="session")
+def simple_vnc_tool():
+    """A simple VNC tool with no connection"""
+    return SimpleVNCComputerUseTool()
+
+
+async def test_vnc_tool_initialization(vnc_tool):
     """Test VNC tool initialization"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    assert tool.name == "vnc_computer"
-    assert tool.description is not None
-    assert tool.inputs is not None
-    assert tool.output_type == "string"
-
-
-@pytest.mark.asyncio
-async def test_simple_vnc_tool_initialization():
-    """Test Simple VNC tool initialization"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = SimpleVNCComputerUseTool()
-    assert tool.name == "simple_vnc_computer"
-    assert tool.description is not None
-    assert tool.inputs is not None
-    assert tool.output_type == "string"
-
-
-@pytest.mark.asyncio
-async def test_vnc_tool_connect_action():
-    """Test VNC tool connect action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    
-    # Test missing host
-    result = await tool.execute(action="connect")
-    assert not result.success
-    assert "host is required" in result.error
+    assert (vnc_tool.name, vnc_tool.output_type) == ("vnc_computer", "string")
+    assert vnc_tool.description and vnc_tool.inputs
 
 
-@pytest.mark.asyncio
-async def test_vnc_tool_mouse_move_action():
-    """Test VNC tool mouse move action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    
-    # Test without connection
-    result = await tool.execute(action="mouse_move", x=100, y=100)
-    assert not result.success
-    assert "Not connected" in result.error
+async def test_simple_vnc_tool_initialization(simple_vnc_tool):
+    """Test Simple VNC tool initialization"""
+    assert (simple_vnc_tool.name, simple_vnc_tool.output_type) == ("simple_vnc_computer", "string")
+    assert simple_vnc_tool.description and simple_vnc_tool.inputs
 
 
-@pytest.mark.asyncio
-async def test_vnc_tool_key_press_action():
-    """Test VNC tool key press action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    
-    # Test without connection
-    result = await tool.execute(action="key_press", key="a")
+async def test_vnc_tool_connect_action(vnc_tool):
+    """Test VNC tool connect action"""
+    # Test missing host
+    result = await vnc_tool.execute(action="connect")
     assert not result.success
-    assert "Not connected" in result.error
+    assert "host is required" in result.error
 
 
-@pytest.mark.asyncio
-async def test_vnc_tool_type_text_action():
-    """Test VNC tool type text action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    
-    # Test without connection
-    result = await tool.execute(action="type_text", text="hello")
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"action": "mouse_move", "x": 100, "y": 100},
+        {"action": "key_press", "key": "a"},
+        {"action": "type_text", "text": "hello"},
+    ],
+    ids=["mouse_move", "key_press", "type_text"],
+)
+async def test_vnc_tool_action_not_connected(vnc_tool, kwargs):
+    """Test VNC tool input actions without a connection"""
+    result = await vnc_tool.execute(**kwargs)
     assert not result.success
     assert "Not connected" in result.error
 
 
-@pytest.mark.asyncio
-async def test_vnc_tool_unknown_action():
+async def test_vnc_tool_unknown_action(vnc_tool):
     """Test VNC tool unknown action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = VNCComputerUseTool()
-    
-    result = await tool.execute(action="unknown_action")
+    result = await vnc_tool.execute(action="unknown_action")
     assert not result.success
     assert "Unknown action" in result.error
 
 
-@pytest.mark.asyncio
-async def test_simple_vnc_tool_unknown_action():
+async def test_simple_vnc_tool_unknown_action(simple_vnc_tool):
     """Test Simple VNC tool unknown action"""
-    if not VNC_AVAILABLE:
-        pytest.skip("VNC tools not available")
-    
-    tool = SimpleVNCComputerUseTool()
-    
-    result = await tool.execute(action="unknown_action")
+    result = await simple_vnc_tool.execute(action="unknown_action")
     assert not result.success
     assert "Unknown action" in result.error
 
 
+async def _fake_rfb_server(reader, writer, security_types=b"\x01"):
+    """Serve an RFB 3.8 handshake up to ServerInit, returning the security type the client chose"""
+    writer.write(b"RFB 003.008\n")
+    assert await reader.readexactly(12) == b"RFB 003.008\n"
+    writer.write(bytes([len(security_types)]) + security_types)
+    chosen = await reader.readexactly(1)
+    writer.write(struct.pack(">I", 0))  # SecurityResult: OK
+    assert await reader.readexactly(1) == b"\x01"  # ClientInit: shared
+    name = b"fake"
+    writer.write(struct.pack(">HH16xI", 640, 480, len(name)) + name)
+    await writer.drain()
+    return chosen
+
+
+async def _socketpair_streams():
+    """A connected socket pair: the client end as a raw socket, the server end as streams"""
+    client_sock, server_sock = socket.socketpair()
+    server = await asyncio.open_connection(sock=server_sock)
+    return client_sock, server
+
+
+async def test_rfb_client_handshake_and_events():
+    """Test the native client's handshake and the events it writes, against a fake server"""
+    client_sock, (server_reader, server_writer) = await _socketpair_streams()
+    open_connection = asyncio.open_connection
+    client = vnc.RFBClient("fake-host", 5900)
+    with patch.object(vnc.asyncio, "open_connection", lambda host, port: open_connection(sock=client_sock)):
+        _, chosen = await asyncio.gather(client.connect(), _fake_rfb_server(server_reader, server_writer))
+    assert chosen == b"\x01"
+    assert not client.closed
+
+    client.move(10, 20)
+    client.click()
+    client.key_press("a")
+    await client.flush()
+    events = await server_reader.readexactly(3 * 6 + 2 * 8)
+    assert events[:18] == (
+        struct.pack(">BBHH", 5, 0, 10, 20) + struct.pack(">BBHH", 5, 1, 10, 20) + struct.pack(">BBHH", 5, 0, 10, 20)
+    )
+    assert events[18:] == struct.pack(">BBxxI", 4, 1, ord("a")) + struct.pack(">BBxxI", 4, 0, ord("a"))
+
+    client.close()
+    server_writer.close()
+
+
+async def test_rfb_client_rejects_unsupported_security():
+    """Test that a server requiring a password the client lacks is reported as unsupported"""
+    client_sock, (server_reader, server_writer) = await _socketpair_streams()
+    open_connection = asyncio.open_connection
+    client = vnc.RFBClient("fake-host", 5900)
+
+    async def server():
+        server_writer.write(b"RFB 003.008\n\x01\x02")  # only VNC authentication offered
+        await server_reader.readexactly(12)
+
+    with patch.object(vnc.asyncio, "open_connection", lambda host, port: open_connection(sock=client_sock)):
+        with pytest.raises(vnc.RFBUnsupported):
+            await asyncio.gather(client.connect(), server())
+    assert client.closed
+    server_writer.close()
+
+
+async def test_vnc_send_input_reports_out_of_range_coordinates(vnc_tool):
+    """Test that arguments the RFB message cannot encode fail the action instead of raising"""
+    client = vnc.RFBClient("fake-host", 5900)
+    client._writer = Mock()
+    state = {"connection_string": "fake-host::5900", "password": None}
+    with patch.object(vnc_tool, "_get_state", AsyncMock(return_value=state)), \
+            patch.object(vnc, "_get_rfb_client", AsyncMock(return_value=client)):
+        result = await vnc_tool._send_input(lambda rfb: rfb.move(-1, 0), ["move", "-1", "0"])
+    assert not result.success
+    assert "VNC command failed" in result.error
+
+
+async def test_vnc_state_concurrent_saves(tmp_path):
+    """Test that concurrent state saves each write whole files and leave no temp files behind"""
+    state_file = tmp_path / "vnc_state.json"
+    states = [
+        {"connected_host": f"host{i}", "connection_string": f"host{i}::5900", "password": "x" * 4096 * i}
+        for i in range(20)
+    ]
+    with patch.object(vnc, "VNC_STATE_FILE", str(state_file)):
+        await asyncio.gather(*(vnc._save_vnc_state_async(state) for state in states))
+        assert vnc._load_vnc_state() in states
+    assert [path.name for path in tmp_path.iterdir()] == ["vnc_state.json"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file